@@ -0,0 +1,4 @@
+"""Benchmarks for the headless VectorBox code paths.
+
+Run ``python -m benchmarks.run --help`` from the repository root.
+"""
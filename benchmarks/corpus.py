@@ -0,0 +1,113 @@
+"""Generator of synthetic .bxx clip libraries for the benchmarks.
+
+Example::
+
+    python -m benchmarks.corpus /tmp/library --count 20000 --streams 1-3 --metadata-bytes 4096
+"""
+import argparse
+import os
+import random
+
+VIDEO_STANDARDS = ("1080i50", "720p50", "PAL", "1080p25", "2160p50")
+
+
+def clip_document(rng, streams=(1, 1), trim_ratio=0.5, metadata_bytes=0):
+    """Returns the text of one synthetic .bxx document.
+
+    Each of the randint(*streams) VideoStream elements carries a Duration,
+    and with probability trim_ratio also FileTrimIn / FileTrimOut points.
+    A Meta block of about metadata_bytes of filler fields stands in for the
+    large embedded metadata real files carry.
+    """
+    parts = ['<?xml version="1.0" encoding="utf-8"?>\n<Clip>\n']
+    if metadata_bytes:
+        parts.append("  <Meta>\n")
+        written = 0
+        field = 0
+        while written < metadata_bytes:
+            line = f'    <Field name="f{field}">{"x" * rng.randint(16, 96)}</Field>\n'
+            parts.append(line)
+            written += len(line)
+            field += 1
+        parts.append("  </Meta>\n")
+    for _ in range(rng.randint(*streams)):
+        duration = rng.randint(25, 25 * 60 * 30)
+        parts.append("  <VideoStream>\n")
+        parts.append(f"    <Duration>{duration}</Duration>\n")
+        if rng.random() < trim_ratio:
+            trim_in = rng.randint(0, duration // 4)
+            trim_out = rng.randint(trim_in + 1, duration)
+            parts.append(
+                "    <VideoStreamElement>\n"
+                f"      <FileTrimIn>{trim_in}</FileTrimIn>\n"
+                f"      <FileTrimOut>{trim_out}</FileTrimOut>\n"
+                "    </VideoStreamElement>\n"
+            )
+        parts.append(f"    <VideoStandard>{rng.choice(VIDEO_STANDARDS)}</VideoStandard>\n")
+        parts.append("  </VideoStream>\n")
+    parts.append("</Clip>\n")
+    return "".join(parts)
+
+
+def generate_corpus(directory_path, count, streams=(1, 1), trim_ratio=0.5,
+                    metadata_bytes=0, seed=0):
+    """Writes count synthetic .bxx files into directory_path and returns their names.
+
+    The same arguments and seed always produce the same library.
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory_path, exist_ok=True)
+    names = []
+    for number in range(count):
+        name = f"clip_{number:06d}.bxx"
+        with open(os.path.join(directory_path, name), "w", encoding="utf-8") as f:
+            f.write(clip_document(rng, streams, trim_ratio, metadata_bytes))
+        names.append(name)
+    return names
+
+
+def parse_range(text):
+    """Parses "N" or "N-M" into an inclusive (low, high) pair."""
+    low, _, high = text.partition("-")
+    low = int(low)
+    high = int(high) if high else low
+    if not 0 <= low <= high:
+        raise argparse.ArgumentTypeError(f"invalid range {text!r}")
+    return low, high
+
+
+def add_corpus_arguments(parser):
+    """Adds the options describing a corpus' size and shape to parser."""
+    parser.add_argument("--count", type=int, default=2000, help="number of .bxx files")
+    parser.add_argument(
+        "--streams", type=parse_range, default=(1, 1), metavar="N[-M]",
+        help="VideoStreams per file (default: 1)",
+    )
+    parser.add_argument(
+        "--trim-ratio", type=float, default=0.5,
+        help="share of streams with trim points instead of only a Duration (default: 0.5)",
+    )
+    parser.add_argument(
+        "--metadata-bytes", type=int, default=0,
+        help="approximate size of the metadata block in each file (default: 0)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.corpus",
+        description="Generate a synthetic .bxx library.",
+    )
+    parser.add_argument("directory", help="directory to write the files into")
+    add_corpus_arguments(parser)
+    args = parser.parse_args(argv)
+    names = generate_corpus(
+        args.directory, args.count, args.streams, args.trim_ratio, args.metadata_bytes, args.seed
+    )
+    print(f"Wrote {len(names)} files to {args.directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
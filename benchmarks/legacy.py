@@ -0,0 +1,168 @@
+"""The original GUI implementations of the benchmarked operations, without Tk.
+
+These are the code paths vmlist.py and optimized-vmlist.py used before the
+shared vectorbox package existed, with the widgets replaced by plain lists
+and the error dialogs by a None result. They serve as the baseline that the
+current implementations are compared against.
+"""
+import os
+import xml.dom.minidom as minidom
+import xml.etree.ElementTree as ET
+
+
+def format_duration(duration_frames, fps=25):
+    total_seconds = duration_frames // fps
+    frames = duration_frames % fps
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}"
+
+
+def vmlist_extract_bxx_info(bxx_file_path):
+    """extract_bxx_info from vmlist.py."""
+    try:
+        with open(bxx_file_path, "r", encoding="utf-8") as file:
+            bxx_content = file.read()
+        tree = ET.ElementTree(ET.fromstring(bxx_content))
+        root = tree.getroot()
+
+        video_streams = root.findall("VideoStream")
+        max_duration = 0
+        video_standards = []
+        for stream in video_streams:
+            try:
+                file_trim_in = int(stream.find("VideoStreamElement/FileTrimIn").text)
+                file_trim_out = int(stream.find("VideoStreamElement/FileTrimOut").text)
+                duration = file_trim_out - file_trim_in
+            except:
+                duration = int(stream.find("Duration").text)
+            if duration > max_duration:
+                max_duration = duration
+
+            video_standard_element = stream.find("VideoStandard")
+            if video_standard_element is not None:
+                video_standards.append(video_standard_element.text)
+
+        return {
+            "duration": max_duration,
+            "video_standards": video_standards,
+        }
+    except Exception:
+        return None
+
+
+def optimized_extract_bxx_info(bxx_file_path):
+    """extract_bxx_info from optimized-vmlist.py."""
+    try:
+        with open(bxx_file_path, "r", encoding="utf-8") as file:
+            root = ET.fromstring(file.read())
+
+        video_streams = root.findall("VideoStream")
+        max_duration = 0
+        video_standards = []
+        for stream in video_streams:
+            try:
+                file_trim_in = int(stream.find("VideoStreamElement/FileTrimIn").text)
+                file_trim_out = int(stream.find("VideoStreamElement/FileTrimOut").text)
+                duration = file_trim_out - file_trim_in
+            except (AttributeError, ValueError, TypeError):
+                duration_element = stream.find("Duration")
+                if duration_element is not None:
+                    duration = int(duration_element.text)
+                else:
+                    duration = 0
+
+            if duration > max_duration:
+                max_duration = duration
+
+            video_standard_element = stream.find("VideoStandard")
+            if video_standard_element is not None:
+                video_standards.append(video_standard_element.text)
+
+        return {
+            "duration": max_duration,
+            "video_standards": video_standards,
+        }
+    except Exception:
+        return None
+
+
+def load_directory(directory_path):
+    """load_directory from optimized-vmlist.py: the sorted .bxx names of a directory."""
+    return sorted(
+        [f for f in os.listdir(directory_path) if f.lower().endswith((".bxx"))],
+        key=str.lower,
+    )
+
+
+def update_total_duration_display(directory_path, file_names, extract=vmlist_extract_bxx_info):
+    """update_total_duration_display: re-parses every playlist file to format the total."""
+    total_duration_frames = 0
+    for file_name in file_names:
+        bxx_info = extract(os.path.join(directory_path, file_name))
+        if bxx_info:
+            total_duration_frames += bxx_info["duration"]
+    return format_duration(total_duration_frames)
+
+
+def save_playlist(playlist_path, directory_path, file_names, extract=optimized_extract_bxx_info):
+    """save_playlist from optimized-vmlist.py: two parse passes, ElementTree and minidom."""
+    playlist = ET.Element("PlayList")
+    total_duration_frames = 0
+
+    for file_name in file_names:
+        bxx_info = extract(os.path.join(directory_path, file_name))
+        if bxx_info:
+            total_duration_frames += bxx_info["duration"]
+
+    meta_info = {
+        "DayModified": "2460640",
+        "TimeModified": "80231904",
+        "ListDuration": format_duration(total_duration_frames),
+        "TimeScale": "25fps",
+        "ExportedBy": "Vector3",
+        "ApplicationName": "V-BOX MCR",
+        "ApplicationRelease": "4.09.r207",
+        "ApplicationBuild": "28",
+        "CatalogueDir": "\\Catalogue",
+    }
+    for tag, text in meta_info.items():
+        ET.SubElement(playlist, tag).text = text
+
+    storage_units = ET.SubElement(playlist, "StorageUnits")
+    ET.SubElement(storage_units, "UnitPath").text = "Y:"
+    ET.SubElement(storage_units, "UnitPath").text = "D:"
+
+    for index, file_name in enumerate(file_names):
+        bxx_file_path = os.path.join(directory_path, file_name)
+        bxx_info = extract(bxx_file_path)
+
+        if bxx_info:
+            item = ET.SubElement(playlist, "Item")
+            ET.SubElement(item, "VBUniqueId").text = str(1732565760 + index * 7)
+            ET.SubElement(item, "Type").text = "DISK"
+            ET.SubElement(item, "ItemIndex").text = str(index + 1)
+
+            title = ET.SubElement(item, "Title")
+            ET.SubElement(title, "TitleId").text = os.path.splitext(file_name)[0]
+            ET.SubElement(title, "FilePath").text = bxx_file_path
+            ET.SubElement(title, "Caption").text = os.path.splitext(file_name)[0]
+            ET.SubElement(title, "Duration").text = str(bxx_info["duration"])
+
+            clip_data = ET.SubElement(title, "ClipData")
+            ET.SubElement(clip_data, "Duration").text = str(bxx_info["duration"])
+
+            for video_standard in bxx_info["video_standards"]:
+                ET.SubElement(clip_data, "VideoStandard").text = video_standard
+
+            meta_data = ET.SubElement(item, "MetaData")
+            ET.SubElement(meta_data, "MxfTCData", DropFrame="0").text = "0"
+            ET.SubElement(meta_data, "Generator").text = "v3-executor"
+
+            ET.SubElement(item, "ServerID").text = "0"
+
+    xml_str = ET.tostring(playlist, encoding="utf-8")
+    pretty_xml_str = minidom.parseString(xml_str).toprettyxml(indent="  ")
+    with open(playlist_path, "w", encoding="utf-8") as f:
+        f.write(pretty_xml_str)
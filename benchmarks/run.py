@@ -0,0 +1,302 @@
+"""Benchmark suite for parsing, directory scans, totals, .plx writes and timecodes.
+
+Each benchmark times the original GUI implementation (benchmarks.legacy)
+against the current vectorbox code path on a synthetic library and reports
+the best of --repeat runs. Results are written as JSON so they can be
+compared across releases; a readable summary goes to stderr.
+
+Examples::
+
+    python -m benchmarks.run --count 5000 --output results.json
+    python -m benchmarks.run --corpus /tmp/library --only parse scan
+    python -m benchmarks.run --only latency --latency-ms 10
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from vectorbox import (
+    BxxInfoCache,
+    CatalogueIndex,
+    LatencyFileSystem,
+    MetadataReader,
+    Playlist,
+    format_duration,
+    format_timecodes,
+    parse_bxx_file,
+    parse_bxx_stream,
+    parse_bxx_tree,
+    scan_directory,
+    timecode,
+    write_playlist,
+)
+
+from . import legacy
+from .corpus import add_corpus_arguments, generate_corpus
+
+RESULTS_VERSION = 1
+BENCHMARKS = ("parse", "scan", "total", "save", "latency", "timecode")
+LATENCY_CONCURRENCY = (1, 4, 16, 64)  # Reads in flight compared by the latency benchmark
+DEFAULT_LATENCY = 0.005  # Seconds added to every stat and read by the latency benchmark
+
+
+def measure(function, repeat):
+    """Returns the best wall-clock time of repeat calls to function."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def result(benchmark, implementation, items, seconds):
+    return {
+        "benchmark": benchmark,
+        "implementation": implementation,
+        "items": items,
+        "seconds": seconds,
+        "items_per_second": items / seconds if seconds else None,
+    }
+
+
+def bench_parse(directory_path, names, playlist_names, work_path, repeat):
+    """Parses every file of the library once."""
+    paths = [os.path.join(directory_path, name) for name in names]
+    implementations = {
+        "legacy vmlist.py": legacy.vmlist_extract_bxx_info,
+        "legacy optimized-vmlist.py": legacy.optimized_extract_bxx_info,
+        "vectorbox parse_bxx_tree": parse_bxx_tree,
+        "vectorbox parse_bxx_stream": parse_bxx_stream,
+        "vectorbox parse_bxx_file": parse_bxx_file,
+    }
+    for implementation, parse in implementations.items():
+        def run():
+            for path in paths:
+                parse(path)
+        yield result("parse", implementation, len(paths), measure(run, repeat))
+
+
+def bench_scan(directory_path, names, playlist_names, work_path, repeat):
+    """Lists the library, as load_directory does."""
+    yield result(
+        "scan", "legacy load_directory", len(names),
+        measure(lambda: legacy.load_directory(directory_path), repeat),
+    )
+    yield result(
+        "scan", "vectorbox scan_directory", len(names),
+        measure(lambda: scan_directory(directory_path), repeat),
+    )
+
+    index_path = os.path.join(work_path, "catalogue.db")
+
+    def cold():
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        with CatalogueIndex(index_path) as index:
+            index.refresh(directory_path)
+
+    yield result("scan", "vectorbox CatalogueIndex.refresh (empty index)", len(names), measure(cold, repeat))
+    with CatalogueIndex(index_path) as index:
+        index.refresh(directory_path)
+        yield result(
+            "scan", "vectorbox CatalogueIndex.sync (up to date)", len(names),
+            measure(lambda: index.sync(directory_path), repeat),
+        )
+
+
+def bench_total(directory_path, names, playlist_names, work_path, repeat):
+    """Builds a playlist one clip at a time, showing the total after each addition."""
+    def run_legacy():
+        for count in range(1, len(playlist_names) + 1):
+            legacy.update_total_duration_display(directory_path, playlist_names[:count])
+
+    def run_current():
+        cache = BxxInfoCache()
+        playlist = Playlist()
+        for name in playlist_names:
+            playlist.append(name, cache.get(os.path.join(directory_path, name), parse_bxx_file))
+            format_duration(playlist.total_frames)
+
+    yield result("total", "legacy update_total_duration_display", len(playlist_names), measure(run_legacy, repeat))
+    yield result("total", "vectorbox Playlist running total", len(playlist_names), measure(run_current, repeat))
+
+
+def bench_save(directory_path, names, playlist_names, work_path, repeat):
+    """Writes the playlist as a .plx file."""
+    plx_path = os.path.join(work_path, "bench_0000.plx")
+
+    yield result(
+        "save", "legacy save_playlist", len(playlist_names),
+        measure(lambda: legacy.save_playlist(plx_path, directory_path, playlist_names), repeat),
+    )
+
+    def run_cold():
+        cache = BxxInfoCache()
+        playlist = Playlist()
+        for name in playlist_names:
+            playlist.append(name, None)
+        playlist.refresh(lambda name: cache.get(os.path.join(directory_path, name), parse_bxx_file))
+        write_playlist(plx_path, playlist, directory_path)
+
+    yield result("save", "vectorbox refresh + write_playlist (empty cache)", len(playlist_names), measure(run_cold, repeat))
+
+    cache = BxxInfoCache()
+    playlist = Playlist()
+    for name in playlist_names:
+        playlist.append(name, cache.get(os.path.join(directory_path, name), parse_bxx_file))
+
+    def run_warm():
+        playlist.refresh(lambda name: cache.get(os.path.join(directory_path, name), parse_bxx_file))
+        write_playlist(plx_path, playlist, directory_path)
+
+    yield result("save", "vectorbox refresh + write_playlist (warm cache)", len(playlist_names), measure(run_warm, repeat))
+
+
+def bench_latency(directory_path, names, playlist_names, work_path, repeat, latency=DEFAULT_LATENCY):
+    """Reads the playlist's files through a stand-in share that delays every stat and read."""
+    paths = [os.path.join(directory_path, name) for name in playlist_names]
+    fs = LatencyFileSystem(latency)
+    sequential = MetadataReader(fs=fs)
+
+    def run_sequential():
+        for path in paths:
+            sequential.read(path)
+
+    yield result(
+        "latency", f"sequential stat + read ({latency * 1000:g} ms per call)", len(paths),
+        measure(run_sequential, repeat),
+    )
+    for concurrency in LATENCY_CONCURRENCY:
+        reader = MetadataReader(concurrency=concurrency, fs=fs)
+        yield result(
+            "latency", f"vectorbox MetadataReader, {concurrency} in flight", len(paths),
+            measure(lambda: reader.read_all(paths), repeat),
+        )
+
+
+def bench_timecode(directory_path, names, playlist_names, work_path, repeat):
+    """Formats the start and duration timecodes of every clip in the library, as one timeline."""
+    durations = [parse_bxx_file(os.path.join(directory_path, name))["duration"] for name in names]
+    starts = list(itertools.accumulate(durations, initial=0))[:-1]
+    frame_counts = starts + durations
+
+    def run_legacy():
+        for frames in frame_counts:
+            legacy.format_duration(frames)
+
+    yield result("timecode", "legacy format_duration per label", len(frame_counts), measure(run_legacy, repeat))
+    for rate in (timecode.FRAME_RATES["25"], timecode.FRAME_RATES["29.97DF"]):
+        yield result(
+            "timecode", f"vectorbox format_duration per label ({rate.name})", len(frame_counts),
+            measure(lambda: [format_duration(frames, rate) for frames in frame_counts], repeat),
+        )
+        yield result(
+            "timecode",
+            f"vectorbox format_timecodes ({rate.name}, {'NumPy' if timecode.np is not None else 'pure Python'})",
+            len(frame_counts),
+            measure(lambda: format_timecodes(frame_counts, rate), repeat),
+        )
+
+
+BENCHMARK_FUNCTIONS = {
+    "parse": bench_parse,
+    "scan": bench_scan,
+    "total": bench_total,
+    "save": bench_save,
+    "latency": bench_latency,
+    "timecode": bench_timecode,
+}
+
+
+def run_benchmarks(directory_path, benchmarks=BENCHMARKS, playlist_size=100, repeat=3,
+                   latency=DEFAULT_LATENCY):
+    """Runs the named benchmarks on the .bxx files of directory_path and returns the results."""
+    names = sorted(scan_directory(directory_path), key=str.lower)
+    playlist_names = names[:playlist_size]
+    results = []
+    with tempfile.TemporaryDirectory(prefix="vectorbox-bench-") as work_path:
+        for benchmark in benchmarks:
+            options = {"latency": latency} if benchmark == "latency" else {}
+            for entry in BENCHMARK_FUNCTIONS[benchmark](
+                directory_path, names, playlist_names, work_path, repeat, **options
+            ):
+                print(
+                    f"{entry['benchmark']:8} {entry['implementation']:50} "
+                    f"{entry['seconds'] * 1000:10.1f} ms  {entry['items']:6} items",
+                    file=sys.stderr,
+                )
+                results.append(entry)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmark the headless playlist code paths against the original implementations.",
+    )
+    parser.add_argument(
+        "--corpus", metavar="DIR",
+        help="library to benchmark; generated there if it holds no .bxx files "
+             "(default: a temporary library)",
+    )
+    add_corpus_arguments(parser)
+    parser.add_argument("--playlist-size", type=int, default=100, help="clips in the benchmarked playlist")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; the best is kept")
+    parser.add_argument(
+        "--latency-ms", type=float, default=DEFAULT_LATENCY * 1000,
+        help="delay per stat and read in the latency benchmark",
+    )
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=BENCHMARKS, help="benchmarks to run")
+    parser.add_argument("-o", "--output", help="write the JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    corpus = {
+        "count": args.count,
+        "streams": list(args.streams),
+        "trim_ratio": args.trim_ratio,
+        "metadata_bytes": args.metadata_bytes,
+        "seed": args.seed,
+    }
+    with tempfile.TemporaryDirectory(prefix="vectorbox-corpus-") as temp_path:
+        directory_path = args.corpus or temp_path
+        if not os.path.isdir(directory_path) or not scan_directory(directory_path):
+            generate_corpus(
+                directory_path, args.count, args.streams, args.trim_ratio,
+                args.metadata_bytes, args.seed,
+            )
+        else:
+            corpus = {"directory": directory_path, "count": len(scan_directory(directory_path))}
+        results = run_benchmarks(
+            directory_path, args.only, args.playlist_size, args.repeat, args.latency_ms / 1000
+        )
+
+    report = {
+        "version": RESULTS_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": corpus,
+        "playlist_size": args.playlist_size,
+        "repeat": args.repeat,
+        "latency_ms": args.latency_ms,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,4 @@
+"""Tests for the headless VectorBox code paths.
+
+Run ``python -m pytest`` from the repository root.
+"""
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from benchmarks.corpus import clip_document
+from vectorbox import bxx
+
+VALUES = ("12", "-3", "", "x", "400", " 7 ", "0")
+
+
+def random_stream(rng):
+    """Returns a VideoStream with a random mix of the children parse_bxx_root looks at."""
+    parts = []
+    for _ in range(rng.randint(0, 4)):
+        choice = rng.random()
+        if choice < 0.3:
+            parts.append(f"<Duration>{rng.choice(VALUES)}</Duration>")
+        elif choice < 0.5:
+            parts.append(f"<VideoStandard>{rng.choice(['PAL', '1080i50', ''])}</VideoStandard>")
+        elif choice < 0.8:
+            inner = "".join(
+                rng.choice([
+                    f"<FileTrimIn>{rng.choice(VALUES)}</FileTrimIn>",
+                    f"<FileTrimOut>{rng.choice(VALUES)}</FileTrimOut>",
+                    "<X/>",
+                ])
+                for _ in range(rng.randint(0, 3))
+            )
+            parts.append(f"<VideoStreamElement>{inner}</VideoStreamElement>")
+        else:
+            parts.append("<Other><Duration>5</Duration></Other>")
+    return "<VideoStream>" + "".join(parts) + "</VideoStream>"
+
+
+def random_document(rng):
+    streams = (rng.choice([random_stream(rng), "<Meta>m</Meta>"]) for _ in range(rng.randint(0, 4)))
+    return "<Clip>" + "".join(streams) + "</Clip>"
+
+
+def outcome(parse, *args):
+    """Returns the result of parse, or the type of the exception it raised."""
+    try:
+        return parse(*args)
+    except Exception as e:
+        return type(e)
+
+
+def test_stream_matches_tree_on_random_documents(tmp_path):
+    rng = random.Random(1)
+    path = tmp_path / "clip.bxx"
+    for _ in range(3000):
+        document = random_document(rng)
+        path.write_text(document, encoding="utf-8")
+        expected = outcome(bxx.parse_bxx_tree, path)
+        assert outcome(bxx.parse_bxx_stream, path) == expected, document
+        assert outcome(bxx.parse_bxx_bytes, document.encode()) == expected, document
+
+
+@pytest.mark.parametrize("metadata_bytes", [0, 4096, bxx.STREAM_THRESHOLD])
+def test_parse_bxx_file_matches_tree(tmp_path, metadata_bytes):
+    rng = random.Random(metadata_bytes)
+    path = tmp_path / "clip.bxx"
+    for _ in range(5):
+        path.write_text(clip_document(rng, (1, 3), 0.5, metadata_bytes), encoding="utf-8")
+        expected = bxx.parse_bxx_tree(path)
+        assert bxx.parse_bxx_file(path) == expected
+        assert bxx.parse_bxx_bytes(path.read_bytes()) == expected
+
+
+@pytest.mark.parametrize("duration", ["<Duration/>", "<Duration></Duration>"])
+def test_empty_duration_is_a_value_error(tmp_path, duration):
+    document = f"<Clip><VideoStream>{duration}</VideoStream></Clip>"
+    path = tmp_path / "clip.bxx"
+    path.write_text(document, encoding="utf-8")
+    for parse, argument in (
+        (bxx.parse_bxx_tree, path),
+        (bxx.parse_bxx_stream, path),
+        (bxx.parse_bxx_bytes, document.encode()),
+    ):
+        with pytest.raises(ValueError):
+            parse(argument)
+
+
+def test_parse_error_is_raised(tmp_path):
+    path = tmp_path / "clip.bxx"
+    path.write_text("<Clip><VideoStream>", encoding="utf-8")
+    with pytest.raises(bxx.ET.ParseError):
+        bxx.parse_bxx_file(path)
@@ -0,0 +1,88 @@
+import os
+
+from vectorbox.bxx import parse_bxx_file
+from vectorbox.cache import BxxInfoCache
+
+
+class CountingParser:
+    def __init__(self):
+        self.paths = []
+
+    def __call__(self, path):
+        self.paths.append(path)
+        return parse_bxx_file(path)
+
+
+def write_clip(path, duration):
+    path.write_text(
+        f"<Clip><VideoStream><Duration>{duration}</Duration></VideoStream></Clip>", encoding="utf-8"
+    )
+
+
+def test_entries_are_invalidated_when_the_file_changes(tmp_path):
+    path = tmp_path / "a.bxx"
+    write_clip(path, 100)
+    cache = BxxInfoCache()
+    parse = CountingParser()
+    assert cache.get(str(path), parse)["duration"] == 100
+    assert cache.get(str(path), parse)["duration"] == 100
+    assert len(parse.paths) == 1 and (cache.hits, cache.misses) == (1, 1)
+
+    write_clip(path, 2000)  # Different size
+    assert cache.get(str(path), parse)["duration"] == 2000
+    st = os.stat(path)
+    write_clip(path, 3000)  # Same size: only the mtime tells
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.get(str(path), parse)["duration"] == 3000
+    assert len(parse.paths) == 3
+
+    cache.invalidate(str(path))
+    assert str(path) not in cache
+    cache.get(str(path), parse)
+    assert len(parse.paths) == 4
+
+
+def test_failed_parses_are_not_cached(tmp_path):
+    path = tmp_path / "a.bxx"
+    path.write_text("<Clip>", encoding="utf-8")
+    cache = BxxInfoCache()
+    for _ in range(2):
+        try:
+            cache.get(str(path), parse_bxx_file)
+        except Exception:
+            pass
+    assert len(cache) == 0 and cache.misses == 2
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = BxxInfoCache(max_entries=2)
+    cache.put("a", (1, 1), {"duration": 1})
+    cache.put("b", (1, 1), {"duration": 2})
+    assert cache.lookup("a", (1, 1)) == {"duration": 1}
+    cache.put("c", (1, 1), {"duration": 3})
+    assert "a" in cache and "b" not in cache and "c" in cache
+
+
+def test_store_round_trip(tmp_path):
+    path = tmp_path / "a.bxx"
+    write_clip(path, 100)
+    store_path = str(tmp_path / "bxx_cache.json")
+    cache = BxxInfoCache(store_path)
+    cache.get(str(path), parse_bxx_file)
+    cache.save()
+
+    reloaded = BxxInfoCache(store_path)
+    reloaded.load()
+    parse = CountingParser()
+    assert reloaded.get(str(path), parse) == parse_bxx_file(path)
+    assert parse.paths == []
+    write_clip(path, 12345)
+    assert reloaded.get(str(path), parse)["duration"] == 12345  # The stored entry is stale
+
+
+def test_corrupt_store_is_ignored(tmp_path):
+    store_path = tmp_path / "bxx_cache.json"
+    store_path.write_text("{not json", encoding="utf-8")
+    cache = BxxInfoCache(str(store_path))
+    cache.load()
+    assert len(cache) == 0
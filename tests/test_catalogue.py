@@ -0,0 +1,80 @@
+import random
+
+from vectorbox.cache import BxxInfoCache
+from vectorbox.catalogue import Catalogue
+from vectorbox.records import ClipStore
+
+DIRECTORY = "/clips"
+
+
+def info(duration):
+    return {"duration": duration, "video_standards": ["PAL"], "trim_in": None, "trim_out": None}
+
+
+def test_total_counts_unparsed_clips_as_pending():
+    clips = ClipStore()
+    clips.put(DIRECTORY, "a.bxx", info(100))
+    cache = BxxInfoCache()
+    cache.put(f"{DIRECTORY}/b.bxx", (1, 1), info(20))
+    catalogue = Catalogue(cache, clips=clips)
+    catalogue.load(DIRECTORY, ["a.bxx", "b.bxx", "missing.bxx", "broken.bxx"])
+    assert catalogue.total([0, 1]) == (120, 0)
+    assert catalogue.total([0, 1, 2, 3]) == (120, 2)
+    assert catalogue.total([]) == (0, 0)
+
+
+def test_rows_follow_a_list_model():
+    rng = random.Random(7)
+    pool = [f"clip_{n:03d}.bxx" for n in range(80)]
+    catalogue = Catalogue()
+    catalogue.load(DIRECTORY, pool[:40])
+    model = list(pool[:40])
+    for _ in range(2000):
+        operation = rng.random()
+        if operation < 0.3:
+            name = rng.choice(pool)
+            catalogue.append(name)
+            model.append(name)
+        elif operation < 0.5:
+            name = rng.choice(pool)
+            expected = model.index(name) if name in model else None
+            assert catalogue.remove(name) == expected
+            if expected is not None:
+                model.pop(expected)
+        elif operation < 0.6 and model:
+            rows = set(rng.sample(range(len(model)), min(3, len(model))))
+            assert catalogue.pop_many(rows) == [name for row, name in enumerate(model) if row in rows]
+            model = [name for row, name in enumerate(model) if row not in rows]
+        elif operation < 0.7:
+            names = set(rng.sample(pool, 5))
+            assert catalogue.remove_many(names) == [name for name in model if name in names]
+            model = [name for name in model if name not in names]
+        else:
+            name = rng.choice(pool)
+            assert catalogue.row_of(name) == (model.index(name) if name in model else None)
+        assert catalogue.names == model
+        assert len(catalogue) == len(model)
+
+
+def test_row_texts_come_from_the_store_then_the_cache():
+    clips = ClipStore()
+    clips.put(DIRECTORY, "stored.bxx", info(90000))
+    cache = BxxInfoCache()
+    cache.put(f"{DIRECTORY}/cached.bxx", (1, 1), dict(info(25), video_standards=["1080i50", ""]))
+    catalogue = Catalogue(cache, "29.97DF", clips)
+    catalogue.load(DIRECTORY, ["stored.bxx", "cached.bxx", "new.bxx"])
+    assert catalogue.row(0) == ("stored.bxx", "00:50:03;00", "PAL")
+    assert catalogue.row(1) == ("cached.bxx", "00:00:00;25", "1080i50")
+    assert catalogue.row(2) == ("new.bxx", "", "")
+    assert catalogue.info(0) == info(90000)
+    assert catalogue.info(2) is None and catalogue.duration(2) is None
+
+
+def test_find_returns_rows():
+    catalogue = Catalogue()
+    catalogue.load(DIRECTORY, ["b_news.bxx", "Promo.bxx", "a_news.bxx"])
+    assert catalogue.find("pro") == 1
+    assert catalogue.find("news") == 2  # a_news sorts before b_news
+    assert catalogue.find("zzz") is None
+    catalogue.pop(2)
+    assert catalogue.find("news") == 0
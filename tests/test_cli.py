@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from vectorbox.cli import main, manifest_job, read_manifest
+
+
+def write_clip(directory, name, duration, standard="PAL"):
+    (directory / name).write_text(
+        f"<Clip><VideoStream><Duration>{duration}</Duration>"
+        f"<VideoStandard>{standard}</VideoStandard></VideoStream></Clip>",
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    load_dir = tmp_path / "load"
+    save_dir = tmp_path / "save"
+    load_dir.mkdir()
+    save_dir.mkdir()
+    write_clip(load_dir, "a.bxx", 100)
+    write_clip(load_dir, "b.bxx", 250)
+    return load_dir, save_dir
+
+
+def run(dirs, *args):
+    load_dir, save_dir = dirs
+    return main(["--config", os.devnull, "-l", str(load_dir), "-s", str(save_dir), "-j", "1", *args])
+
+
+def test_read_manifest(tmp_path):
+    text = tmp_path / "Monday_0001.txt"
+    text.write_text("# comment\na\n\n  b.bxx  \n", encoding="utf-8")
+    table = tmp_path / "list.csv"
+    table.write_text("file,note\na,x\n,\nb.BXX,y\n", encoding="utf-8")
+    assert read_manifest(str(text)) == ["a.bxx", "b.bxx"]
+    assert read_manifest(str(table)) == ["a.bxx", "b.BXX"]
+    job = manifest_job(str(text))
+    assert (job.title, job.code, job.clips) == ("Monday", "0001", ["a.bxx", "b.bxx"])
+    assert manifest_job(str(table), "Title", "0002")[:2] == ("Title", "0002")
+
+
+def test_writes_a_playlist_from_clip_names(dirs, capsys):
+    assert run(dirs, "-t", "16-10", "-c", "0001", "a", "b", "a") == 0
+    playlist_path = capsys.readouterr().out.strip()
+    assert os.path.dirname(playlist_path) == str(dirs[1])
+    text = open(playlist_path, encoding="utf-8").read()
+    assert text.count("<Item>") == 3
+    assert "<ListDuration>00:00:18:00</ListDuration>" in text
+
+
+def test_manifests_are_written_and_unreadable_ones_reported(dirs, tmp_path, capsys):
+    manifest = tmp_path / "Monday_0001.txt"
+    manifest.write_text("a\nb\n", encoding="utf-8")
+    missing = tmp_path / "Tuesday_0002.txt"
+    assert run(dirs, "--manifest", str(missing), str(manifest)) == 1
+    captured = capsys.readouterr()
+    assert f"{missing}: failed to read manifest" in captured.err
+    assert "Traceback" not in captured.err
+    assert os.listdir(dirs[1]) == [os.path.basename(captured.out.strip())]
+
+
+def test_check_reports_problems_and_writes_nothing(dirs, capsys):
+    write_clip(dirs[0], "ntsc.bxx", 100, "NTSC")
+    write_clip(dirs[0], "pal.bxx", 100, "PAL")
+    assert run(dirs, "--check", "a", "missing", "ntsc", "pal") == 1
+    captured = capsys.readouterr()
+    assert "#2 missing.bxx: missing" in captured.err
+    assert "#3 ntsc.bxx: mismatched VideoStandard (NTSC, expected PAL)" in captured.err
+    assert captured.out.strip().endswith("2 problems in 4 entries: 1 missing, 1 mismatched VideoStandard")
+    assert os.listdir(dirs[1]) == []
+
+
+def test_strict_skips_playlists_with_problems(dirs, capsys):
+    assert run(dirs, "--strict", "-c", "0001", "a", "missing") == 1
+    assert "not saved" in capsys.readouterr().err
+    assert os.listdir(dirs[1]) == []
+    assert run(dirs, "-c", "0001", "a", "missing") == 0
+    assert len(os.listdir(dirs[1])) == 1
+
+
+def test_code_is_required(dirs):
+    with pytest.raises(SystemExit):
+        run(dirs, "a")
@@ -0,0 +1,66 @@
+import itertools
+import random
+
+import pytest
+
+from vectorbox.fill import fill_duration
+
+
+def brute_force(clips, target, tolerance, required):
+    """Returns the smallest |total - target| within tolerance over every choice of clips, or None."""
+    durations = dict(clips)
+    fixed = sum(durations[name] for name in required)
+    pool = [duration for name, duration in clips if duration > 0 and name not in required]
+    best = None
+    for size in range(len(pool) + 1):
+        for chosen in itertools.combinations(pool, size):
+            error = abs(fixed + sum(chosen) - target)
+            if error <= tolerance and (best is None or error < best):
+                best = error
+    return best
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_fill_matches_brute_force(seed):
+    rng = random.Random(seed)
+    clips = [(f"clip_{n}.bxx", rng.choice([0, rng.randint(1, 60)])) for n in range(rng.randint(0, 10))]
+    names = [name for name, _duration in clips]
+    required = rng.sample(names, rng.randint(0, min(2, len(names))))
+    first = rng.choice(names + [None]) if names else None
+    target = rng.randint(0, 300)
+    tolerance = rng.choice([0, 0, 3, 20])
+    order = rng.choice(["catalogue", "longest", "shortest"])
+
+    result = fill_duration(clips, target, tolerance, must_include=required, first=first, order=order)
+    expected = brute_force(clips, target, tolerance, set(required) | ({first} - {None}))
+    if expected is None:
+        assert result is None
+        return
+    assert result is not None
+    durations = dict(clips)
+    assert abs(result.total_frames - target) == expected
+    assert result.total_frames == sum(durations[name] for name in result.names)
+    assert len(set(result.names)) == len(result.names)
+    assert set(required) <= set(result.names)
+    if first is not None:
+        assert result.names[0] == first
+    rank = {name: position for position, name in enumerate(names)}
+    middle = [name for name in result.names if name != first]
+    if order == "catalogue":
+        assert middle == sorted(middle, key=rank.__getitem__)
+    else:
+        sign = -1 if order == "longest" else 1
+        assert middle == sorted(middle, key=lambda name: (sign * durations[name], rank[name]))
+
+
+def test_last_closes_the_result():
+    clips = [("a", 10), ("b", 20), ("c", 30)]
+    result = fill_duration(clips, 60, first="c", last="a")
+    assert result.names == ["c", "b", "a"]
+    assert result.total_frames == 60
+
+
+@pytest.mark.parametrize("arguments", [{"order": "random"}, {"must_include": ["missing"]}])
+def test_invalid_arguments_raise(arguments):
+    with pytest.raises(ValueError):
+        fill_duration([("a", 10)], 10, **arguments)
@@ -0,0 +1,128 @@
+import os
+import stat
+import threading
+
+import pytest
+
+from vectorbox import fsutil
+from vectorbox.fsutil import NEW_FILE_MODE, atomic_write
+from vectorbox.playlist import Playlist
+from vectorbox.plx import SaveCancelled, write_playlist
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@posix_only
+def test_new_file_gets_the_default_mode(tmp_path):
+    path = tmp_path / "a.plx"
+    with atomic_write(path) as f:
+        f.write("new")
+    assert path.read_text(encoding="utf-8") == "new"
+    assert mode(path) == NEW_FILE_MODE
+
+
+@posix_only
+def test_replaced_file_keeps_its_mode(tmp_path):
+    path = tmp_path / "a.plx"
+    path.write_text("old", encoding="utf-8")
+    os.chmod(path, 0o640)
+    with atomic_write(path) as f:
+        f.write("new")
+    assert path.read_text(encoding="utf-8") == "new"
+    assert mode(path) == 0o640
+
+
+def test_failed_write_leaves_the_file_alone(tmp_path):
+    path = tmp_path / "a.plx"
+    path.write_text("old", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write("partial")
+            raise RuntimeError("interrupted")
+    assert path.read_text(encoding="utf-8") == "old"
+    assert os.listdir(tmp_path) == ["a.plx"]
+
+
+def test_umask_is_not_touched(tmp_path):
+    previous = os.umask(0o027)
+    try:
+        with atomic_write(tmp_path / "a.plx") as f:
+            f.write("new")
+        assert os.umask(0o027) == 0o027
+    finally:
+        os.umask(previous)
+
+
+class DescriptorSpy:
+    """Records the temp file descriptor atomic_write opens and every os.close() of it."""
+
+    def __init__(self, monkeypatch):
+        self.fd = None
+        self.files = []
+        self.closes = 0
+        mkstemp, close, fdopen = fsutil.tempfile.mkstemp, os.close, os.fdopen
+
+        def spy_mkstemp(*args, **kwargs):
+            self.fd, tmp_path = mkstemp(*args, **kwargs)
+            return self.fd, tmp_path
+
+        def spy_close(fd):
+            if fd == self.fd:
+                self.closes += 1
+            close(fd)
+
+        def spy_fdopen(fd, *args, **kwargs):
+            f = fdopen(fd, *args, **kwargs)
+            self.files.append(f)
+            return f
+
+        monkeypatch.setattr(fsutil.tempfile, "mkstemp", spy_mkstemp)
+        monkeypatch.setattr(os, "close", spy_close)
+        monkeypatch.setattr(os, "fdopen", spy_fdopen)
+
+    def closed_once(self):
+        """True if the descriptor was closed once, by its file object or by os.close()."""
+        return self.closes + sum(f.closed for f in self.files) == 1
+
+
+def test_cancelled_save_closes_the_temp_file_once(tmp_path, monkeypatch):
+    spy = DescriptorSpy(monkeypatch)
+    path = tmp_path / "a.plx"
+    playlist = Playlist()
+    playlist.append("clip.bxx", {"duration": 25, "video_standards": [], "trim_in": None, "trim_out": None})
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(SaveCancelled):
+        write_playlist(path, playlist, str(tmp_path), cancel_event=cancel_event)
+    assert os.listdir(tmp_path) == []
+    assert spy.closed_once()
+
+
+def test_failed_replace_closes_the_temp_file_once(tmp_path, monkeypatch):
+    spy = DescriptorSpy(monkeypatch)
+    path = tmp_path / "a.plx"
+    path.write_text("old", encoding="utf-8")
+
+    def failing_replace(source, destination):
+        raise PermissionError(destination)
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(PermissionError):
+        with atomic_write(path) as f:
+            f.write("new")
+    assert path.read_text(encoding="utf-8") == "old"
+    assert os.listdir(tmp_path) == ["a.plx"]
+    assert spy.closed_once()
+
+
+def test_failed_open_closes_the_descriptor(tmp_path, monkeypatch):
+    spy = DescriptorSpy(monkeypatch)
+    with pytest.raises(LookupError):
+        with atomic_write(tmp_path / "a.plx", encoding="no-such-codec"):
+            pass
+    assert os.listdir(tmp_path) == []
+    assert spy.closes == 1 and spy.closed_once()
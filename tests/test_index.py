@@ -0,0 +1,80 @@
+import os
+
+from vectorbox.bxx import parse_bxx_file
+from vectorbox.index import CatalogueIndex, scan_directory
+
+
+def write_clip(path, duration):
+    path.write_text(
+        f"<Clip><VideoStream><Duration>{duration}</Duration>"
+        "<VideoStandard>PAL</VideoStandard></VideoStream></Clip>",
+        encoding="utf-8",
+    )
+
+
+class CountingParser:
+    def __init__(self):
+        self.names = []
+
+    def __call__(self, path):
+        self.names.append(os.path.basename(path))
+        return parse_bxx_file(path)
+
+
+def test_scan_directory_lists_bxx_files(tmp_path):
+    write_clip(tmp_path / "a.bxx", 1)
+    write_clip(tmp_path / "B.BXX", 1)
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "dir.bxx").mkdir()
+    assert sorted(scan_directory(str(tmp_path))) == ["B.BXX", "a.bxx"]
+
+
+def test_refresh_parses_only_new_or_changed_files(tmp_path):
+    clips = tmp_path / "clips"
+    clips.mkdir()
+    for name, duration in (("a.bxx", 100), ("b.bxx", 200), ("c.bxx", 300)):
+        write_clip(clips / name, duration)
+    (clips / "broken.bxx").write_text("<Clip>", encoding="utf-8")
+    directory = str(clips)
+    parse = CountingParser()
+    with CatalogueIndex(str(tmp_path / "catalogue.db")) as index:
+        infos, problems = index.refresh(directory, parse)
+        assert {name: info["duration"] for name, info in infos.items()} == {
+            "a.bxx": 100, "b.bxx": 200, "c.bxx": 300
+        }
+        assert [name for name, error in problems] == ["broken.bxx"]
+
+        write_clip(clips / "b.bxx", 2000)
+        os.remove(clips / "c.bxx")
+        write_clip(clips / "d.bxx", 400)
+        parse.names.clear()
+        infos, problems = index.refresh(directory, parse)
+        assert sorted(parse.names) == ["b.bxx", "broken.bxx", "d.bxx"]  # Failures are retried
+        assert {name: info["duration"] for name, info in infos.items()} == {
+            "a.bxx": 100, "b.bxx": 2000, "d.bxx": 400
+        }
+        assert sorted(index.load(directory)) == ["a.bxx", "b.bxx", "d.bxx"]  # c.bxx's row is gone
+
+    # Reopening the file keeps everything; only the broken file is stale
+    with CatalogueIndex(str(tmp_path / "catalogue.db")) as index:
+        fresh, stale = index.sync(directory)
+        assert sorted(fresh) == ["a.bxx", "b.bxx", "d.bxx"]
+        assert list(stale) == ["broken.bxx"]
+        assert fresh["a.bxx"][1] == parse_bxx_file(clips / "a.bxx")
+
+
+def test_directories_are_kept_apart(tmp_path):
+    with CatalogueIndex(str(tmp_path / "catalogue.db")) as index:
+        info = {"duration": 5, "video_standards": ["PAL"], "trim_in": 1, "trim_out": 6}
+        index.store("/a", [("x.bxx", (10, 20), info)])
+        index.store("/b", [("x.bxx", (11, 21), dict(info, duration=7))])
+        index.discard("/b", ["x.bxx"])
+        assert index.load("/a") == {"x.bxx": ((10, 20), info)}
+        assert index.load("/b") == {}
+
+
+def test_corrupt_index_file_is_replaced(tmp_path):
+    path = tmp_path / "catalogue.db"
+    path.write_bytes(b"this is not a database" * 100)
+    with CatalogueIndex(str(path)) as index:
+        assert index.load("/a") == {}
@@ -0,0 +1,135 @@
+import random
+
+import pytest
+
+from vectorbox import BxxInfoCache, CatalogueIndex, ChannelSet, ClipStore, Playlist
+from vectorbox.bxx import parse_bxx_file
+
+DIRECTORY = "/clips"
+
+
+def info(duration):
+    return {"duration": duration, "video_standards": ["1080i50"], "trim_in": None, "trim_out": None}
+
+
+def check(playlist, model):
+    """Compares playlist with model, a list of (file name, duration)."""
+    assert playlist.names() == [name for name, _duration in model]
+    assert [item.duration for item in playlist] == [duration for _name, duration in model]
+    assert [playlist.duration(index) for index in range(len(model))] == [
+        duration for _name, duration in model
+    ]
+    assert playlist.total_frames == sum(duration for _name, duration in model)
+    start = 0
+    for index, (_name, duration) in enumerate(model):
+        assert playlist.start_frame(index) == start
+        start += duration
+    seek = [index for index, (_name, duration) in enumerate(model) for _ in range(duration)]
+    for frame in random.Random(len(seek)).sample(range(len(seek)), min(len(seek), 50)):
+        assert playlist.seek(frame) == seek[frame]
+    assert playlist.seek(len(seek)) is None
+    assert playlist.seek(-1) is None
+
+
+@pytest.mark.parametrize("store", [False, True])
+def test_playlist_matches_a_list(store):
+    rng = random.Random(3)
+    clips = ClipStore() if store else None
+    durations = {f"clip_{n:03d}.bxx": rng.choice([0, 1, 25, rng.randint(1, 500)]) for n in range(40)}
+    if clips is not None:
+        for name, duration in durations.items():
+            clips.put(DIRECTORY, name, info(duration))
+    playlist = Playlist(clips)
+    model = []
+    for _ in range(600):
+        operation = rng.random()
+        if operation < 0.35 or not model:
+            name = rng.choice(list(durations))
+            playlist.append(name, None if store else info(durations[name]), DIRECTORY)
+            model.append((name, durations[name]))
+        elif operation < 0.5:
+            index = rng.randrange(-len(model), len(model))
+            assert playlist.pop(index).file_name == model.pop(index)[0]
+        elif operation < 0.6:
+            indices = rng.sample(range(len(model)), rng.randint(0, len(model)))
+            removed = playlist.pop_many(indices)
+            assert [item.file_name for item in removed] == [model[i][0] for i in sorted(indices)]
+            model = [entry for i, entry in enumerate(model) if i not in indices]
+        elif operation < 0.75:
+            a, b = rng.randrange(len(model)), rng.randrange(len(model))
+            playlist.swap(a, b)
+            model[a], model[b] = model[b], model[a]
+        elif operation < 0.85:
+            index = rng.randrange(len(model))
+            playlist.duplicate(index)
+            model.append(model[index])
+        else:
+            name = rng.choice(list(durations))
+            durations[name] = rng.randint(0, 500)
+            if clips is not None:
+                clips.put(DIRECTORY, name, info(durations[name]))
+            updated = playlist.update_info(name, info(durations[name]), DIRECTORY)
+            assert updated == sum(1 for entry_name, _duration in model if entry_name == name)
+            model = [
+                (entry_name, durations[name] if entry_name == name else duration)
+                for entry_name, duration in model
+            ]
+        check(playlist, model)
+
+
+def test_detached_entries_keep_their_info():
+    clips = ClipStore()
+    clips.put(DIRECTORY, "a.bxx", info(50))
+    clips.put(DIRECTORY, "b.bxx", info(75))
+    playlist = Playlist(clips)
+    playlist.extend([("a.bxx", None, DIRECTORY), ("b.bxx", None, DIRECTORY), ("a.bxx", None, DIRECTORY)])
+    assert playlist.detach(DIRECTORY, {"a.bxx"}) == 2
+    clips.remove(DIRECTORY, "a.bxx")
+    check(playlist, [("a.bxx", 50), ("b.bxx", 75), ("a.bxx", 50)])
+    assert playlist[0].info == info(50)
+
+
+def test_snapshot_is_independent():
+    playlist = Playlist()
+    playlist.extend([("a.bxx", info(10)), ("b.bxx", None), ("c.bxx", info(30))])
+    copy = playlist.snapshot()
+    playlist.pop(0)
+    check(copy, [("a.bxx", 10), ("b.bxx", 0), ("c.bxx", 30)])
+    check(playlist, [("b.bxx", 0), ("c.bxx", 30)])
+
+
+def write_clip(path, duration):
+    path.write_text(
+        f"<Clip><VideoStream><Duration>{duration}</Duration></VideoStream></Clip>" + " " * duration,
+        encoding="utf-8",
+    )
+
+
+def test_reload_keeps_the_timeline_in_step(tmp_path):
+    """A reload drops a directory's clips from the store and prefetch stores changed ones again."""
+    directory = tmp_path / "clips"
+    directory.mkdir()
+    write_clip(directory / "a.bxx", 100)
+    write_clip(directory / "b.bxx", 200)
+    channels = ChannelSet(BxxInfoCache(), CatalogueIndex(str(tmp_path / "catalogue.db")))
+    channel = channels.add("A", str(directory))
+    channels.store(channel, [
+        (name, BxxInfoCache.signature(channel.path(name)), parse_bxx_file(channel.path(name)))
+        for name in channels.load("A")
+    ])
+    playlist = Playlist(channels.clips)
+    playlist.extend([("a.bxx", None, channel.directory_path), ("b.bxx", None, channel.directory_path)])
+    assert playlist.total_frames == 300
+
+    write_clip(directory / "a.bxx", 999)
+    playlist.detach(channel.directory_path)
+    stale = channels.load("A")
+    assert stale == ["a.bxx"]
+    assert playlist.reattach(channel.directory_path) == 0
+    check(playlist, [("a.bxx", 100), ("b.bxx", 200)])
+    assert playlist[1].clips is channels.clips  # Unchanged clips read the store again
+
+    path = channel.path("a.bxx")
+    channels.store(channel, [("a.bxx", BxxInfoCache.signature(path), parse_bxx_file(path))])
+    assert playlist.reattach(channel.directory_path, {"a.bxx"}) == 1
+    check(playlist, [("a.bxx", 999), ("b.bxx", 200)])
@@ -0,0 +1,64 @@
+import os
+import random
+
+import pytest
+
+from benchmarks import legacy
+from benchmarks.corpus import clip_document
+from vectorbox.bxx import parse_bxx_file
+from vectorbox.playlist import Playlist
+from vectorbox.plx import write_playlist
+
+SPECIAL = {
+    "Clip 003 & x.bxx": (
+        '<?xml version="1.0" encoding="utf-8"?>\n<Clip><Meta a="1">blah "q"</Meta><VideoStream>'
+        "<Duration>502</Duration><VideoStandard>1080i50</VideoStandard></VideoStream></Clip>"
+    ),
+    "Clip's ünïcode.bxx": "<Clip><VideoStream><Duration>7</Duration></VideoStream></Clip>",
+    "broken.bxx": "<Clip><VideoStream>",
+    "no streams.bxx": "<Clip/>",
+}
+
+
+def make_directory(tmp_path, count):
+    rng = random.Random(count)
+    directory = tmp_path / "clips"
+    directory.mkdir()
+    for n in range(count):
+        (directory / f"clip_{n:03d}.bxx").write_text(
+            clip_document(rng, (0, 3), 0.5, rng.choice([0, 200])), encoding="utf-8"
+        )
+    for name, text in SPECIAL.items():
+        (directory / name).write_text(text, encoding="utf-8")
+    return str(directory)
+
+
+def load_playlist(directory, file_names):
+    playlist = Playlist()
+    for name in file_names:
+        try:
+            info = parse_bxx_file(os.path.join(directory, name))
+        except Exception:
+            info = None
+        playlist.append(name, info)
+    return playlist
+
+
+@pytest.mark.parametrize("count", [0, 1, 40])
+def test_plx_matches_the_legacy_writer(tmp_path, count):
+    directory = make_directory(tmp_path, count)
+    file_names = sorted(os.listdir(directory))
+    file_names += file_names[:5]  # Repeated entries
+    expected_path = tmp_path / "legacy.plx"
+    actual_path = tmp_path / "actual.plx"
+    legacy.save_playlist(str(expected_path), directory, file_names)
+    write_playlist(str(actual_path), load_playlist(directory, file_names), directory)
+    assert actual_path.read_bytes() == expected_path.read_bytes()
+
+
+def test_empty_playlist_matches_the_legacy_writer(tmp_path):
+    expected_path = tmp_path / "legacy.plx"
+    actual_path = tmp_path / "actual.plx"
+    legacy.save_playlist(str(expected_path), str(tmp_path), [])
+    write_playlist(str(actual_path), Playlist(), str(tmp_path))
+    assert actual_path.read_bytes() == expected_path.read_bytes()
@@ -0,0 +1,44 @@
+from vectorbox.bxx import parse_bxx_file
+from vectorbox.cache import BxxInfoCache
+from vectorbox.prefetch import PrefetchJob
+from vectorbox.reader import LatencyFileSystem, MetadataReader
+
+
+def make_files(tmp_path, count):
+    paths = []
+    for n in range(count):
+        path = tmp_path / f"clip_{n:03d}.bxx"
+        path.write_text(
+            f"<Clip><VideoStream><Duration>{n + 1}</Duration></VideoStream></Clip>", encoding="utf-8"
+        )
+        paths.append(str(path))
+    return paths
+
+
+def drain(job):
+    job.wait(10)
+    assert job.finished
+    return dict(job.poll())
+
+
+def test_results_are_parsed_and_cached(tmp_path):
+    paths = make_files(tmp_path, 30)
+    broken = tmp_path / "broken.bxx"
+    broken.write_text("<Clip>", encoding="utf-8")
+    cache = BxxInfoCache()
+    job = PrefetchJob(paths + [str(broken)], cache).start()
+    results = drain(job)
+    assert results == {path: parse_bxx_file(path) for path in paths}
+    assert (job.done, job.total, job.failed) == (31, 31, 1)
+    assert all(cache.peek(path) == info for path, info in results.items())
+    assert job.poll() == []
+
+
+def test_cancel_stops_the_job(tmp_path):
+    paths = make_files(tmp_path, 60)
+    reader = MetadataReader(concurrency=2, fs=LatencyFileSystem(latency=0.01))
+    job = PrefetchJob(paths, None, reader).start()
+    job.cancel()
+    results = drain(job)
+    assert job.cancelled
+    assert len(results) < len(paths)
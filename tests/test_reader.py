@@ -0,0 +1,107 @@
+import random
+import threading
+
+import pytest
+
+from benchmarks.corpus import clip_document
+from vectorbox import bxx
+from vectorbox.bxx import parse_bxx_file
+from vectorbox.cache import BxxInfoCache
+from vectorbox.reader import LatencyFileSystem, MetadataReader
+
+
+def make_directory(tmp_path, count=24):
+    rng = random.Random(count)
+    paths = []
+    for n in range(count):
+        path = tmp_path / f"clip_{n:03d}.bxx"
+        path.write_text(clip_document(rng, (1, 3)), encoding="utf-8")
+        paths.append(str(path))
+    broken = tmp_path / "broken.bxx"
+    broken.write_text("<Clip><VideoStream>", encoding="utf-8")
+    return paths, str(broken), str(tmp_path / "missing.bxx")
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_read_all_matches_parse_bxx_file(tmp_path, concurrency):
+    paths, broken, missing = make_directory(tmp_path)
+    fs = LatencyFileSystem(latency=0.005)
+    reader = MetadataReader(concurrency=concurrency, fs=fs)
+    infos, errors = reader.read_all(paths + [broken, missing])
+    assert infos == {path: parse_bxx_file(path) for path in paths}
+    assert set(errors) == {broken, missing}
+    assert isinstance(errors[missing], OSError)
+    assert not isinstance(errors[broken], OSError)
+    # A stat and a read per file, and only the stat for the missing one
+    assert fs.calls == 2 * (len(paths) + 1) + 1
+
+
+def test_large_files_are_streamed(tmp_path, monkeypatch):
+    rng = random.Random(2)
+    small = tmp_path / "small.bxx"
+    large = tmp_path / "large.bxx"
+    small.write_text(clip_document(rng, (1, 3), 0.5, 4096), encoding="utf-8")
+    large.write_text(clip_document(rng, (1, 3), 0.5, bxx.STREAM_THRESHOLD), encoding="utf-8")
+    streamed = []
+    parse_stream = bxx._parse_stream
+
+    def spy_parse_stream(file):
+        streamed.append(len(file.getvalue()))
+        return parse_stream(file)
+
+    monkeypatch.setattr(bxx, "_parse_stream", spy_parse_stream)
+    infos, errors = MetadataReader(concurrency=2).read_all([str(small), str(large)])
+    assert not errors
+    assert infos == {str(path): bxx.parse_bxx_tree(path) for path in (small, large)}
+    assert streamed == [large.stat().st_size]
+
+
+def test_cache_skips_reads_of_unchanged_files(tmp_path):
+    paths, _broken, _missing = make_directory(tmp_path)
+    cache = BxxInfoCache()
+    fs = LatencyFileSystem(latency=0.001)
+    reader = MetadataReader(cache, concurrency=4, fs=fs)
+    first, _errors = reader.read_all(paths)
+    fs.calls = 0
+    second, errors = reader.read_all(paths)
+    assert second == first and not errors
+    assert fs.calls == len(paths)
+
+
+def test_reads_overlap_up_to_the_concurrency(tmp_path):
+    paths, _broken, _missing = make_directory(tmp_path)
+    in_flight = peak = 0
+    lock = threading.Lock()
+
+    class CountingFileSystem(LatencyFileSystem):
+        def read_bytes(self, path):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            try:
+                return super().read_bytes(path)
+            finally:
+                with lock:
+                    in_flight -= 1
+
+    reader = MetadataReader(concurrency=4, fs=CountingFileSystem(latency=0.02))
+    infos, _errors = reader.read_all(paths)
+    assert len(infos) == len(paths)
+    assert 1 < peak <= 4
+
+
+def test_cancel_stops_submitting_reads(tmp_path):
+    paths, _broken, _missing = make_directory(tmp_path)
+    cancel = threading.Event()
+    reader = MetadataReader(concurrency=2, fs=LatencyFileSystem(latency=0.005))
+    seen = []
+    for path, _info, _error in reader.read_many(paths, cancel):
+        seen.append(path)
+        cancel.set()
+    assert 1 <= len(seen) <= 2
+
+
+def test_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        MetadataReader(concurrency=0)
@@ -0,0 +1,64 @@
+import random
+
+from vectorbox.records import ClipStore
+
+
+def info(duration, standards=("PAL",), trim=(None, None)):
+    return {
+        "duration": duration,
+        "video_standards": list(standards),
+        "trim_in": trim[0],
+        "trim_out": trim[1],
+    }
+
+
+def test_store_matches_a_dict():
+    rng = random.Random(5)
+    store = ClipStore()
+    model = {}
+    for _ in range(3000):
+        key = (rng.choice(["/a", "/b", "/c"]), f"clip_{rng.randrange(60)}.bxx")
+        operation = rng.random()
+        if operation < 0.6:
+            trim_in = rng.choice([None, 0, 12])
+            value = info(
+                rng.randint(0, 10**6),
+                rng.choice([(), ("PAL",), ("1080i50", "PAL"), ("",)]),
+                (trim_in, None if trim_in is None else trim_in + rng.randint(1, 99)),
+            )
+            store.put(*key, value)
+            model[key] = value
+        elif operation < 0.9:
+            assert store.remove(*key) == (key in model)
+            model.pop(key, None)
+        else:
+            directory = key[0]
+            removed = [k for k in model if k[0] == directory]
+            assert store.remove_directory(directory) == len(removed)
+            for k in removed:
+                del model[k]
+        assert len(store) == len(model)
+    for key, value in model.items():
+        assert key in store
+        assert store.info(store.row(*key)) == value
+        assert store.duration(*key) == value["duration"]
+    # Freed rows are reused, so the columns never outgrow the clips ever stored at once
+    assert len(store.names) <= 3 * 60
+
+
+def test_total_reports_missing_clips():
+    store = ClipStore()
+    store.put("/a", "x.bxx", info(10))
+    store.put("/a", "y.bxx", info(20))
+    store.put("/b", "z.bxx", info(40))
+    assert store.total("/a", ["x.bxx", "y.bxx", "x.bxx", "z.bxx"]) == (40, ["z.bxx"])
+    assert store.total("/nowhere", ["x.bxx"]) == (0, ["x.bxx"])
+
+
+def test_standards_are_shared():
+    store = ClipStore()
+    first = store.put("/a", "x.bxx", info(10, ("1080i50", "")))
+    second = store.put("/a", "y.bxx", info(20, ("1080i50", "")))
+    assert store.standards(first) is store.standards(second)
+    assert store.standards_label(first) == "1080i50"
+    assert store.counters()["standard_sets"] == 1
@@ -0,0 +1,78 @@
+from vectorbox.cache import BxxInfoCache
+from vectorbox.playlist import Playlist
+from vectorbox.reader import LatencyFileSystem, MetadataReader
+from vectorbox.save import SaveJob
+
+
+def write_clip(path, duration):
+    path.write_text(
+        f"<Clip><VideoStream><Duration>{duration}</Duration>"
+        "<VideoStandard>PAL</VideoStandard></VideoStream></Clip>",
+        encoding="utf-8",
+    )
+
+
+def info(duration):
+    return {"duration": duration, "video_standards": ["PAL"], "trim_in": None, "trim_out": None}
+
+
+def make_playlist(tmp_path, names):
+    for number, name in enumerate(names):
+        write_clip(tmp_path / name, 100 * (number + 1))
+    playlist = Playlist()
+    playlist.extend((name, info(100 * (number + 1))) for number, name in enumerate(names))
+    return playlist
+
+
+def run(job):
+    job.start().wait(10)
+    assert job.finished
+    return job
+
+
+def test_saves_a_snapshot_with_current_metadata(tmp_path):
+    playlist = make_playlist(tmp_path, ["a.bxx", "b.bxx"])
+    write_clip(tmp_path / "b.bxx", 999)  # Changed after it was added
+    path = tmp_path / "day.plx"
+    job = SaveJob(str(path), playlist, str(tmp_path), BxxInfoCache())
+    playlist.clear()  # The job keeps its own copy
+    run(job)
+    assert (job.stage, job.error, job.fraction) == ("done", None, 1.0)
+    assert job.report.ok
+    text = path.read_text(encoding="utf-8")
+    assert text.count("<Item>") == 2
+    assert "<Duration>999</Duration>" in text
+    assert job.playlist.total_frames == 1099
+
+
+def test_unreadable_entries_are_left_out(tmp_path):
+    playlist = make_playlist(tmp_path, ["a.bxx"])
+    playlist.append("missing.bxx", None)
+    path = tmp_path / "day.plx"
+    run(SaveJob(str(path), playlist, str(tmp_path), None))
+    assert path.read_text(encoding="utf-8").count("<Item>") == 1
+
+    strict = run(SaveJob(str(tmp_path / "strict.plx"), playlist, str(tmp_path), None, strict=True))
+    assert strict.stage == "invalid"
+    assert [problem.file_name for problem in strict.report] == ["missing.bxx"]
+    assert not (tmp_path / "strict.plx").exists()
+
+
+def test_cancel_leaves_the_file_untouched(tmp_path):
+    playlist = make_playlist(tmp_path, [f"clip_{n}.bxx" for n in range(40)])
+    path = tmp_path / "day.plx"
+    path.write_text("old", encoding="utf-8")
+    reader = MetadataReader(concurrency=1, fs=LatencyFileSystem(latency=0.01))
+    job = SaveJob(str(path), playlist, str(tmp_path), None, reader).start()
+    job.cancel()
+    job.wait(10)
+    assert job.stage == "cancelled"
+    assert path.read_text(encoding="utf-8") == "old"
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.endswith(".bxx")) == ["day.plx"]
+
+
+def test_write_errors_are_reported(tmp_path):
+    playlist = make_playlist(tmp_path, ["a.bxx"])
+    job = run(SaveJob(str(tmp_path / "no" / "such" / "day.plx"), playlist, str(tmp_path), None))
+    assert job.stage == "failed"
+    assert isinstance(job.error, OSError)
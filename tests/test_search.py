@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from vectorbox import search
+from vectorbox.search import NameIndex
+
+
+def naive_find(names, text):
+    """The first name starting with, else containing, text in case-insensitive name order."""
+    text = text.lower()
+    ordered = sorted((name.lower(), name) for name in set(names))
+    for test in (str.startswith, str.__contains__):
+        for key, name in ordered:
+            if test(key, text):
+                return name
+    return None
+
+
+@pytest.mark.parametrize("slack", [3, search.REBUILD_SLACK])
+def test_find_matches_a_scan(monkeypatch, slack):
+    monkeypatch.setattr(search, "REBUILD_SLACK", slack)
+    rng = random.Random(5)
+    pool = [
+        f"{rng.choice(['Clip', 'news', 'SPOT', 'promo'])}_{rng.randrange(3000):04d}"
+        f"{rng.choice(['', ' HD', '_final'])}.bxx"
+        for _ in range(2000)
+    ]
+    listed = pool[:500]
+    index = NameIndex(listed)
+    for _ in range(6000):
+        operation = rng.random()
+        if operation < 0.35:
+            name = rng.choice(pool)
+            index.add(name)
+            listed.append(name)
+        elif operation < 0.7 and listed:
+            name = rng.choice(listed)
+            index.discard(name)
+            listed.remove(name)
+        else:
+            source = rng.choice(pool)
+            start = rng.randrange(len(source))
+            text = source[start:start + rng.randint(1, 7)]
+            assert index.find(text) == naive_find(listed, text), text
+        assert len(index) == len(set(listed))
+    assert all(name in index for name in listed)
+
+
+def test_duplicates_stay_until_the_last_one_goes():
+    index = NameIndex(["a.bxx", "a.bxx"])
+    index.discard("a.bxx")
+    assert index.find("a.b") == "a.bxx"
+    index.discard("a.bxx")
+    assert "a.bxx" not in index and index.find("a.b") is None
+    index.discard("a.bxx")  # Absent names are ignored
+
+
+def test_prefix_wins_over_substring():
+    index = NameIndex(["xnews.bxx", "News_2.bxx", "news_1.bxx"])
+    assert index.find("NEWS") == "news_1.bxx"
+    assert index.find_substring("s_2") == "News_2.bxx"
+    assert index.find("ws") == "news_1.bxx"
+    assert index.find_prefix("ws") is None
@@ -0,0 +1,50 @@
+import pytest
+
+from vectorbox import timecode
+from vectorbox.timecode import FRAME_RATES, format_duration, format_timecodes, parse_timecode
+
+# Around the minute and ten-minute boundaries where drop-frame labels are skipped
+FRAME_COUNTS = (
+    list(range(0, 4000))
+    + list(range(17970, 18030))
+    + list(range(35950, 36050))
+    + [107892, 107891, 215784, 10**7, 25 * 3600 * 99]
+)
+
+
+@pytest.mark.parametrize("name", list(FRAME_RATES))
+def test_timecodes_round_trip(name):
+    rate = FRAME_RATES[name]
+    for frames in FRAME_COUNTS:
+        label = format_duration(frames, rate)
+        assert parse_timecode(label, rate) == frames, label
+
+
+@pytest.mark.parametrize("name", list(FRAME_RATES))
+def test_labels_are_consecutive(name):
+    rate = FRAME_RATES[name]
+    labels = [format_duration(frames, rate) for frames in range(0, 40000)]
+    assert len(set(labels)) == len(labels)
+    assert labels == sorted(labels, key=lambda label: label.replace(";", ":"))
+
+
+@pytest.mark.parametrize("name", list(FRAME_RATES))
+def test_format_timecodes_matches_format_duration(name, monkeypatch):
+    rate = FRAME_RATES[name]
+    expected = [format_duration(frames, rate) for frames in FRAME_COUNTS]
+    assert format_timecodes(FRAME_COUNTS, rate) == expected
+    monkeypatch.setattr(timecode, "np", None)
+    assert format_timecodes(FRAME_COUNTS, rate) == expected
+
+
+@pytest.mark.parametrize("label", ["00:01:00;00", "00:01:00;01", "01:59:00;01"])
+def test_dropped_labels_are_rejected(label):
+    with pytest.raises(ValueError):
+        parse_timecode(label, "29.97DF")
+    assert parse_timecode("00:10:00;00", "29.97DF") == 17982
+
+
+@pytest.mark.parametrize("text", ["", "1:2", "00:60:00:00", "00:00:00:25", "aa:00:00:00"])
+def test_malformed_timecodes_are_rejected(text):
+    with pytest.raises(ValueError):
+        parse_timecode(text)
@@ -0,0 +1,87 @@
+import threading
+
+from vectorbox.playlist import Playlist
+from vectorbox.reader import LatencyFileSystem, MetadataReader
+from vectorbox.validate import (
+    MISSING,
+    PARSE_ERROR,
+    STANDARD_MISMATCH,
+    STANDARD_TIE,
+    ZERO_DURATION,
+    validate_playlist,
+)
+
+
+def write_clip(directory, name, duration, *standards):
+    streams = "".join(f"<VideoStandard>{standard}</VideoStandard>" for standard in standards)
+    (directory / name).write_text(
+        f"<Clip><VideoStream><Duration>{duration}</Duration>{streams}</VideoStream></Clip>",
+        encoding="utf-8",
+    )
+
+
+def playlist_of(*names):
+    playlist = Playlist()
+    playlist.extend((name, None) for name in names)
+    return playlist
+
+
+def kinds(report):
+    return [(problem.index, problem.file_name, problem.kind) for problem in report]
+
+
+def test_problems_are_collected_in_playlist_order(tmp_path):
+    write_clip(tmp_path, "a.bxx", 100, "PAL")
+    write_clip(tmp_path, "b.bxx", 100, "PAL")
+    write_clip(tmp_path, "ntsc.bxx", 100, "NTSC")
+    write_clip(tmp_path, "zero.bxx", 0, "PAL")
+    (tmp_path / "broken.bxx").write_text("<Clip><VideoStream>", encoding="utf-8")
+    playlist = playlist_of("a.bxx", "missing.bxx", "ntsc.bxx", "zero.bxx", "broken.bxx", "b.bxx")
+    report = validate_playlist(playlist, str(tmp_path))
+    assert report.standard == "PAL"
+    assert kinds(report) == [
+        (1, "missing.bxx", MISSING),
+        (2, "ntsc.bxx", STANDARD_MISMATCH),
+        (3, "zero.bxx", ZERO_DURATION),
+        (4, "broken.bxx", PARSE_ERROR),
+    ]
+    assert [problem.file_name for problem in report.left_out] == ["missing.bxx", "broken.bxx"]
+    assert report.summary() == (
+        "4 problems in 6 entries: 1 missing, 1 parse error, 1 zero duration, 1 mismatched VideoStandard"
+    )
+    assert report.lookup(str(tmp_path / "a.bxx"))["duration"] == 100
+
+
+def test_tied_standards_pick_no_winner(tmp_path):
+    write_clip(tmp_path, "pal.bxx", 100, "PAL")
+    write_clip(tmp_path, "ntsc.bxx", 100, "NTSC")
+    write_clip(tmp_path, "none.bxx", 100)
+    report = validate_playlist(playlist_of("pal.bxx", "ntsc.bxx", "none.bxx"), str(tmp_path))
+    assert report.standard is None
+    assert set(report.tied) == {"PAL", "NTSC"}
+    assert kinds(report) == [(0, "pal.bxx", STANDARD_TIE), (1, "ntsc.bxx", STANDARD_TIE)]
+    # Naming the standard settles it
+    report = validate_playlist(playlist_of("pal.bxx", "ntsc.bxx"), str(tmp_path), expected_standard="NTSC")
+    assert report.tied == ()
+    assert kinds(report) == [(0, "pal.bxx", STANDARD_MISMATCH)]
+
+
+def test_repeated_clips_are_read_once(tmp_path):
+    write_clip(tmp_path, "a.bxx", 100, "PAL")
+    write_clip(tmp_path, "b.bxx", 100, "PAL")
+    fs = LatencyFileSystem(latency=0)
+    progress = []
+    report = validate_playlist(
+        playlist_of("a.bxx", "b.bxx", "a.bxx", "a.bxx"), str(tmp_path), MetadataReader(fs=fs),
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    assert report.ok and report.entries == 4
+    assert fs.calls == 4  # A stat and a read for each of the two files
+    assert progress[-1] == (4, 4)
+
+
+def test_cancel_returns_none(tmp_path):
+    write_clip(tmp_path, "a.bxx", 100, "PAL")
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert validate_playlist(playlist_of("a.bxx"), str(tmp_path), cancel_event=cancel_event) is None
@@ -0,0 +1,95 @@
+import os
+import time
+
+import pytest
+
+from vectorbox import watch
+from vectorbox.cache import BxxInfoCache
+from vectorbox.index import scan_directory
+
+MOUNTS = """\
+/dev/sda1 / ext4 rw,relatime 0 0
+proc /proc proc rw,nosuid 0 0
+//server/clips /mnt/clips cifs rw,vers=3.0 0 0
+server:/export /mnt/clips/nfs nfs4 rw 0 0
+/dev/sdb1 /mnt/local\\040disk xfs rw 0 0
+"""
+
+
+def write_mounts(tmp_path):
+    path = tmp_path / "mounts"
+    path.write_text(MOUNTS, encoding="utf-8")
+    return str(path)
+
+
+def test_filesystem_type_uses_the_longest_mount_point(tmp_path):
+    mounts = write_mounts(tmp_path)
+    assert watch.filesystem_type("/mnt/clips/channel1", mounts) == "cifs"
+    assert watch.filesystem_type("/mnt/clips/nfs/channel2", mounts) == "nfs4"
+    assert watch.filesystem_type("/mnt/clipsx", mounts) == "ext4"
+    assert watch.filesystem_type("/mnt/local disk/clips", mounts) == "xfs"
+
+
+def test_network_paths(tmp_path):
+    mounts = write_mounts(tmp_path)
+    assert watch.is_network_path("/mnt/clips", mounts)
+    assert watch.is_network_path("/mnt/clips/nfs/a", mounts)
+    assert not watch.is_network_path("/home/clips", mounts)
+    assert not watch.is_network_path("/mnt/clips", os.path.join(str(tmp_path), "missing"))
+
+
+def test_network_directories_are_polled(tmp_path, monkeypatch):
+    monkeypatch.setattr(watch, "is_network_path", lambda path: True)
+    watcher = watch.DirectoryWatcher(str(tmp_path), cache=None, known={}, interval=0.05).start()
+    try:
+        watcher.wait(0.2)
+        assert watcher.backend == "poll"
+    finally:
+        watcher.stop()
+        watcher.wait()
+
+
+def write_clip(path, duration):
+    path.write_text(
+        f"<Clip><VideoStream><Duration>{duration}</Duration></VideoStream></Clip>", encoding="utf-8"
+    )
+
+
+def wait_for_changes(watcher, count, timeout=5.0):
+    """Returns the (kind, name, info duration) of the next count changes the watcher reports."""
+    changes = []
+    deadline = time.monotonic() + timeout
+    while len(changes) < count and time.monotonic() < deadline:
+        changes.extend(watcher.poll())
+        time.sleep(0.01)
+    return [(kind, name, info and info["duration"]) for kind, name, signature, info in changes]
+
+
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_changes_are_reported(tmp_path, use_inotify):
+    write_clip(tmp_path / "a.bxx", 1)
+    cache = BxxInfoCache()
+    watcher = watch.DirectoryWatcher(
+        str(tmp_path), cache, scan_directory(str(tmp_path)), interval=0.05, use_inotify=use_inotify
+    ).start()
+    try:
+        deadline = time.monotonic() + 5
+        while watcher.backend is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        if use_inotify and watcher.backend != "inotify":
+            pytest.skip("inotify is not available")
+        write_clip(tmp_path / "b.bxx", 20)
+        (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+        assert wait_for_changes(watcher, 1) == [("created", "b.bxx", 20)]
+        write_clip(tmp_path / "a.bxx", 300)
+        assert wait_for_changes(watcher, 1) == [("modified", "a.bxx", 300)]
+        assert cache.peek(str(tmp_path / "a.bxx"))["duration"] == 300
+        (tmp_path / "c.bxx").write_text("<Clip>", encoding="utf-8")
+        assert wait_for_changes(watcher, 1) == [("created", "c.bxx", None)]
+        os.remove(tmp_path / "b.bxx")
+        assert wait_for_changes(watcher, 1) == [("deleted", "b.bxx", None)]
+        time.sleep(0.2)
+        assert watcher.poll() == []  # Nothing is reported twice
+    finally:
+        watcher.stop()
+        watcher.wait()
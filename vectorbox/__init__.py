@@ -0,0 +1,91 @@
+"""Shared, GUI-independent building blocks for the VectorBox playlist tools.
+
+Nothing imported here pulls in tkinter, so the package can be used from batch
+jobs, benchmarks and worker processes as well as from the Tk front-ends. The
+Tk widgets and the editing logic shared by the front-ends live in
+vectorbox.tkwidgets and vectorbox.tkapp.
+"""
+from .bxx import parse_bxx_bytes, parse_bxx_file, parse_bxx_stream, parse_bxx_text, parse_bxx_tree
+from .cache import BxxInfoCache
+from .catalogue import Catalogue
+from .channels import Channel, ChannelSet
+from .fenwick import FenwickTree
+from .fill import FillResult, fill_duration
+from .index import CatalogueIndex, scan_directory
+from .playlist import Playlist, PlaylistItem, PlaylistView
+from .plx import SaveCancelled, is_valid_code, playlist_filename, write_playlist
+from .prefetch import PrefetchJob
+from .reader import (
+    LatencyFileSystem,
+    LocalFileSystem,
+    MetadataReader,
+    add_reader_arguments,
+    reader_from_arguments,
+)
+from .records import ClipStore
+from .save import SaveJob
+from .search import NameIndex
+from .settings import load_channels, load_settings, save_settings
+from .stats import Stats, add_profile_arguments, profile_session
+from .timecode import (
+    DEFAULT_FPS,
+    FRAME_RATES,
+    FrameRate,
+    add_frame_rate_argument,
+    format_duration,
+    format_timecodes,
+    frame_rate,
+    parse_timecode,
+)
+from .validate import ValidationReport, validate_playlist
+from .watch import DirectoryWatcher
+
+__all__ = [
+    "BxxInfoCache",
+    "Catalogue",
+    "CatalogueIndex",
+    "Channel",
+    "ChannelSet",
+    "ClipStore",
+    "DEFAULT_FPS",
+    "DirectoryWatcher",
+    "FRAME_RATES",
+    "FenwickTree",
+    "FillResult",
+    "FrameRate",
+    "LatencyFileSystem",
+    "LocalFileSystem",
+    "MetadataReader",
+    "NameIndex",
+    "Playlist",
+    "PlaylistItem",
+    "PlaylistView",
+    "PrefetchJob",
+    "SaveCancelled",
+    "SaveJob",
+    "Stats",
+    "ValidationReport",
+    "add_frame_rate_argument",
+    "add_profile_arguments",
+    "add_reader_arguments",
+    "fill_duration",
+    "format_duration",
+    "format_timecodes",
+    "frame_rate",
+    "is_valid_code",
+    "load_channels",
+    "load_settings",
+    "parse_bxx_bytes",
+    "parse_bxx_file",
+    "parse_bxx_stream",
+    "parse_bxx_text",
+    "parse_bxx_tree",
+    "parse_timecode",
+    "playlist_filename",
+    "profile_session",
+    "reader_from_arguments",
+    "save_settings",
+    "scan_directory",
+    "validate_playlist",
+    "write_playlist",
+]
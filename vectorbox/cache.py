@@ -0,0 +1,140 @@
+"""Metadata cache for .bxx files, validated against file size and mtime."""
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from .fsutil import atomic_write
+
+CACHE_VERSION = 2  # Bumped when the parsed info gains fields
+DEFAULT_MAX_ENTRIES = 50000
+
+
+class BxxInfoCache:
+    """LRU cache of parsed .bxx info keyed by path and (size, mtime_ns).
+
+    An entry is only served while the file on disk still has the size and
+    modification time it had when it was parsed. Entries can be persisted to
+    a JSON store so that a restart does not re-parse the whole library.
+
+    The cache may be shared between threads; parsing happens outside the lock.
+    """
+
+    def __init__(self, store_path=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.store_path = store_path
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # path -> ((size, mtime_ns), info)
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0  # get() calls served from the cache
+        self.misses = 0  # get() calls that had to parse
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        return path in self._entries
+
+    @staticmethod
+    def signature(path):
+        """Returns the (size, mtime_ns) pair used to validate an entry."""
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+
+    def get(self, path, parse):
+        """Returns the info for path, calling parse(path) on a miss or if stale.
+
+        Errors from os.stat or from parse are propagated and nothing is cached.
+        """
+        signature = self.signature(path)
+        info = self.lookup(path, signature)
+        if info is None:
+            info = parse(path)
+            self.put(path, signature, info)
+        return info
+
+    def lookup(self, path, signature):
+        """Returns the cached info for path if it was parsed at signature, else None.
+
+        For callers that stat the file themselves; counts as a hit or miss.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == tuple(signature):
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return None
+
+    def counters(self):
+        """Returns the hit / miss counts and the number of entries."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def peek(self, path):
+        """Returns the cached info for path without checking the file, or None.
+
+        Meant for display purposes, where an entry refreshed by the next get()
+        is good enough and a stat per row would be too slow.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+        return entry[1] if entry is not None else None
+
+    def entry(self, path):
+        """Returns the cached (signature, info) pair for path without checking the file, or None."""
+        with self._lock:
+            return self._entries.get(path)
+
+    def put(self, path, signature, info):
+        """Stores info for path, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[path] = (tuple(signature), info)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def invalidate(self, path):
+        """Drops the entry for path, if any."""
+        with self._lock:
+            if self._entries.pop(path, None) is not None:
+                self._dirty = True
+
+    def clear(self):
+        """Drops every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    # --- Persistence ---
+    def load(self):
+        """Loads entries from the store file. A missing or corrupt store is ignored."""
+        if not self.store_path:
+            return
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return
+            for path, size, mtime_ns, info in data["entries"]:
+                self._entries[path] = ((size, mtime_ns), info)
+        except (OSError, ValueError, KeyError, TypeError):
+            self._entries.clear()
+            return
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = False
+
+    def save(self):
+        """Writes the entries to the store file if anything changed since the last load/save."""
+        if not self.store_path or not self._dirty:
+            return
+        with self._lock:
+            entries = [
+                [path, signature[0], signature[1], info]
+                for path, (signature, info) in self._entries.items()
+            ]
+        with atomic_write(self.store_path) as f:
+            json.dump({"version": CACHE_VERSION, "entries": entries}, f)
+        self._dirty = False
@@ -0,0 +1,167 @@
+"""Model of the clips listed in a load directory."""
+import os
+
+from .search import NameIndex
+from .timecode import DEFAULT_FPS, format_duration
+
+
+class Catalogue:
+    """The ordered clip names shown in the left list, with type-ahead and cached metadata.
+
+    This is the Python-side model behind the virtualized catalogue view:
+    the widget only asks for the rows it displays, so nothing here walks
+    the whole list on scroll, search or theme changes. Durations and
+    standards come from a ClipStore when one is given, falling back to
+    the metadata cache for clips it does not hold yet. Rows are looked up
+    by name in a dict, rebuilt on the first lookup after rows have moved.
+    """
+
+    def __init__(self, cache=None, fps=DEFAULT_FPS, clips=None):
+        self.cache = cache
+        self.fps = fps
+        self.clips = clips
+        self.directory_path = ""
+        self.names = []
+        self.index = NameIndex()
+        self._rows = {}  # name -> first row, or None until rebuilt by row_of()
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, row):
+        return self.names[row]
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def load(self, directory_path, names):
+        """Replaces the listing, rebuilding the type-ahead index."""
+        self.directory_path = directory_path
+        self.names = list(names)
+        self.index = NameIndex(self.names)
+        self._rows = None
+
+    def path(self, row):
+        """Returns the full path of the clip at row."""
+        return os.path.join(self.directory_path, self.names[row])
+
+    def append(self, name):
+        """Adds a clip at the end of the list."""
+        self.names.append(name)
+        self.index.add(name)
+        if self._rows is not None:
+            self._rows.setdefault(name, len(self.names) - 1)
+
+    def extend(self, names):
+        """Adds clips at the end of the list."""
+        for name in names:
+            self.append(name)
+
+    def pop(self, row):
+        """Removes and returns the clip name at row."""
+        name = self.names.pop(row)
+        self.index.discard(name)
+        self._rows = None
+        return name
+
+    def pop_many(self, rows):
+        """Removes the clips at rows in one pass and returns their names in list order."""
+        doomed = set(rows)
+        removed, kept = [], []
+        for row, name in enumerate(self.names):
+            (removed if row in doomed else kept).append(name)
+        self.names = kept
+        for name in removed:
+            self.index.discard(name)
+        self._rows = None
+        return removed
+
+    def remove(self, name):
+        """Removes a clip by name; returns its former row, or None if it is not listed."""
+        row = self.row_of(name)
+        if row is not None:
+            self.pop(row)
+        return row
+
+    def remove_many(self, names):
+        """Removes clips by name in one pass and returns the names that were listed."""
+        doomed = {name for name in names if name in self.index}
+        if not doomed:
+            return []
+        return self.pop_many(row for row, name in enumerate(self.names) if name in doomed)
+
+    def row_of(self, name):
+        """Returns the first row of a clip by name, or None if it is not listed."""
+        if self._rows is None:
+            rows = {}
+            for row, listed in enumerate(self.names):
+                rows.setdefault(listed, row)
+            self._rows = rows
+        return self._rows.get(name)
+
+    def clear(self):
+        """Removes every clip, keeping the directory."""
+        self.names = []
+        self.index = NameIndex()
+        self._rows = {}
+
+    def find(self, text):
+        """Returns the row of the first clip starting with, else containing, text; or None."""
+        name = self.index.find(text)
+        if name is None:
+            return None
+        return self.row_of(name)
+
+    def clip(self, row):
+        """Returns the ClipStore row of the clip at row, or None if the store does not hold it."""
+        if self.clips is None:
+            return None
+        return self.clips.row(self.directory_path, self.names[row])
+
+    def info(self, row):
+        """Returns the metadata of the clip at row, or None if not parsed yet."""
+        clip = self.clip(row)
+        if clip is not None:
+            return self.clips.info(clip)
+        if self.cache is None:
+            return None
+        return self.cache.peek(self.path(row))
+
+    def duration(self, row):
+        """Returns the duration in frames of the clip at row, or None if not parsed yet."""
+        clip = self.clip(row)
+        if clip is not None:
+            return self.clips.durations[clip]
+        info = self.info(row)
+        return info["duration"] if info is not None else None
+
+    def total(self, rows):
+        """Returns (total frames, number of clips not parsed yet) for the clips at rows.
+
+        Durations come from the store or the metadata cache only; nothing is
+        read from disk, so it is safe to call on every selection change.
+        """
+        total = 0
+        pending = 0
+        for row in rows:
+            duration = self.duration(row)
+            if duration is None:
+                pending += 1
+            else:
+                total += duration
+        return total, pending
+
+    def row(self, row):
+        """Returns the (name, duration, video standards) column texts for row."""
+        clip = self.clip(row)
+        if clip is not None:
+            return (
+                self.names[row],
+                format_duration(self.clips.durations[clip], fps=self.fps),
+                self.clips.standards_label(clip),
+            )
+        info = self.info(row)
+        if info is None:
+            return self.names[row], "", ""
+        standards = ", ".join(s for s in info["video_standards"] if s)
+        return self.names[row], format_duration(info["duration"], fps=self.fps), standards
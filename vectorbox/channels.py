@@ -0,0 +1,170 @@
+"""Catalogues of several load directories (channels) kept side by side."""
+import os
+
+from .catalogue import Catalogue
+from .index import scan_directory
+from .records import ClipStore
+from .timecode import DEFAULT_FPS
+
+
+class Channel:
+    """One load directory and its catalogue, loaded once and then kept in memory."""
+
+    def __init__(self, name, directory_path, cache=None, fps=DEFAULT_FPS, clips=None):
+        self.name = name
+        self.directory_path = os.path.normpath(directory_path)
+        self.catalogue = Catalogue(cache, fps, clips)
+        self.catalogue.directory_path = self.directory_path
+        self.signatures = {}  # (size, mtime_ns) of the directory's files, as last seen
+        self.loaded = False
+
+    def __repr__(self):
+        return f"Channel({self.name!r}, {self.directory_path!r})"
+
+    def path(self, file_name):
+        return os.path.join(self.directory_path, file_name)
+
+
+class ChannelSet:
+    """The channels of a session, sharing one metadata cache and one catalogue index.
+
+    The cache is keyed by full path and the index by (directory, file name),
+    so every channel keeps its own incremental state in them. A channel is
+    scanned by load() once; switching to it afterwards only changes which
+    catalogue is active. find() searches the type-ahead indexes of all
+    loaded channels, the active one first.
+
+    The parsed info of every loaded channel is kept in one compact
+    ClipStore, clips, which the catalogues (and a Playlist given it) read
+    from; the metadata cache only holds files parsed since and not stored
+    yet. Feed new results through store() and discard() so the store stays
+    in step with the index.
+    """
+
+    def __init__(self, cache=None, index=None, fps=DEFAULT_FPS):
+        self.cache = cache
+        self.index = index
+        self.fps = fps
+        self.clips = ClipStore()
+        self.channels = {}  # name -> Channel, in the order they were added
+        self.active = None
+
+    def __len__(self):
+        return len(self.channels)
+
+    def __iter__(self):
+        return iter(self.channels.values())
+
+    def __getitem__(self, name):
+        return self.channels[name]
+
+    def __contains__(self, name):
+        return name in self.channels
+
+    def names(self):
+        return list(self.channels)
+
+    def add(self, name, directory_path):
+        """Adds a channel, or points an existing one at a new directory; returns it."""
+        channel = self.channels.get(name)
+        if channel is not None and channel.directory_path == os.path.normpath(directory_path):
+            return channel
+        if channel is not None:
+            self.clips.remove_directory(channel.directory_path)
+        channel = Channel(name, directory_path, self.cache, self.fps, self.clips)
+        self.channels[name] = channel
+        if self.active is not None and self.active.name == name:
+            self.active = channel
+        return channel
+
+    def remove(self, name):
+        """Removes a channel and returns it; the active channel falls back to the first one left."""
+        channel = self.channels.pop(name)
+        self.clips.remove_directory(channel.directory_path)
+        if self.active is channel:
+            self.active = next(iter(self.channels.values()), None)
+        return channel
+
+    def switch(self, name):
+        """Makes a channel the active one and returns it, without touching the disk."""
+        self.active = self.channels[name]
+        return self.active
+
+    def channel_for(self, directory_path):
+        """Returns the channel of a load directory, or None."""
+        directory_path = os.path.normpath(directory_path)
+        for channel in self.channels.values():
+            if channel.directory_path == directory_path:
+                return channel
+        return None
+
+    def load(self, name):
+        """Lists a channel's directory, reconciled with the catalogue index.
+
+        The directory's clips leave the clip store first (detach playlist
+        entries of the directory before, and reattach them after), then
+        unchanged files get their info from the index into it; returns the
+        names of new or modified files, which still need parsing.
+        Raises FileNotFoundError if the directory does not exist.
+        """
+        channel = self.channels[name]
+        directory_path = channel.directory_path
+        if self.index is not None:
+            fresh, stale = self.index.sync(directory_path)
+        else:
+            fresh, stale = {}, scan_directory(directory_path)
+        self.clips.remove_directory(directory_path)
+        self.clips.put_many(
+            directory_path, ((file_name, info) for file_name, (signature, info) in fresh.items())
+        )
+        channel.signatures = dict(stale)
+        channel.signatures.update(
+            (file_name, signature) for file_name, (signature, info) in fresh.items()
+        )
+        channel.catalogue.load(directory_path, sorted(channel.signatures, key=str.lower))
+        channel.loaded = True
+        return sorted(stale, key=str.lower)
+
+    def store(self, channel, entries):
+        """Records freshly parsed (file name, signature, info) entries of a Channel.
+
+        They go to the clip store and, when there is one, the catalogue index,
+        and their info dicts leave the metadata cache, as the store serves
+        them from then on. Entries of a channel that has since been replaced
+        are filed under its own directory, never under the directory now
+        carrying its name.
+        """
+        entries = list(entries)
+        self.clips.put_many(
+            channel.directory_path, ((file_name, info) for file_name, signature, info in entries)
+        )
+        if self.index is not None:
+            self.index.store(channel.directory_path, entries)
+        if self.cache is not None:
+            for file_name, signature, info in entries:
+                self.cache.invalidate(channel.path(file_name))
+
+    def discard(self, channel, file_names):
+        """Forgets deleted files of a Channel in the clip store and the catalogue index."""
+        file_names = list(file_names)
+        for file_name in file_names:
+            self.clips.remove(channel.directory_path, file_name)
+        if self.index is not None:
+            self.index.discard(channel.directory_path, file_names)
+
+    def find(self, text):
+        """Returns (channel, row) of the first clip starting with, else containing, text; or None.
+
+        Prefix matches in any channel win over substring matches; within
+        each kind the active channel is searched first.
+        """
+        channels = [channel for channel in self.channels.values() if channel.loaded]
+        if self.active in channels:
+            channels.remove(self.active)
+            channels.insert(0, self.active)
+        for lookup in ("find_prefix", "find_substring"):
+            for channel in channels:
+                file_name = getattr(channel.catalogue.index, lookup)(text)
+                if file_name is not None:
+                    return channel, channel.catalogue.row_of(file_name)
+        return None
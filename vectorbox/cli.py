@@ -0,0 +1,202 @@
+"""Command-line batch playlist generator.
+
+Examples::
+
+    python -m vectorbox --title 16-10 --code 0001 clip_a.bxx clip_b.bxx
+    python -m vectorbox --code 0001 --jobs 8 monday.txt tuesday.csv ...
+    python -m vectorbox --manifest --check playlists/*_????.txt
+
+A manifest is a text file with one clip name per line (blank lines and lines
+starting with # are ignored) or a .csv file whose first column holds the clip
+names. When a manifest is named like its playlist, e.g. ``Monday_0001.txt``,
+the title and code are taken from its name.
+
+Every playlist's clips are validated before it is written (missing files,
+parse errors, zero durations, mismatched VideoStandard). Problems are
+reported on stderr; --strict skips writing a playlist that has any, and
+--check only validates.
+"""
+import argparse
+import csv
+import datetime
+import os
+import re
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .playlist import Playlist
+from .plx import is_valid_code, playlist_filename, write_playlist
+from .reader import DEFAULT_CONCURRENCY, MetadataReader
+from .settings import CONFIG_FILE, load_settings
+from .timecode import DEFAULT_FPS, add_frame_rate_argument
+from .validate import validate_playlist
+
+BXX_EXTENSIONS = (".bxx", ".BXX")
+CSV_HEADER_NAMES = ("file", "filename", "clip", "name")
+MANIFEST_NAME_RE = re.compile(r"^(?P<title>.+)_(?P<code>\d{4})$")
+
+PlaylistJob = namedtuple("PlaylistJob", "title code clips source")
+
+
+def clip_file_name(name):
+    """Returns the .bxx file name for a clip name given with or without extension."""
+    name = name.strip()
+    return name if name.endswith(BXX_EXTENSIONS) else f"{name}.bxx"
+
+
+def read_manifest(manifest_path):
+    """Returns the ordered clip file names listed in a text or CSV manifest."""
+    clips = []
+    with open(manifest_path, "r", encoding="utf-8", newline="") as f:
+        if manifest_path.lower().endswith(".csv"):
+            for row_number, row in enumerate(csv.reader(f)):
+                if not row or not row[0].strip():
+                    continue
+                if row_number == 0 and row[0].strip().lower() in CSV_HEADER_NAMES:
+                    continue
+                clips.append(clip_file_name(row[0]))
+        else:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    clips.append(clip_file_name(line))
+    return clips
+
+
+def manifest_job(manifest_path, title=None, code=None):
+    """Builds the job for a manifest, taking title and code from its name when not given."""
+    stem = os.path.splitext(os.path.basename(manifest_path))[0]
+    match = MANIFEST_NAME_RE.match(stem)
+    if title is None:
+        title = match.group("title") if match else stem
+    if code is None and match:
+        code = match.group("code")
+    return PlaylistJob(title, code, read_manifest(manifest_path), manifest_path)
+
+
+def generate_playlist(job, load_dir, save_dir, reader=None, write=True, strict=False,
+                      expected_standard=None, fps=DEFAULT_FPS):
+    """Validates the job's clips and writes its .plx file.
+
+    The clips are read concurrently by reader (a MetadataReader) and
+    checked with validate_playlist(); clips that could not be read are
+    left out, as save_playlist does. Nothing is written when write is
+    False, or when strict is True and the report has any problem.
+    fps is the frame rate written to the playlist.
+    Returns (playlist_path or None if nothing was written, report).
+    """
+    playlist = Playlist()
+    playlist.extend((file_name, None) for file_name in job.clips)
+    report = validate_playlist(playlist, load_dir, reader, expected_standard)
+    if not write or (strict and not report.ok):
+        return None, report
+    playlist_path = os.path.join(save_dir, playlist_filename(job.title, job.code))
+    playlist.refresh(report.lookup, load_dir)
+    write_playlist(playlist_path, playlist, load_dir, fps=fps)
+    return playlist_path, report
+
+
+def _run_job(args):
+    job, load_dir, save_dir, concurrency, options = args
+    try:
+        reader = MetadataReader(concurrency=concurrency)
+        return job, generate_playlist(job, load_dir, save_dir, reader, **options), None
+    except Exception as e:
+        return job, None, e
+
+
+def run_jobs(jobs, load_dir, save_dir, workers=None, concurrency=DEFAULT_CONCURRENCY, **options):
+    """Generates every job, in a process pool when there is more than one.
+
+    concurrency bounds the metadata reads of each job; options are passed
+    on to generate_playlist(). Yields (job, (playlist_path, report), error)
+    for each job in the order given, as the pool finishes them.
+    """
+    tasks = [(job, load_dir, save_dir, concurrency, options) for job in jobs]
+    if len(tasks) <= 1 or workers == 1:
+        yield from map(_run_job, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_run_job, tasks)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m vectorbox",
+        description="Generate VectorBox .plx playlists from clip lists or manifests.",
+    )
+    parser.add_argument("items", nargs="*", metavar="CLIP_OR_MANIFEST",
+                        help="clip names for a single playlist, or manifest files with --manifest")
+    parser.add_argument("-m", "--manifest", action="store_true",
+                        help="treat the positional arguments as manifests, one playlist each")
+    parser.add_argument("-t", "--title", help="list title (default: today's dd-mm, or the manifest name)")
+    parser.add_argument("-c", "--code", help="4-digit playlist code")
+    parser.add_argument("-l", "--load-dir", help="directory holding the .bxx files (default: load_dir from config)")
+    parser.add_argument("-s", "--save-dir", help="directory the .plx files are written to (default: save_dir from config)")
+    parser.add_argument("--config", default=CONFIG_FILE, help="settings file (default: %(default)s)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes for many manifests (default: CPU count)")
+    parser.add_argument("--read-concurrency", type=int, default=DEFAULT_CONCURRENCY, metavar="N",
+                        help="metadata reads kept in flight per playlist (default: %(default)s)")
+    parser.add_argument("--check", action="store_true",
+                        help="only validate the clips and report problems; write nothing")
+    parser.add_argument("--strict", action="store_true",
+                        help="do not write a playlist whose clips have any problem")
+    parser.add_argument("--standard", metavar="VIDEO_STANDARD",
+                        help="VideoStandard every clip must have (default: the one most clips use)")
+    add_frame_rate_argument(parser)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    config_load_dir, config_save_dir = load_settings(args.config)
+    load_dir = args.load_dir or config_load_dir
+    save_dir = args.save_dir or config_save_dir
+    if not load_dir:
+        parser.error("no load directory given and none set in the config")
+    if not args.items:
+        parser.error("no clips or manifests given")
+
+    failed = 0
+    if args.manifest:
+        jobs = []
+        for path in args.items:
+            try:
+                jobs.append(manifest_job(path, args.title, args.code))
+            except (OSError, UnicodeDecodeError, csv.Error) as e:
+                failed += 1
+                print(f"{path}: failed to read manifest: {e}", file=sys.stderr)
+    else:
+        title = args.title or datetime.datetime.now().strftime("%d-%m")
+        jobs = [PlaylistJob(title, args.code, [clip_file_name(c) for c in args.items], "<command line>")]
+
+    for job in jobs:
+        if not args.check and not is_valid_code(job.code):
+            parser.error(f"{job.source}: a 4-digit --code is required")
+
+    results = run_jobs(
+        jobs, load_dir, save_dir, args.jobs, args.read_concurrency,
+        write=not args.check, strict=args.strict, expected_standard=args.standard,
+        fps=args.frame_rate,
+    )
+    for job, result, error in results:
+        if error is not None:
+            failed += 1
+            print(f"{job.source}: failed to save playlist: {error}", file=sys.stderr)
+            continue
+        playlist_path, report = result
+        for line in report.lines():
+            print(f"{job.source}: {line}", file=sys.stderr)
+        if args.check:
+            print(f"{job.source}: {report.summary()}")
+            failed += not report.ok
+        elif playlist_path is None:
+            failed += 1
+            print(f"{job.source}: not saved: {report.summary()}", file=sys.stderr)
+        else:
+            print(playlist_path)
+    return 1 if failed else 0
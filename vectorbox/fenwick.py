@@ -0,0 +1,100 @@
+"""Fenwick (binary indexed) tree of non-negative integers, for prefix sums."""
+
+
+class FenwickTree:
+    """Prefix sums over a growable sequence of values.
+
+    add(), append() and prefix_sum() are O(log n); find() turns a running
+    offset back into a position with a binary descent of the tree instead
+    of a scan. Values must stay non-negative for find() to be meaningful.
+    """
+
+    def __init__(self, values=()):
+        self._values = []
+        self._tree = [0]  # 1-based; _tree[i] sums values (i - lowbit(i), i]
+        self.build(values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def build(self, values):
+        """Replaces the contents in O(n)."""
+        self._values = list(values)
+        tree = [0] + self._values
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def append(self, value):
+        """Adds a value at the end."""
+        i = len(self._tree)
+        # The new node covers (i - lowbit(i), i]: value plus the sums just before it
+        node = value + self.prefix_sum(i - 1) - self.prefix_sum(i - (i & -i))
+        self._values.append(value)
+        self._tree.append(node)
+
+    def pop(self):
+        """Removes and returns the last value; no other node covers it."""
+        self._tree.pop()
+        return self._values.pop()
+
+    def add(self, index, delta):
+        """Adds delta to the value at index."""
+        self._values[index] += delta
+        tree = self._tree
+        i = index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def set(self, index, value):
+        """Replaces the value at index."""
+        delta = value - self._values[index]
+        if delta:
+            self.add(index, delta)
+
+    def prefix_sum(self, count):
+        """Returns the sum of the first count values."""
+        tree = self._tree
+        total = 0
+        i = count
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def total(self):
+        return self.prefix_sum(len(self._values))
+
+    def find(self, offset):
+        """Returns the index of the value spanning offset, i.e. the largest i with prefix_sum(i) <= offset.
+
+        Zero values are skipped over; an offset at or past the total
+        returns len(self).
+        """
+        tree = self._tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = position + step
+            if nxt < len(tree) and tree[nxt] <= offset:
+                position = nxt
+                offset -= tree[nxt]
+            step >>= 1
+        return position
+
+    def copy(self):
+        other = FenwickTree()
+        other._values = list(self._values)
+        other._tree = list(self._tree)
+        return other
+
+    def clear(self):
+        self._values = []
+        self._tree = [0]
@@ -0,0 +1,145 @@
+"""Picking clips that fill a target duration, as a subset-sum problem.
+
+The solver works on frame counts only, so it can run on the durations
+already in the metadata cache or catalogue index. Reachable totals are
+tracked as the bits of a Python int: adding a clip is one shift and one
+or, which keeps thousands of clips over a programme-length target fast.
+"""
+from collections import namedtuple
+
+ORDERS = ("catalogue", "longest", "shortest")
+MAX_DP_BITS = 1 << 28  # Bits of reachable-set history kept for reconstruction (32 MiB)
+
+FillResult = namedtuple("FillResult", "names total_frames")
+
+
+def _parts(durations):
+    """Splits {duration: count} into (duration, copies) parts by binary splitting."""
+    parts = []
+    for duration, count in durations.items():
+        copies = 1
+        while count > 0:
+            take = min(copies, count)
+            parts.append((duration, take))
+            count -= take
+            copies *= 2
+    return parts
+
+
+def _subset_sum(durations, goal, low, high):
+    """Returns ({duration: count}, total) with the total in [low, high] closest to goal, or None.
+
+    durations maps a duration to how many clips have it. Only totals up
+    to high are tracked, and the search stops as soon as goal is reached.
+    """
+    parts = _parts(durations)
+    mask = (1 << (high + 1)) - 1
+    reachable = 1
+    history = []  # Reachable totals before each part, for reconstruction
+    for duration, copies in parts:
+        history.append(reachable)
+        reachable = (reachable | (reachable << (duration * copies))) & mask
+        if (reachable >> goal) & 1:
+            break
+    hits = reachable & ~((1 << low) - 1)
+    if not hits:
+        return None
+    below = hits & ((1 << (goal + 1)) - 1)
+    above = hits >> goal
+    candidates = []
+    if below:
+        candidates.append(below.bit_length() - 1)
+    if above:
+        candidates.append(goal + (above & -above).bit_length() - 1)
+    best = min(candidates, key=lambda total: (abs(total - goal), total))
+
+    counts = {}
+    remaining = best
+    for (duration, copies), before in zip(reversed(parts[:len(history)]), reversed(history)):
+        if not (before >> remaining) & 1:
+            remaining -= duration * copies
+            counts[duration] = counts.get(duration, 0) + copies
+    return counts, best
+
+
+def fill_duration(clips, target_frames, tolerance=0, must_include=(), first=None,
+                  last=None, order="catalogue", max_bits=MAX_DP_BITS):
+    """Picks clips whose durations add up to target_frames, give or take tolerance.
+
+    clips is an iterable of (name, duration in frames) in catalogue order;
+    clips without a positive duration are never picked. Every name in
+    must_include is used, first opens the result and last closes it. The
+    other picked clips follow order: "catalogue" keeps their input order,
+    "longest" and "shortest" sort them by duration. Each clip is used at
+    most once.
+
+    When the exact target is not reachable the total closest to it within
+    the tolerance wins. Returns a FillResult(names, total_frames), or None
+    if no combination lands within the tolerance. Raises ValueError for
+    an unknown order or a required clip that is not in clips.
+
+    Targets too long to solve within max_bits of bookkeeping are first
+    brought down by taking the longest clips greedily.
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order {order!r}: expected one of {ORDERS}")
+    clips = list(clips)
+    durations = dict(clips)
+    required = list(dict.fromkeys(
+        [name for name in (first,) if name is not None]
+        + list(must_include)
+        + [name for name in (last,) if name is not None]
+    ))
+    for name in required:
+        if name not in durations:
+            raise ValueError(f"Required clip {name!r} is not available")
+
+    required_set = set(required)
+    fixed = sum(durations[name] for name in required)
+    goal = target_frames - fixed
+    low = max(goal - tolerance, 0)
+    high = goal + tolerance
+    if high < 0:
+        return None
+
+    pool = [(name, duration) for name, duration in clips if duration > 0 and name not in required_set]
+    picked = []
+    if high > max_bits // max(len(pool), 1) - 1:
+        # Greedily take the longest clips until the rest fits the bookkeeping budget
+        for name, duration in sorted(pool, key=lambda clip: clip[1], reverse=True):
+            if high <= max_bits // max(len(pool) - len(picked), 1) - 1:
+                break
+            if duration <= low:
+                picked.append(name)
+                goal -= duration
+                low -= duration
+                high -= duration
+        taken = set(picked)
+        pool = [(name, duration) for name, duration in pool if name not in taken]
+        if high > max_bits // max(len(pool), 1) - 1:
+            return None
+
+    counts = {}
+    for name, duration in pool:
+        if duration <= high:
+            counts[duration] = counts.get(duration, 0) + 1
+    solved = _subset_sum(counts, max(goal, 0), low, high)
+    if solved is None:
+        return None
+    counts, _total = solved
+    for name, duration in pool:
+        if counts.get(duration):
+            counts[duration] -= 1
+            picked.append(name)
+
+    rank = {name: position for position, (name, _duration) in enumerate(clips)}
+    middle = [name for name in required if name not in (first, last)] + picked
+    if order == "catalogue":
+        middle.sort(key=rank.__getitem__)
+    else:
+        sign = -1 if order == "longest" else 1
+        middle.sort(key=lambda name: (sign * durations[name], rank[name]))
+    names = ([first] if first is not None else []) + middle
+    if last is not None and last != first:
+        names.append(last)
+    return FillResult(names, fixed + sum(durations[name] for name in picked))
@@ -0,0 +1,71 @@
+"""Filesystem helpers."""
+import contextlib
+import os
+import stat
+import tempfile
+
+NEW_FILE_MODE = 0o644  # Permissions of a file atomic_write() creates
+
+
+def _target_mode(path):
+    """Returns the permission bits of the file at path, or NEW_FILE_MODE if there is none."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return NEW_FILE_MODE
+
+
+def _fsync_directory(directory):
+    """Flushes a directory entry change (a rename) to disk, where the platform allows it."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # e.g. Windows, where directories cannot be opened
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode="w", encoding="utf-8", buffering=-1):
+    """Opens a temporary file next to path and moves it over path once complete.
+
+    The data is written to a hidden temp file in the same directory, flushed
+    and fsync'd, then renamed into place with os.replace, so readers (such
+    as a playout server watching the directory) only ever see the old file
+    or the complete new one. If the block raises, the temp file is removed
+    and path is left untouched. The new file keeps the permissions of the
+    one it replaces, or gets NEW_FILE_MODE.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        # mkstemp creates files as 0600; the process umask is left alone, as
+        # reading it means setting it for every thread
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, _target_mode(path))
+        else:
+            os.chmod(tmp_path, _target_mode(path))
+        if "b" in mode:
+            f = os.fdopen(fd, mode, buffering=buffering)
+        else:
+            f = os.fdopen(fd, mode, buffering=buffering, encoding=encoding)
+        fd = None  # Closed by f from here on; the number may be reused once it is
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(fd)
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    _fsync_directory(directory)
@@ -0,0 +1,184 @@
+"""On-disk catalogue index of load directories, stored in SQLite.
+
+The index keeps one row per .bxx file with the size and mtime it had when
+it was parsed, so reopening a directory only needs an os.scandir pass and
+a single query; just the new or changed files have to be parsed again.
+"""
+import json
+import os
+import sqlite3
+
+from .bxx import parse_bxx_file
+
+INDEX_FILE = "catalogue.db"  # Kept next to config.txt
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clips (
+    directory TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    video_standards TEXT NOT NULL,
+    trim_in INTEGER,
+    trim_out INTEGER,
+    PRIMARY KEY (directory, filename)
+)
+"""
+
+
+def scan_directory(directory_path):
+    """Returns {file name: (size, mtime_ns)} for the .bxx files in a directory.
+
+    Raises FileNotFoundError if the directory does not exist.
+    """
+    signatures = {}
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(".bxx") and entry.is_file():
+                st = entry.stat()
+                signatures[entry.name] = (st.st_size, st.st_mtime_ns)
+    return signatures
+
+
+class CatalogueIndex:
+    """SQLite table of the .bxx files of load directories and their parsed info.
+
+    Rows are keyed by (directory, file name) and hold the file's size and
+    mtime_ns at parse time along with the duration, video standards and
+    trim points. sync() compares them with a fresh scan; refresh() also
+    parses what sync() reports as stale.
+
+    The connection belongs to the thread that created the index.
+    A corrupt or outdated index file is replaced by an empty one.
+    """
+
+    def __init__(self, path=INDEX_FILE):
+        self.path = path
+        try:
+            self._connection = self._open()
+        except sqlite3.DatabaseError:
+            if os.path.exists(path):
+                os.remove(path)
+            self._connection = self._open()
+
+    def _open(self):
+        connection = sqlite3.connect(self.path)
+        try:
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS clips")
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            connection.execute(_SCHEMA)
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.commit()
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def load(self, directory_path):
+        """Returns {file name: ((size, mtime_ns), info)} for every indexed file of a directory."""
+        rows = self._connection.execute(
+            "SELECT filename, size, mtime_ns, duration, video_standards, trim_in, trim_out"
+            " FROM clips WHERE directory = ?",
+            (directory_path,),
+        )
+        return {
+            filename: (
+                (size, mtime_ns),
+                {
+                    "duration": duration,
+                    "video_standards": json.loads(video_standards),
+                    "trim_in": trim_in,
+                    "trim_out": trim_out,
+                },
+            )
+            for filename, size, mtime_ns, duration, video_standards, trim_in, trim_out in rows
+        }
+
+    def sync(self, directory_path):
+        """Scans a directory and reconciles it with the index.
+
+        Returns (fresh, stale): fresh maps the unchanged files to their
+        ((size, mtime_ns), info) entries, stale maps new or modified files
+        to their current (size, mtime_ns) and still needs parsing and
+        store(). Rows of files that disappeared are deleted.
+        """
+        signatures = scan_directory(directory_path)
+        indexed = self.load(directory_path)
+        fresh = {}
+        stale = {}
+        for name, signature in signatures.items():
+            entry = indexed.get(name)
+            if entry is not None and entry[0] == signature:
+                fresh[name] = entry
+            else:
+                stale[name] = signature
+        removed = [name for name in indexed if name not in signatures]
+        if removed:
+            self.discard(directory_path, removed)
+        return fresh, stale
+
+    def store(self, directory_path, entries):
+        """Writes (file name, (size, mtime_ns), info) entries in one transaction."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO clips"
+                " (directory, filename, size, mtime_ns, duration, video_standards, trim_in, trim_out)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        directory_path,
+                        name,
+                        signature[0],
+                        signature[1],
+                        info["duration"],
+                        json.dumps(info["video_standards"]),
+                        info.get("trim_in"),
+                        info.get("trim_out"),
+                    )
+                    for name, signature, info in entries
+                ],
+            )
+
+    def discard(self, directory_path, names):
+        """Deletes the rows of the given files."""
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM clips WHERE directory = ? AND filename = ?",
+                [(directory_path, name) for name in names],
+            )
+
+    def refresh(self, directory_path, parse=parse_bxx_file):
+        """Brings the index of a directory up to date, parsing only new or changed files.
+
+        Returns ({file name: info}, problems), where problems lists
+        (file name, error) for files that could not be parsed; those are
+        left out of the index and retried on the next refresh.
+        """
+        fresh, stale = self.sync(directory_path)
+        infos = {name: info for name, (signature, info) in fresh.items()}
+        parsed = []
+        problems = []
+        for name, signature in stale.items():
+            try:
+                info = parse(os.path.join(directory_path, name))
+            except Exception as e:
+                problems.append((name, e))
+                continue
+            infos[name] = info
+            parsed.append((name, signature, info))
+        if parsed:
+            self.store(directory_path, parsed)
+        return infos, problems
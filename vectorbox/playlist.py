@@ -0,0 +1,309 @@
+"""Playlist model with per-item durations, start offsets and a maintained running total."""
+import os
+
+from .fenwick import FenwickTree
+from .timecode import DEFAULT_FPS, format_duration, format_timecodes
+
+
+class PlaylistItem:
+    """One playlist entry: the .bxx file name, its parsed info (or None) and its directory.
+
+    directory is None for entries of the playlist's default load directory.
+    When a ClipStore (clips) holds the entry's clip, the entry keeps no info
+    dict of its own: duration is read from the store and info is rebuilt
+    from it on request.
+    """
+
+    __slots__ = ("file_name", "_info", "directory", "clips")
+
+    def __init__(self, file_name, info, directory=None, clips=None):
+        self.file_name = file_name
+        self.directory = directory
+        if clips is not None and directory is not None and (directory, file_name) in clips:
+            self.clips, self._info = clips, None
+        else:
+            self.clips, self._info = None, info
+
+    @property
+    def info(self):
+        """The parsed info dict, or None when the file could not be parsed."""
+        if self.clips is None:
+            return self._info
+        row = self.clips.row(self.directory, self.file_name)
+        return self.clips.info(row) if row is not None else None
+
+    @property
+    def duration(self):
+        """Duration in frames, 0 when the file could not be parsed."""
+        if self.clips is not None:
+            return self.clips.duration(self.directory, self.file_name) or 0
+        return self._info["duration"] if self._info else 0
+
+    def copy(self):
+        """Returns an entry for the same clip, sharing its info dict or its store."""
+        return PlaylistItem(self.file_name, self._info, self.directory, self.clips)
+
+    def path(self, default_directory=""):
+        """Returns the entry's file path, in default_directory unless it has its own."""
+        return os.path.join(self.directory or default_directory, self.file_name)
+
+    def __repr__(self):
+        return f"PlaylistItem({self.file_name!r}, duration={self.duration})"
+
+
+class Playlist:
+    """Ordered playlist entries.
+
+    The total duration is kept up to date as items are added, removed and
+    reordered, so reading it never requires touching the .bxx files.
+    Item durations are also kept in a Fenwick tree: appends, duplicates,
+    swaps and info updates cost O(log n), and so do start_frame() and
+    seek(). Removing entries other than the last rebuilds it in O(n).
+
+    With a ClipStore, entries of clips it holds take their durations from
+    the store instead of holding info dicts; call update_info() or
+    reattach() when a clip's stored info changes, and detach() before the
+    store drops clips still in the playlist, reattach() once it has them
+    again.
+    """
+
+    def __init__(self, clips=None):
+        self.clips = clips
+        self.items = []
+        self.total_frames = 0
+        self._timeline = FenwickTree()  # Item durations, for start offsets
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def names(self, directory=None):
+        """Returns the file names in playlist order, optionally only those of one directory."""
+        if directory is None:
+            return [item.file_name for item in self.items]
+        return [item.file_name for item in self.items if item.directory == directory]
+
+    def append(self, file_name, info, directory=None):
+        """Adds an entry at the end of the playlist and returns it.
+
+        info may be None for a clip the playlist's ClipStore holds.
+        """
+        item = PlaylistItem(file_name, info, directory, self.clips)
+        self._append_item(item, item.duration)
+        return item
+
+    def extend(self, entries):
+        """Adds (file_name, info[, directory]) entries at the end in one step and returns the new items."""
+        new_items = [PlaylistItem(*entry, clips=self.clips) for entry in entries]
+        for item in new_items:
+            self._append_item(item, item.duration)
+        return new_items
+
+    def _append_item(self, item, duration):
+        self.items.append(item)
+        self._timeline.append(duration)
+        self.total_frames += duration
+
+    def duration(self, index):
+        """Returns the duration in frames the entry at index counts for in the total."""
+        return self._timeline[index]
+
+    def pop(self, index=-1):
+        """Removes and returns the entry at index."""
+        index = range(len(self.items))[index]  # IndexError as from list.pop()
+        timeline = self._timeline
+        duration = timeline[index]
+        item = self.items.pop(index)
+        if index == len(self.items):
+            timeline.pop()
+        else:
+            timeline.build([timeline[k] for k in range(len(timeline)) if k != index])
+        self.total_frames -= duration
+        return item
+
+    def pop_many(self, indices):
+        """Removes the entries at indices in one pass and returns them in playlist order."""
+        doomed = set(indices)
+        removed, kept, durations = [], [], []
+        for index, item in enumerate(self.items):
+            if index in doomed:
+                removed.append(item)
+                self.total_frames -= self._timeline[index]
+            else:
+                kept.append(item)
+                durations.append(self._timeline[index])
+        self.items = kept
+        self._timeline.build(durations)
+        return removed
+
+    def swap(self, index_a, index_b):
+        """Swaps two entries; the total is unchanged."""
+        items = self.items
+        timeline = self._timeline
+        items[index_a], items[index_b] = items[index_b], items[index_a]
+        duration_a, duration_b = timeline[index_a], timeline[index_b]
+        timeline.set(index_a, duration_b)
+        timeline.set(index_b, duration_a)
+
+    def duplicate(self, index):
+        """Appends a copy of the entry at index and returns it."""
+        item = self.items[index].copy()
+        self._append_item(item, self._timeline[index])
+        return item
+
+    def duplicate_many(self, indices):
+        """Appends copies of the entries at indices, in that order, and returns them."""
+        return [self.duplicate(index) for index in indices]
+
+    def update_info(self, file_name, info, directory=None):
+        """Replaces the info of every entry for file_name, e.g. after the file changed.
+
+        With a directory, only entries of that directory are updated; with
+        a ClipStore holding the clip, its stored duration is used, so store
+        the new info first. Returns the number of entries updated.
+        """
+        updated = 0
+        for index, item in enumerate(self.items):
+            if item.file_name == file_name and (directory is None or item.directory == directory):
+                item = self.items[index] = PlaylistItem(file_name, info, item.directory, self.clips)
+                self.total_frames += item.duration - self._timeline[index]
+                self._timeline.set(index, item.duration)
+                updated += 1
+        return updated
+
+    def detach(self, directory, file_names=None):
+        """Gives the entries of directory (optionally only file_names) their own info dicts.
+
+        Call it before the ClipStore forgets those clips, e.g. when a
+        channel is removed or files are deleted, so the entries keep their
+        info. Returns the number of entries detached.
+        """
+        detached = 0
+        for index, item in enumerate(self.items):
+            if item.clips is not None and item.directory == directory and (
+                file_names is None or item.file_name in file_names
+            ):
+                self.items[index] = PlaylistItem(item.file_name, item.info, item.directory)
+                detached += 1
+        return detached
+
+    def reattach(self, directory, file_names=None):
+        """Points the entries of directory (optionally only file_names) back at the ClipStore.
+
+        Call it once the store holds those clips again, e.g. after a reload
+        or when freshly parsed files were stored: entries whose clip it holds
+        read their duration from it, the others keep their own info. Returns
+        the number of entries whose duration changed.
+        """
+        if self.clips is None:
+            return 0
+        changed = 0
+        for index, item in enumerate(self.items):
+            if item.directory == directory and (file_names is None or item.file_name in file_names):
+                item = self.items[index] = PlaylistItem(
+                    item.file_name, item._info, directory, self.clips
+                )
+                duration = self._timeline[index]
+                if item.duration != duration:
+                    self.total_frames += item.duration - duration
+                    self._timeline.set(index, item.duration)
+                    changed += 1
+        return changed
+
+    def start_frame(self, index):
+        """Returns the offset in frames at which the entry at index starts."""
+        return self._timeline.prefix_sum(index)
+
+    def seek(self, frame):
+        """Returns the index of the entry playing at the given offset, or None past the end.
+
+        Entries without a duration are never returned.
+        """
+        if not 0 <= frame < self.total_frames:
+            return None
+        return self._timeline.find(frame)
+
+    def snapshot(self):
+        """Returns an independent copy, e.g. to save while the original keeps being edited.
+
+        The copy does not use the ClipStore: its entries hold info dicts.
+        """
+        copy = Playlist()
+        copy.items = [PlaylistItem(item.file_name, item.info, item.directory) for item in self.items]
+        copy.total_frames = self.total_frames
+        copy._timeline = self._timeline.copy()
+        return copy
+
+    def refresh(self, lookup, directory_path=None):
+        """Re-resolves every entry's info and recomputes the total.
+
+        lookup is called with the file name, or with the entry's full path
+        when a default directory_path is given. Its results take precedence
+        over the ClipStore.
+        """
+        self.items = [
+            PlaylistItem(
+                item.file_name,
+                lookup(item.file_name if directory_path is None else item.path(directory_path)),
+                item.directory,
+            )
+            for item in self.items
+        ]
+        self._rebuild_timeline()
+        self.total_frames = self._timeline.total()
+
+    def clear(self):
+        """Removes every entry."""
+        self.items.clear()
+        self.total_frames = 0
+        self._timeline.clear()
+
+    def _rebuild_timeline(self):
+        self._timeline.build(item.duration for item in self.items)
+
+
+class PlaylistView:
+    """Rows of a playlist for a VirtualListbox: name, start timecode and duration.
+
+    Start timecodes come from the playlist's prefix sums, so drawing the
+    visible rows never walks the entries before them. rows() formats the
+    timecodes of a whole range in one format_timecodes() batch.
+    """
+
+    def __init__(self, playlist, fps=DEFAULT_FPS):
+        self.playlist = playlist
+        self.fps = fps
+
+    def __len__(self):
+        return len(self.playlist)
+
+    def __getitem__(self, row):
+        return self.playlist[row].file_name
+
+    def row(self, row):
+        """Returns the (name, start, duration) column texts for row."""
+        return (
+            self.playlist[row].file_name,
+            format_duration(self.playlist.start_frame(row), fps=self.fps),
+            format_duration(self.playlist.duration(row), fps=self.fps),
+        )
+
+    def rows(self, first, stop):
+        """Returns the row() texts of rows first to stop - 1."""
+        items = self.playlist.items[first:stop]
+        durations = [self.playlist.duration(row) for row in range(first, first + len(items))]
+        starts = []
+        offset = self.playlist.start_frame(first)
+        for duration in durations:
+            starts.append(offset)
+            offset += duration
+        labels = format_timecodes(starts + durations, self.fps)
+        count = len(items)
+        return [
+            (item.file_name, labels[k], labels[count + k]) for k, item in enumerate(items)
+        ]
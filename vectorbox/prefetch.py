@@ -0,0 +1,71 @@
+"""Background parsing of a directory's .bxx files into the metadata cache."""
+import queue
+import threading
+
+from .reader import MetadataReader
+
+
+class PrefetchJob:
+    """Parses a set of .bxx files concurrently and stores them in a BxxInfoCache.
+
+    The job runs on its own thread and never touches the GUI. Callers poll it
+    (e.g. from a Tk after() callback) for progress and completed paths.
+    Files are read by a MetadataReader, which bounds the reads in flight;
+    pass one (sharing the cache) to configure the concurrency or the file
+    system.
+    Files that fail to parse are counted and otherwise ignored; the error is
+    reported again when the file is looked up interactively.
+    """
+
+    def __init__(self, paths, cache, reader=None):
+        self.paths = list(paths)
+        self.cache = cache
+        self.reader = reader if reader is not None else MetadataReader(cache)
+        self.total = len(self.paths)
+        self.done = 0
+        self.failed = 0
+        self.finished = False
+        self._completed = queue.SimpleQueue()
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Starts the job in a daemon thread and returns self."""
+        self._thread = threading.Thread(target=self._run, name="bxx-prefetch", daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Stops the job after the files currently being parsed."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def wait(self, timeout=None):
+        """Blocks until the job thread exits."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def poll(self):
+        """Returns the paths parsed since the last call, as (path, info) pairs."""
+        completed = []
+        while True:
+            try:
+                completed.append(self._completed.get_nowait())
+            except queue.Empty:
+                return completed
+
+    def _run(self):
+        try:
+            for path, info, error in self.reader.read_many(self.paths, self._cancel):
+                if self._cancel.is_set():
+                    break
+                if error is not None:
+                    self.failed += 1
+                else:
+                    self._completed.put((path, info))
+                self.done += 1
+        finally:
+            self.finished = True
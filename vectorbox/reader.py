@@ -0,0 +1,148 @@
+"""Concurrent .bxx metadata reads for load directories on high-latency shares.
+
+On an SMB/NFS mount every stat, open and read is a network round trip, so
+reading files one after another spends most of its time waiting. A
+MetadataReader keeps up to `concurrency` files in flight on a thread pool
+(the waits release the GIL) and parses each file from the bytes it read.
+The file system calls go through a small interface, so LatencyFileSystem
+can stand in for a slow share when testing or benchmarking.
+"""
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .bxx import parse_bxx_bytes
+
+DEFAULT_CONCURRENCY = 16  # Reads in flight; keep it modest so the filer is not flooded
+
+
+class LocalFileSystem:
+    """The file system calls made by a MetadataReader, on the local OS."""
+
+    def stat(self, path):
+        """Returns the (size, mtime_ns) signature used by BxxInfoCache."""
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+
+    def read_bytes(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+
+class LatencyFileSystem(LocalFileSystem):
+    """A local file system that waits latency seconds before every stat and read.
+
+    Stands in for a network share: reads overlap when issued concurrently,
+    as they would against a real filer. calls counts the delayed calls.
+    """
+
+    def __init__(self, latency=0.02):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _wait(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+
+    def stat(self, path):
+        self._wait()
+        return super().stat(path)
+
+    def read_bytes(self, path):
+        self._wait()
+        return super().read_bytes(path)
+
+
+class MetadataReader:
+    """Reads and parses many .bxx files with a bounded number of reads in flight.
+
+    With a cache, each file is stat()ed first and only read and parsed
+    when the cache has no entry for its current (size, mtime_ns); parsed
+    info is stored back. parse turns a file's bytes into its info dict;
+    the default, parse_bxx_bytes, streams files of STREAM_THRESHOLD bytes
+    or more rather than building their whole tree.
+    """
+
+    def __init__(self, cache=None, concurrency=DEFAULT_CONCURRENCY, fs=None,
+                 parse=parse_bxx_bytes):
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, not {concurrency}")
+        self.cache = cache
+        self.concurrency = concurrency
+        self.fs = fs if fs is not None else LocalFileSystem()
+        self.parse = parse
+
+    def read(self, path):
+        """Returns the info for one file, from the cache when it is still valid.
+
+        Raises OSError if the file cannot be read and ET.ParseError /
+        ValueError if it cannot be parsed.
+        """
+        signature = self.fs.stat(path)
+        if self.cache is not None:
+            info = self.cache.lookup(path, signature)
+            if info is not None:
+                return info
+        info = self.parse(self.fs.read_bytes(path))
+        if self.cache is not None:
+            self.cache.put(path, signature, info)
+        return info
+
+    def read_many(self, paths, cancel_event=None):
+        """Yields (path, info, error) for each path as its read completes.
+
+        Exactly one of info and error is None. At most `concurrency` reads
+        are in flight at a time. Setting cancel_event stops submitting new
+        reads; the generator then returns once the running ones finish.
+        """
+        paths = iter(paths)
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="bxx-read") as executor:
+            pending = {}
+            while True:
+                while len(pending) < self.concurrency and not (cancel_event is not None and cancel_event.is_set()):
+                    path = next(paths, None)
+                    if path is None:
+                        break
+                    pending[executor.submit(self.read, path)] = path
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        info, error = future.result(), None
+                    except Exception as e:
+                        info, error = None, e
+                    yield path, info, error
+
+    def read_all(self, paths, cancel_event=None):
+        """Returns ({path: info}, {path: error}) for all paths."""
+        infos = {}
+        errors = {}
+        for path, info, error in self.read_many(paths, cancel_event):
+            if error is None:
+                infos[path] = info
+            else:
+                errors[path] = error
+        return infos, errors
+
+
+def add_reader_arguments(parser):
+    """Adds the --read-concurrency and --simulate-latency options to an ArgumentParser."""
+    parser.add_argument(
+        "--read-concurrency", type=int, default=DEFAULT_CONCURRENCY, metavar="N",
+        help=f"metadata reads kept in flight on the load directories (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--simulate-latency", type=float, default=0, metavar="MS",
+        help="add MS milliseconds to every metadata stat and read, to try out a slow share",
+    )
+
+
+def reader_from_arguments(args, cache=None):
+    """Returns the MetadataReader configured by the add_reader_arguments() options."""
+    fs = LatencyFileSystem(args.simulate_latency / 1000) if args.simulate_latency > 0 else None
+    return MetadataReader(cache, concurrency=args.read_concurrency, fs=fs)
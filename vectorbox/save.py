@@ -0,0 +1,113 @@
+"""Background saving of a playlist snapshot."""
+import threading
+
+from .plx import SaveCancelled, write_playlist
+from .reader import MetadataReader
+from .stats import stats
+from .timecode import DEFAULT_FPS
+from .validate import validate_playlist
+
+
+class SaveJob:
+    """Saves a snapshot of a Playlist to a .plx file on a background thread.
+
+    The playlist is copied when the job is created, so the caller can keep
+    editing it. The job first validates every entry with validate_playlist()
+    (re-reading the files through the reader's cache, which picks up files
+    changed since they were added), then writes the file; entries whose
+    file could not be read are left out. A strict job stops in the
+    "invalid" stage instead of writing when the report has any problem.
+    Like PrefetchJob it never touches the GUI; callers poll it for
+    progress and for the outcome once finished is True.
+    """
+
+    def __init__(self, playlist_path, playlist, directory_path, cache,
+                 reader=None, fps=DEFAULT_FPS, strict=False):
+        self.playlist_path = playlist_path
+        self.playlist = playlist.snapshot()
+        self.directory_path = directory_path
+        self.cache = cache
+        self.reader = reader if reader is not None else MetadataReader(cache)
+        self.fps = fps
+        self.strict = strict
+        self.stage = "pending"  # validating, writing, then done / invalid / cancelled / failed
+        self.steps_done = 0
+        self.steps_total = 2 * len(self.playlist)
+        self.report = None  # ValidationReport of the snapshot, once validated
+        self.error = None
+        self.finished = False
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Starts the job in a background thread and returns self."""
+        self._thread = threading.Thread(target=self._run, name="plx-save")
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Asks the job to stop; an existing file at playlist_path is left untouched."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def wait(self, timeout=None):
+        """Blocks until the job thread exits."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def fraction(self):
+        """Progress between 0.0 and 1.0."""
+        if not self.steps_total:
+            return 1.0
+        return min(self.steps_done / self.steps_total, 1.0)
+
+    def _validate_progress(self, done, total):
+        self.steps_done = done
+
+    def _validate(self):
+        """Re-reads and checks the entries' files and refreshes the snapshot from the results."""
+        report = validate_playlist(
+            self.playlist,
+            self.directory_path,
+            self.reader,
+            cancel_event=self._cancel,
+            progress=self._validate_progress,
+        )
+        if report is None:
+            raise SaveCancelled(self.playlist_path)
+        self.report = report
+        self.playlist.refresh(report.lookup, self.directory_path)
+
+    def _write_progress(self, done, total):
+        self.steps_done = total + done
+
+    def _run(self):
+        try:
+            self.stage = "validating"
+            with stats.timer("save.validating"):
+                self._validate()
+            if self.strict and not self.report.ok:
+                self.stage = "invalid"
+                return
+            self.stage = "writing"
+            with stats.timer("save.writing"):
+                write_playlist(
+                    self.playlist_path,
+                    self.playlist,
+                    self.directory_path,
+                    fps=self.fps,
+                    progress=self._write_progress,
+                    cancel_event=self._cancel,
+                )
+            self.stage = "done"
+        except SaveCancelled:
+            self.stage = "cancelled"
+        except Exception as e:
+            self.error = e
+            self.stage = "failed"
+        finally:
+            self.finished = True
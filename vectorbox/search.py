@@ -0,0 +1,114 @@
+"""Case-insensitive type-ahead lookup over clip names."""
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+
+GRAM_SIZE = 3
+REBUILD_SLACK = 1024  # Removed names tolerated beyond the listed ones before a rebuild
+
+
+def _grams(key):
+    return {key[i:i + GRAM_SIZE] for i in range(len(key) - GRAM_SIZE + 1)}
+
+
+class NameIndex:
+    """Sorted, lower-cased name index for prefix and substring search.
+
+    Prefix lookups are a bisect into the sorted keys. Substring lookups
+    take the shortest trigram posting of the query and only compare the
+    names it lists; queries shorter than a trigram fall back to a scan of
+    the Python-side keys. Matches are returned in case-insensitive name
+    order, which is the order load_directory lists files in.
+
+    Each distinct name gets an integer id, and a trigram's posting is an
+    array of ids, about 4 bytes per name and trigram. Names may be added
+    and removed as they move in and out of a list: a removed name keeps
+    its id and postings, is skipped while it is absent, and gets them back
+    when it is added again. The index is rebuilt once removed names
+    outnumber the listed ones.
+    """
+
+    def __init__(self, names=()):
+        self._counts = Counter(names)
+        self._keys = sorted((name.lower(), name) for name in self._counts)
+        self._names = []  # Name of each id, listed or not
+        self._ids = {}  # name -> id
+        self._grams = {}  # trigram -> array of the ids of the names containing it
+        for key, name in self._keys:
+            self._post(key, name)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, name):
+        return name in self._counts
+
+    def _post(self, key, name):
+        """Gives name an id and adds it to the postings of its trigrams, unless it already has one."""
+        if name in self._ids:
+            return
+        name_id = len(self._names)
+        self._ids[name] = name_id
+        self._names.append(name)
+        grams = self._grams
+        for gram in _grams(key):
+            posting = grams.get(gram)
+            if posting is None:
+                posting = grams[gram] = array("I")
+            posting.append(name_id)
+
+    def add(self, name):
+        """Adds a name (names may be present more than once)."""
+        self._counts[name] += 1
+        if self._counts[name] > 1:
+            return
+        key = name.lower()
+        insort(self._keys, (key, name))
+        self._post(key, name)
+
+    def discard(self, name):
+        """Removes one occurrence of name, if present."""
+        count = self._counts.get(name, 0)
+        if count > 1:
+            self._counts[name] = count - 1
+            return
+        if not count:
+            return
+        del self._counts[name]
+        del self._keys[bisect_left(self._keys, (name.lower(), name))]
+        if len(self._names) > 2 * len(self._counts) + REBUILD_SLACK:
+            self.__init__(self._counts.elements())
+
+    def find_prefix(self, text):
+        """Returns the first name starting with text (case-insensitive), or None."""
+        text = text.lower()
+        position = bisect_left(self._keys, (text,))
+        if position < len(self._keys) and self._keys[position][0].startswith(text):
+            return self._keys[position][1]
+        return None
+
+    def find_substring(self, text):
+        """Returns the first name containing text (case-insensitive), or None."""
+        text = text.lower()
+        if len(text) < GRAM_SIZE:
+            for key, name in self._keys:
+                if text in key:
+                    return name
+            return None
+
+        postings = [self._grams.get(gram) for gram in _grams(text)]
+        if not all(postings):
+            return None
+        names, counts = self._names, self._counts
+        candidates = (names[name_id] for name_id in min(postings, key=len))
+        matches = [
+            (name.lower(), name) for name in candidates if name in counts and text in name.lower()
+        ]
+        return min(matches)[1] if matches else None
+
+    def find(self, text):
+        """Returns the first name starting with text, else the first one containing it."""
+        name = self.find_prefix(text)
+        if name is None:
+            name = self.find_substring(text)
+        return name
@@ -0,0 +1,55 @@
+"""Reading and writing of the config.txt settings file."""
+
+CONFIG_FILE = "config.txt"
+
+
+def load_settings(config_path=CONFIG_FILE):
+    """Returns (load_dir, save_dir) from the settings file.
+
+    Missing files yield empty directories; malformed lines are skipped.
+    """
+    load_dir = ""
+    save_dir = ""
+    try:
+        with open(config_path, "r") as f:
+            for line in f:
+                try:
+                    key, value = line.strip().split(":", 1)
+                except ValueError:
+                    print(f"Warning: Invalid line in {config_path}: {line.strip()}")
+                    continue
+                if key == "load_dir":
+                    load_dir = value
+                elif key == "save_dir":
+                    save_dir = value
+    except FileNotFoundError:
+        pass
+    return load_dir, save_dir
+
+
+def load_channels(config_path=CONFIG_FILE):
+    """Returns the [(name, load_dir)] channels from "channel:name=load_dir" lines of the settings file."""
+    channels = []
+    try:
+        with open(config_path, "r") as f:
+            for line in f:
+                key, _, value = line.strip().partition(":")
+                if key != "channel":
+                    continue
+                name, separator, load_dir = value.partition("=")
+                if not separator or not name or not load_dir:
+                    print(f"Warning: Invalid channel in {config_path}: {line.strip()}")
+                    continue
+                channels.append((name, load_dir))
+    except FileNotFoundError:
+        pass
+    return channels
+
+
+def save_settings(load_dir, save_dir, config_path=CONFIG_FILE, channels=()):
+    """Writes the load and save directories, and any (name, load_dir) channels, to the settings file."""
+    with open(config_path, "w") as f:
+        f.write(f"load_dir:{load_dir}\n")
+        f.write(f"save_dir:{save_dir}\n")
+        for name, channel_dir in channels:
+            f.write(f"channel:{name}={channel_dir}\n")
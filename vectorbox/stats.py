@@ -0,0 +1,206 @@
+"""Opt-in instrumentation: timing counters, event counts and session profiling.
+
+The shared ``stats`` instance is disabled by default, in which case timers
+cost one attribute check. Enable it (e.g. with --stats-output or from the
+GUI's statistics window) to accumulate per-name call counts and durations.
+"""
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+
+from .fsutil import atomic_write
+
+PROFILE_MODES = ("cpu", "memory")
+DEFAULT_PROFILE_OUTPUT = {"cpu": "profile.txt", "memory": "tracemalloc.txt"}
+PROFILE_LINES = 50  # Entries listed in a profile report
+
+
+class Stats:
+    """Named timers and counters, safe to update from several threads.
+
+    Sources registered with add_source() are called on snapshot() to report
+    counters kept elsewhere, such as the metadata cache's hits and misses.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._timers = {}  # name -> [calls, total seconds, max seconds]
+        self._counters = {}
+        self._sources = {}  # name -> callable returning a dict of numbers
+        self._lock = threading.Lock()
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+
+    def add_source(self, name, source):
+        """Registers source(), whose dict is reported under name by snapshot()."""
+        self._sources[name] = source
+
+    def record(self, name, seconds):
+        """Adds one timed call of name."""
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                self._timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                if seconds > timer[2]:
+                    timer[2] = seconds
+
+    def count(self, name, amount=1):
+        """Increments counter name, if enabled."""
+        if self.enabled:
+            with self._lock:
+                self._counters[name] = self._counters.get(name, 0) + amount
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        """Times the body of a with statement, if enabled."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed(self, name=None):
+        """Decorator timing every call of a function, if enabled when it is called."""
+        def decorate(function):
+            timer_name = name or function.__name__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(timer_name, time.perf_counter() - start)
+            return wrapper
+        return decorate
+
+    def reset(self):
+        """Clears the timers and counters; sources keep their own state."""
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    def snapshot(self):
+        """Returns the current figures as a JSON-serializable dict."""
+        with self._lock:
+            timers = {
+                name: {
+                    "calls": calls,
+                    "total_ms": total * 1000,
+                    "mean_ms": total * 1000 / calls,
+                    "max_ms": longest * 1000,
+                }
+                for name, (calls, total, longest) in sorted(self._timers.items())
+            }
+            counters = dict(sorted(self._counters.items()))
+        return {
+            "enabled": self.enabled,
+            "timers": timers,
+            "counters": counters,
+            "sources": {name: source() for name, source in sorted(self._sources.items())},
+        }
+
+    def format(self):
+        """Returns the snapshot as a plain-text table."""
+        data = self.snapshot()
+        lines = [f"{'timer':32} {'calls':>8} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+        for name, timer in data["timers"].items():
+            lines.append(
+                f"{name:32} {timer['calls']:8d} {timer['total_ms']:10.1f} "
+                f"{timer['mean_ms']:9.2f} {timer['max_ms']:9.2f}"
+            )
+        if not data["timers"]:
+            lines.append("(no timings recorded)" if self.enabled else "(timing is off)")
+        counters = dict(data["counters"])
+        for source, values in data["sources"].items():
+            counters.update((f"{source}.{key}", value) for key, value in values.items())
+        if counters:
+            lines.append("")
+            lines.extend(f"{name:32} {value:>8}" for name, value in counters.items())
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """Writes the snapshot to path as JSON."""
+        with atomic_write(path) as f:
+            json.dump(self.snapshot(), f, indent=2)
+            f.write("\n")
+
+
+stats = Stats()
+
+
+@contextlib.contextmanager
+def profile_session(mode=None, output_path=None):
+    """Profiles the body of a with statement and writes a report when it exits.
+
+    mode "cpu" runs cProfile (main thread only) and writes the functions
+    with the highest cumulative time; an output path ending in .prof gets
+    the raw pstats data instead. mode "memory" traces allocations with
+    tracemalloc and writes the peak and the largest allocation sites.
+    With mode None nothing is profiled.
+    """
+    if mode is None:
+        yield
+        return
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode {mode!r}: expected one of {PROFILE_MODES}")
+    output_path = output_path or DEFAULT_PROFILE_OUTPUT[mode]
+
+    if mode == "cpu":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            if output_path.endswith(".prof"):
+                profiler.dump_stats(output_path)
+            else:
+                report = io.StringIO()
+                pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(PROFILE_LINES)
+                with open(output_path, "w", encoding="utf-8") as f:
+                    f.write(report.getvalue())
+        return
+
+    tracemalloc.start(25)
+    try:
+        yield
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(f"current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB\n\n")
+            for statistic in snapshot.statistics("lineno")[:PROFILE_LINES]:
+                f.write(f"{statistic}\n")
+
+
+def add_profile_arguments(parser):
+    """Adds the --profile, --profile-output and --stats-output options to an ArgumentParser."""
+    parser.add_argument(
+        "--profile", nargs="?", const="cpu", choices=PROFILE_MODES,
+        help="profile the session with cProfile (cpu, the default) or tracemalloc (memory)",
+    )
+    parser.add_argument(
+        "--profile-output", metavar="PATH",
+        help="where to write the profile report (default: profile.txt / tracemalloc.txt)",
+    )
+    parser.add_argument(
+        "--stats-output", metavar="PATH",
+        help="enable timing counters and write them to PATH as JSON on exit",
+    )
@@ -0,0 +1,196 @@
+"""Frame count to timecode conversion for the broadcast frame rates.
+
+A FrameRate describes how frame counts map onto hh:mm:ss:ff labels. 25
+and 50 fps are counted directly; 29.97 and 59.94 fps use the 30 and 60
+frame labels, and their drop-frame variants skip the first 2 (or 4)
+labels of every minute except each tenth, so the timecode keeps up with
+the clock. Drop-frame timecodes are written with a ';' before the frames.
+
+Every function taking fps accepts a FrameRate, a FRAME_RATES name such as
+"29.97DF", or a plain integer frame rate. format_timecodes() converts a
+whole sequence of frame counts at once, with NumPy when it is installed.
+"""
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional: format_timecodes() falls back to pure Python
+    np = None
+
+
+class FrameRate(namedtuple("FrameRate", "name timebase drop_frame time_scale")):
+    """A frame rate: timebase frames per timecode second, optionally drop-frame.
+
+    time_scale is the rate as written in the TimeScale of a .plx file.
+    """
+
+    __slots__ = ()
+
+    @property
+    def dropped(self):
+        """Labels skipped at the start of each minute (0 for non-drop rates)."""
+        return self.timebase // 15 if self.drop_frame else 0
+
+    @property
+    def separator(self):
+        """The separator written before the frames field."""
+        return ";" if self.drop_frame else ":"
+
+
+FRAME_RATES = {
+    "25": FrameRate("25", 25, False, "25fps"),
+    "29.97": FrameRate("29.97", 30, False, "29.97fps"),
+    "29.97DF": FrameRate("29.97DF", 30, True, "29.97fps"),
+    "50": FrameRate("50", 50, False, "50fps"),
+    "59.94": FrameRate("59.94", 60, False, "59.94fps"),
+    "59.94DF": FrameRate("59.94DF", 60, True, "59.94fps"),
+}
+DEFAULT_FPS = FRAME_RATES["25"]
+
+_TWO_DIGITS = [f"{n:02d}" for n in range(100)]
+
+
+def frame_rate(fps):
+    """Returns the FrameRate for a FrameRate, a FRAME_RATES name or an integer rate.
+
+    Raises ValueError for an unknown name or a rate below 1.
+    """
+    if isinstance(fps, FrameRate):
+        return fps
+    rate = FRAME_RATES.get(fps)
+    if rate is not None:
+        return rate
+    if isinstance(fps, int):
+        if fps < 1:
+            raise ValueError(f"Invalid frame rate {fps}")
+        return FRAME_RATES.get(str(fps)) or FrameRate(str(fps), fps, False, f"{fps}fps")
+    rate = FRAME_RATES.get(str(fps).strip().upper().replace("FPS", ""))
+    if rate is None:
+        raise ValueError(f"Unknown frame rate {fps!r}: expected one of {', '.join(FRAME_RATES)}")
+    return rate
+
+
+def _label_frames(duration_frames, rate):
+    """Returns the frame count as shown by the timecode labels, i.e. with dropped labels added back."""
+    dropped = rate.dropped
+    if not dropped:
+        return duration_frames
+    frames_per_minute = rate.timebase * 60 - dropped
+    frames_per_ten_minutes = frames_per_minute * 10 + dropped
+    tens, rest = divmod(duration_frames, frames_per_ten_minutes)
+    skipped = dropped * 9 * tens
+    if rest > dropped:
+        skipped += dropped * ((rest - dropped) // frames_per_minute)
+    return duration_frames + skipped
+
+
+def format_duration(duration_frames, fps=DEFAULT_FPS):
+    """Formats duration from frames to hh:mm:ss:ff (hh:mm:ss;ff for drop-frame rates)."""
+    rate = fps if type(fps) is FrameRate else frame_rate(fps)
+    if rate.drop_frame:
+        duration_frames = _label_frames(duration_frames, rate)
+        separator = ";"
+    else:
+        separator = ":"
+    total_seconds, frames = divmod(duration_frames, rate.timebase)
+    hours, rest = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{frames:02d}"
+
+
+def _format_timecodes_python(frame_counts, rate):
+    """format_timecodes() without NumPy: one loop with the rate resolved and two-digit fields precomputed."""
+    timebase = rate.timebase
+    frames_per_hour = timebase * 3600
+    separator = rate.separator
+    drop_frame = rate.drop_frame
+    digits = _TWO_DIGITS
+    labels = []
+    append = labels.append
+    for frames in frame_counts:
+        if drop_frame:
+            frames = _label_frames(frames, rate)
+        hours, rest = divmod(frames, frames_per_hour)
+        total_seconds, ff = divmod(rest, timebase)
+        mm, ss = divmod(total_seconds, 60)
+        hh = digits[hours] if 0 <= hours < 100 else f"{hours:02d}"
+        append(f"{hh}:{digits[mm]}:{digits[ss]}{separator}{digits[ff]}")
+    return labels
+
+
+def _format_timecodes_numpy(frames, rate):
+    """format_timecodes() on a NumPy array of non-negative counts; None if a label reaches 100 hours."""
+    timebase = rate.timebase
+    dropped = rate.dropped
+    if dropped:
+        frames_per_minute = timebase * 60 - dropped
+        tens, rest = np.divmod(frames, frames_per_minute * 10 + dropped)
+        frames = frames + dropped * 9 * tens + np.where(
+            rest > dropped, dropped * ((rest - dropped) // frames_per_minute), 0
+        )
+    total_seconds, ff = np.divmod(frames, timebase)
+    total_minutes, ss = np.divmod(total_seconds, 60)
+    hh, mm = np.divmod(total_minutes, 60)
+    if hh.max() >= 100:
+        return None
+    # Build newline-terminated ASCII labels column by column, then split them in one go
+    text = np.empty((len(frames), 12), dtype=np.uint8)
+    for column, field in ((0, hh), (3, mm), (6, ss), (9, ff)):
+        tens_digit, units_digit = np.divmod(field, 10)
+        text[:, column] = tens_digit + ord("0")
+        text[:, column + 1] = units_digit + ord("0")
+    text[:, 2] = text[:, 5] = ord(":")
+    text[:, 8] = ord(rate.separator)
+    text[:, 11] = ord("\n")
+    labels = text.tobytes().decode("ascii").split("\n")
+    labels.pop()
+    return labels
+
+
+def format_timecodes(frame_counts, fps=DEFAULT_FPS):
+    """Formats a sequence of frame counts like format_duration() and returns the list of labels.
+
+    With NumPy the whole batch is converted in a handful of array
+    operations, so thousands of start and duration timecodes cost about
+    as much as a few dozen format_duration() calls.
+    """
+    rate = frame_rate(fps)
+    if np is not None:
+        frames = np.asarray(frame_counts, dtype=np.int64)
+        if frames.ndim == 1 and len(frames) and frames.min() >= 0:
+            labels = _format_timecodes_numpy(frames, rate)
+            if labels is not None:
+                return labels
+    return _format_timecodes_python(frame_counts, rate)
+
+
+def add_frame_rate_argument(parser):
+    """Adds the --frame-rate option, parsed into a FrameRate, to an ArgumentParser."""
+    parser.add_argument(
+        "--frame-rate", type=frame_rate, default=DEFAULT_FPS.name, metavar="RATE",
+        help=f"timecode frame rate: {', '.join(FRAME_RATES)} (default: {DEFAULT_FPS.name})",
+    )
+
+
+def parse_timecode(text, fps=DEFAULT_FPS):
+    """Parses hh:mm:ss:ff (or hh:mm:ss) into a frame count.
+
+    ';' and '.' are accepted as separators too. For drop-frame rates the
+    labels skipped at the start of a minute are rejected.
+    Raises ValueError for malformed text or out-of-range fields.
+    """
+    rate = frame_rate(fps)
+    fields = text.strip().replace(";", ":").replace(".", ":").split(":")
+    if len(fields) == 3:
+        fields.append("0")
+    if len(fields) != 4 or not all(field.isdigit() for field in fields):
+        raise ValueError(f"Invalid timecode {text!r}: expected hh:mm:ss:ff")
+    hours, minutes, seconds, frames = (int(field) for field in fields)
+    if minutes >= 60 or seconds >= 60 or frames >= rate.timebase:
+        raise ValueError(f"Invalid timecode {text!r}: field out of range")
+    total_minutes = hours * 60 + minutes
+    dropped = rate.dropped
+    if dropped and seconds == 0 and frames < dropped and minutes % 10:
+        raise ValueError(f"Invalid timecode {text!r}: frame label dropped at {rate.name}")
+    label_frames = (total_minutes * 60 + seconds) * rate.timebase + frames
+    return label_frames - dropped * (total_minutes - total_minutes // 10)
@@ -0,0 +1,772 @@
+"""Playlist editing logic shared by the Tk front-ends.
+
+Like vectorbox.tkwidgets this module imports tkinter and is only imported
+by the front-ends. PlaylistApp owns the models and background jobs and
+handles every command and event; the front-ends build the window, pass its
+widgets to attach() and bind their buttons and menus to its methods.
+"""
+import argparse
+import os
+import tkinter as tk
+from tkinter import filedialog, messagebox, simpledialog
+
+from . import settings
+from .bxx import parse_bxx_file
+from .cache import BxxInfoCache
+from .catalogue import Catalogue
+from .channels import ChannelSet
+from .fill import fill_duration
+from .index import CatalogueIndex
+from .playlist import Playlist, PlaylistView
+from .plx import is_valid_code, playlist_filename
+from .prefetch import PrefetchJob
+from .reader import add_reader_arguments, reader_from_arguments
+from .save import SaveJob
+from .stats import add_profile_arguments, profile_session, stats
+from .timecode import add_frame_rate_argument, format_duration, parse_timecode
+from .tkwidgets import RefreshScheduler
+from .watch import DirectoryWatcher
+
+PREFETCH_POLL_MS = 100  # How often the prefetch progress is shown
+WATCH_POLL_MS = 500  # How often changes seen by the directory watcher are applied
+SAVE_POLL_MS = 50  # How often the save progress is shown
+REPORT_LINES = 20  # Problems listed by name in the validation report dialog
+SEARCH_RESET_MS = 1000  # Type-ahead pause after which a new search starts
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="BXX Playlist Creator")
+    add_profile_arguments(parser)
+    add_reader_arguments(parser)
+    add_frame_rate_argument(parser)
+    return parser
+
+
+def channel_name(load_dir):
+    """Returns the default channel name for a load directory."""
+    return os.path.basename(os.path.normpath(load_dir)) or load_dir
+
+
+class PlaylistApp:
+    """Channels, catalogue and playlist of a front-end, and its commands.
+
+    Construction loads the settings and opens the catalogue index next to
+    config_file, so app.catalogue and app.playlist_view can back the
+    front-end's VirtualListboxes. attach() then hands over the widgets
+    and binds the list, entry and keyboard events; run() scans every
+    channel, runs the Tk main loop and stops the background jobs after it.
+
+    Prefetch jobs and directory watchers are kept per channel name and
+    polled with root.after(), and label refreshes go through a
+    RefreshScheduler, so every model update happens on the Tk thread.
+    """
+
+    def __init__(self, root, options, config_file=settings.CONFIG_FILE):
+        self.root = root
+        self.options = options
+        self.config_file = config_file
+        if options.stats_output:
+            stats.enable()
+
+        self.directory_path = ""
+        self.default_load_dir = ""
+        self.default_save_dir = ""
+        self.typed_str = []  # For alphanumeric search
+        self.bxx_cache = BxxInfoCache()  # Files parsed but not yet in the clip store, validated by size/mtime
+        # Persists parsed .bxx info per load directory
+        self.catalogue_index = CatalogueIndex(os.path.join(os.path.dirname(config_file), "catalogue.db"))
+        # Load directories, each scanned once per session
+        self.channels = ChannelSet(self.bxx_cache, self.catalogue_index, options.frame_rate)
+        # Model behind listbox_right, with per-item durations, start offsets and the running total
+        self.playlist = Playlist(self.channels.clips)
+        # Name / start TC / duration rows of the virtualized listbox_right
+        self.playlist_view = PlaylistView(self.playlist, options.frame_rate)
+        self.prefetch_jobs = {}  # Channel name -> background parse of its new or changed files
+        self.watchers = {}  # Channel name -> watcher, while File > Watch Load Directories is on
+        self.save_job = None  # Background save of a playlist snapshot
+        # Model behind listbox_left: the active channel's catalogue, or an empty one without channels
+        self.catalogue = Catalogue(self.bxx_cache, options.frame_rate, self.channels.clips)
+        # Bounded concurrent reads for prefetch and save
+        self.metadata_reader = reader_from_arguments(options, self.bxx_cache)
+        stats.add_source("bxx_cache", self.bxx_cache.counters)
+        stats.add_source("clip_store", self.channels.clips.counters)
+
+        self.scheduler = RefreshScheduler(root)  # Coalesces label/total refreshes per frame
+        self.channel_var = tk.StringVar(root, value="")  # Active channel, for the Channels menu
+        self.watch_var = tk.BooleanVar(root, value=False)  # File > Watch Load Directories
+        self.load_settings()
+
+    def attach(self, *, listbox_left, listbox_right, status_label, duration_label,
+               total_duration_label, list_title_entry, seek_entry, btn_save, save_progress,
+               btn_cancel_save, channelmenu):
+        """Takes over the front-end's widgets and binds their events.
+
+        save_progress and btn_cancel_save are packed into their parent only
+        while a save is running; channelmenu is filled by
+        update_channel_menu().
+        """
+        self.listbox_left = listbox_left
+        self.listbox_right = listbox_right
+        self.status_label = status_label
+        self.duration_label = duration_label
+        self.total_duration_label = total_duration_label
+        self.list_title_entry = list_title_entry
+        self.seek_entry = seek_entry
+        self.btn_save = btn_save
+        self.save_progress = save_progress
+        self.btn_cancel_save = btn_cancel_save
+        self.channelmenu = channelmenu
+
+        listbox_left.bind("<Key>", self.on_left_listbox_keypress)
+        listbox_left.bind("<<ListboxSelect>>", lambda event: self.scheduler.schedule(self.update_duration_display))
+        listbox_right.bind("<Control-Up>", self.move_item_up)
+        listbox_right.bind("<Control-Down>", self.move_item_down)
+        listbox_right.bind("<Button-3>", self.duplicate_entry)
+        for sequence in ("<<ListboxSelect>>", "<KeyRelease>", "<ButtonRelease-1>"):
+            listbox_right.bind(sequence, lambda event: self.scheduler.schedule(self.update_total_duration_display))
+        seek_entry.bind("<Return>", self.seek_timecode)
+        self.root.bind("<space>", self.move_item_spacebar)
+        self.root.bind("<Control-s>", self.save_playlist)
+        self.root.bind("<Control-S>", self.save_playlist)
+        # Ctrl+1..9 switch to the first nine channels
+        for number in range(1, 10):
+            self.root.bind(f"<Control-Key-{number}>", lambda event, number=number: self.switch_channel_number(number))
+        self.update_channel_menu()
+
+    def run(self):
+        """Scans the channels and runs the main loop; --profile covers the whole session."""
+        with profile_session(self.options.profile, self.options.profile_output):
+            self.load_all_channels()
+            self.root.mainloop()
+        self.stop_watch()
+        for job in self.prefetch_jobs.values():
+            job.cancel()
+        if self.save_job is not None:
+            self.save_job.wait()  # Let a running save complete its file
+        self.catalogue_index.close()
+        if self.options.stats_output:
+            stats.dump(self.options.stats_output)
+
+    # --- Parsing ---
+    @stats.timed()
+    def extract_bxx_info(self, bxx_file_path, errors=None):
+        """Extracts duration and video standards from a .bxx file, using the metadata cache.
+
+        With an errors list, a parse failure is appended to it for
+        show_parse_errors() instead of being shown at once.
+        """
+        try:
+            return self.bxx_cache.get(bxx_file_path, parse_bxx_file)
+        except Exception as e:
+            if errors is None:
+                messagebox.showerror("Error", f"Failed to parse {bxx_file_path}: {e}")
+            else:
+                errors.append(f"{os.path.basename(bxx_file_path)}: {e}")
+            return None
+
+    def show_parse_errors(self, errors):
+        """Shows the failures collected by extract_bxx_info() in one dialog."""
+        if errors:
+            lines = errors[:REPORT_LINES]
+            if len(errors) > REPORT_LINES:
+                lines.append(f"... and {len(errors) - REPORT_LINES} more")
+            messagebox.showerror("Error", "Failed to parse:\n" + "\n".join(lines))
+
+    def playlist_entries(self, rows, errors=None):
+        """Yields (name, info, directory) for catalogue rows; clips in the clip store need no info dict."""
+        catalogue = self.catalogue
+        for row in rows:
+            info = None if catalogue.clip(row) is not None else self.extract_bxx_info(catalogue.path(row), errors)
+            yield catalogue[row], info, self.directory_path
+
+    # --- Channels ---
+    @stats.timed()
+    def load_directory(self):
+        """Rescans the active channel's directory into the left listbox."""
+        channels = self.channels
+        if channels.active is None:
+            if not self.default_load_dir:
+                return
+            channels.add(channel_name(self.default_load_dir), self.default_load_dir)
+            channels.switch(channel_name(self.default_load_dir))
+        channel = channels.active
+        try:
+            # Unchanged files come from the index; only new or modified ones get parsed
+            stale = self.reload_channel(channel)
+        except FileNotFoundError:
+            messagebox.showerror("Error", f"Directory not found: {channel.directory_path}")
+            return
+        finally:
+            self.scheduler.schedule(self.update_total_duration_display)
+        self.show_channel(channel)
+        self.start_prefetch(channel, stale)
+        self.start_watch(channel)
+
+    def reload_channel(self, channel):
+        """Rescans a channel's directory, keeping the playlist in step with the clip store.
+
+        The store drops the directory's clips while it is rescanned, so its
+        playlist entries hold their own info meanwhile. Returns the files that
+        still need parsing.
+        """
+        self.playlist.detach(channel.directory_path)
+        try:
+            return self.channels.load(channel.name)
+        finally:
+            if self.playlist.reattach(channel.directory_path):
+                self.listbox_right.refresh()
+
+    def load_all_channels(self):
+        """Scans every configured channel once, so switching between them needs no reload."""
+        missing = []
+        for channel in self.channels:
+            try:
+                stale = self.reload_channel(channel)
+            except FileNotFoundError:
+                missing.append(channel.directory_path)
+                continue
+            self.start_prefetch(channel, stale)
+            self.start_watch(channel)
+        if self.channels.active is not None:
+            self.show_channel(self.channels.active)
+        if missing:
+            messagebox.showerror("Error", "Directory not found:\n" + "\n".join(missing))
+
+    def switch_channel(self, name):
+        """Makes a channel active; its catalogue is shown as is, without rescanning."""
+        channel = self.channels.switch(name)
+        if channel.loaded:
+            self.show_channel(channel)
+        else:
+            self.load_directory()
+
+    def show_channel(self, channel):
+        """Points the left listbox and the load directory at a channel's catalogue."""
+        self.catalogue = channel.catalogue
+        self.directory_path = self.default_load_dir = channel.directory_path
+        self.channel_var.set(channel.name)
+        self.listbox_left.model = self.catalogue
+        self.listbox_left.selection_clear(0, tk.END)
+        self.listbox_left.see(0)
+        self.listbox_left.focus_set()
+        self.show_prefetch_status()
+        self.scheduler.schedule(self.update_duration_display)
+
+    def add_channel(self):
+        """Asks for a directory and a name, and adds them as a new channel."""
+        load_dir = filedialog.askdirectory()
+        if not load_dir:
+            return
+        name = simpledialog.askstring(
+            "Add Channel", "Channel name:", initialvalue=channel_name(load_dir), parent=self.root
+        )
+        if not name:
+            return
+        self.replace_channel(name, load_dir)
+        self.save_settings()
+        self.update_channel_menu()
+        self.switch_channel(name)
+
+    def replace_channel(self, name, load_dir):
+        """Adds a channel, first releasing the one it replaces if name was pointing elsewhere."""
+        old = self.channels[name] if name in self.channels else None
+        if old is not None and old.directory_path != os.path.normpath(load_dir):
+            self.release_channel(old)
+        return self.channels.add(name, load_dir)
+
+    def release_channel(self, channel):
+        """Stops a channel's watcher and prefetch job, before it is removed or replaced."""
+        self.stop_watch(channel)
+        job = self.prefetch_jobs.pop(channel.name, None)
+        if job is not None:
+            job.cancel()
+        self.playlist.detach(channel.directory_path)  # The clip store drops the channel's clips next
+
+    def remove_channel(self):
+        """Removes the active channel from the configuration."""
+        channel = self.channels.active
+        if channel is None or not messagebox.askyesno("Remove Channel", f"Remove channel {channel.name}?"):
+            return
+        self.release_channel(channel)
+        self.channels.remove(channel.name)
+        self.save_settings()
+        self.update_channel_menu()
+        if self.channels.active is not None:
+            self.switch_channel(self.channels.active.name)
+        else:
+            self.show_channel_placeholder()
+
+    def show_channel_placeholder(self):
+        """Shows an empty left listbox when no channel is configured."""
+        self.catalogue = Catalogue(self.bxx_cache, self.options.frame_rate, self.channels.clips)
+        self.directory_path = ""
+        self.channel_var.set("")
+        self.listbox_left.model = self.catalogue
+        self.listbox_left.refresh()
+        self.status_label.config(text="")
+
+    def update_channel_menu(self):
+        """Lists the channels in the Channels menu; Ctrl+1..9 switch to the first nine."""
+        menu = self.channelmenu
+        menu.delete(0, tk.END)
+        for number, name in enumerate(self.channels.names(), start=1):
+            menu.add_radiobutton(
+                label=name,
+                variable=self.channel_var,
+                value=name,
+                command=lambda name=name: self.switch_channel(name),
+                accelerator=f"Ctrl+{number}" if number <= 9 else None,
+            )
+        menu.add_separator()
+        menu.add_command(label="Add Channel...", command=self.add_channel)
+        menu.add_command(label="Remove Channel", command=self.remove_channel)
+
+    def switch_channel_number(self, number):
+        """Switches to the channel listed at position number (from 1) in the Channels menu."""
+        names = self.channels.names()
+        if 0 < number <= len(names):
+            self.switch_channel(names[number - 1])
+
+    def return_to_catalogues(self, items):
+        """Gives playlist items back to the catalogues of the channels they came from."""
+        channels = self.channels
+        for item in items:
+            channel = channels.channel_for(item.directory) if item.directory else channels.active
+            if channel is not None and channel.loaded:
+                channel.catalogue.append(item.file_name)
+
+    # --- Background prefetch and directory watching ---
+    def start_prefetch(self, channel, files):
+        """Parses the given files of a channel into the metadata cache in the background."""
+        job = self.prefetch_jobs.get(channel.name)
+        if job is not None:
+            job.cancel()
+        job = PrefetchJob([channel.path(f) for f in files], self.bxx_cache, self.metadata_reader).start()
+        self.prefetch_jobs[channel.name] = job
+        self.root.after(PREFETCH_POLL_MS, self.poll_prefetch, channel, job)
+
+    def poll_prefetch(self, channel, job):
+        """Indexes a prefetch job's results until it finishes or is replaced."""
+        if self.prefetch_jobs.get(channel.name) is not job:
+            return
+        results = job.poll()
+        if results:
+            self.index_results(channel, results)
+            if channel is self.channels.active:
+                self.listbox_left.refresh()  # Fill in the duration/standard columns of visible rows
+                self.scheduler.schedule(self.update_duration_display)  # Pending clips of the selection
+        if channel is self.channels.active:
+            self.show_prefetch_status()
+        if not job.finished:
+            self.root.after(PREFETCH_POLL_MS, self.poll_prefetch, channel, job)
+
+    def show_prefetch_status(self):
+        """Shows the active channel's clip count, or the progress of its prefetch."""
+        active = self.channels.active
+        job = self.prefetch_jobs.get(active.name) if active else None
+        if job is None or job.finished:
+            self.status_label.config(text=f"{len(self.catalogue)} clips")
+        else:
+            self.status_label.config(text=f"Reading metadata {job.done}/{job.total}")
+
+    def start_watch(self, channel=None):
+        """Watches a channel's directory (by default every loaded channel's) if watching is on."""
+        for channel in [channel] if channel is not None else list(self.channels):
+            self.stop_watch(channel)
+            if self.watch_var.get() and channel.loaded:
+                job = DirectoryWatcher(channel.directory_path, self.bxx_cache, channel.signatures).start()
+                self.watchers[channel.name] = job
+                self.root.after(WATCH_POLL_MS, self.poll_watch, channel, job)
+
+    def stop_watch(self, channel=None):
+        """Stops watching a channel's directory, or every directory."""
+        names = [channel.name] if channel is not None else list(self.watchers)
+        for name in names:
+            job = self.watchers.pop(name, None)
+            if job is not None:
+                job.stop()
+
+    def poll_watch(self, channel, job):
+        """Applies the changes a watcher has seen, until it is stopped or replaced."""
+        if self.watchers.get(channel.name) is not job:
+            return
+        changes = job.poll()
+        if changes:
+            self.apply_watch_changes(channel, changes)
+        self.root.after(WATCH_POLL_MS, self.poll_watch, channel, job)
+
+    def apply_watch_changes(self, channel, changes):
+        """Feeds files created, modified or deleted in a channel's directory into the models."""
+        playlist = self.playlist
+        indexed = []
+        deleted = []
+        failed = []
+        updated = []
+        in_playlist = set(playlist.names(channel.directory_path))
+        unlisted = set()  # Deleted files still to be taken out of the catalogue, in one pass
+        for kind, file, signature, info in changes:
+            if kind == "deleted":
+                channel.signatures.pop(file, None)
+                unlisted.add(file)
+                deleted.append(file)
+                continue
+            channel.signatures[file] = signature
+            if file in unlisted:
+                unlisted.discard(file)  # Deleted and written again: it keeps its row
+            elif kind == "created" and file not in channel.catalogue and file not in in_playlist:
+                channel.catalogue.append(file)
+            if file in in_playlist:
+                updated.append((file, info))
+            if info is not None:
+                indexed.append((file, signature, info))
+            else:
+                failed.append(file)
+        # Playlist entries of deleted files keep their info; the store is updated before the playlist reads it
+        channel.catalogue.remove_many(unlisted)
+        playlist.detach(channel.directory_path, set(deleted))
+        self.channels.discard(channel, deleted + failed)
+        self.channels.store(channel, indexed)
+        changed_playlist = False
+        for file, info in updated:
+            if playlist.update_info(file, info, channel.directory_path):
+                changed_playlist = True
+        if channel is self.channels.active:
+            if deleted:
+                self.listbox_left.selection_clear(0, tk.END)  # Rows below a deleted one have moved
+            self.listbox_left.refresh()
+            self.scheduler.schedule(self.update_duration_display)
+        if changed_playlist:
+            self.listbox_right.refresh()  # Durations and the start times after them changed
+        self.scheduler.schedule(self.update_total_duration_display)
+
+    def index_results(self, channel, results):
+        """Records freshly parsed (path, info) results in the catalogue index and the clip store."""
+        entries = []
+        for path, info in results:
+            entry = self.bxx_cache.entry(path)
+            if entry is not None:
+                entries.append((os.path.basename(path), *entry))
+        self.channels.store(channel, entries)
+        # Playlist entries of these files take their new durations from the store
+        if self.playlist.reattach(channel.directory_path, {entry[0] for entry in entries}):
+            self.listbox_right.refresh()
+            self.scheduler.schedule(self.update_total_duration_display)
+
+    # --- Playlist editing ---
+    def add_file(self, event=None):
+        """Adds the selected files (or the anchor row) from the left listbox to the playlist."""
+        listbox_left = self.listbox_left
+        rows = listbox_left.curselection() or (listbox_left.index(tk.ANCHOR),)
+        rows = [row for row in rows if 0 <= row < len(self.catalogue)]
+        if not rows:
+            return
+        # One model update and one redraw for the whole selection
+        errors = []
+        self.playlist.extend(self.playlist_entries(rows, errors))
+        self.listbox_right.refresh()
+        self.catalogue.pop_many(rows)
+        listbox_left.selection_clear(0, tk.END)
+        listbox_left.refresh()
+        self.show_parse_errors(errors)
+        self.scheduler.schedule(self.update_total_duration_display)
+
+    def remove_file(self, event=None):
+        """Removes the selected files from the playlist and returns them to their catalogues."""
+        rows = self.listbox_right.curselection()
+        if not rows:
+            return
+        self.return_to_catalogues(self.playlist.pop_many(rows))
+        self.listbox_left.refresh()
+        self.listbox_right.selection_clear(0, tk.END)
+        self.listbox_right.refresh()
+        self.scheduler.schedule(self.update_total_duration_display)
+
+    def clear_right_list(self):
+        """Clears all items from the playlist."""
+        self.playlist.clear()
+        self.listbox_right.refresh()
+        self.scheduler.schedule(self.update_total_duration_display)
+
+    def move_item_spacebar(self, event=None):
+        """Moves the selected items between the listboxes."""
+        listbox_left = self.listbox_left
+        try:
+            if listbox_left.curselection():
+                self.add_file()
+                listbox_left.selection_set(listbox_left.curselection()[0])
+                listbox_left.activate(listbox_left.curselection()[0])
+            elif self.listbox_right.curselection():
+                self.remove_file()
+                listbox_left.selection_set(listbox_left.size() - 1)
+                listbox_left.activate(listbox_left.size() - 1)
+            listbox_left.focus_set()
+        except (tk.TclError, IndexError):
+            pass
+
+    def move_item_up(self, event=None):
+        """Moves the selected item up in the playlist."""
+        self._move_item(-1)
+
+    def move_item_down(self, event=None):
+        """Moves the selected item down in the playlist."""
+        self._move_item(1)
+
+    def _move_item(self, step):
+        listbox_right = self.listbox_right
+        selection = listbox_right.curselection()
+        if not selection:
+            return
+        index = selection[0]
+        target = index + step
+        if 0 <= target < listbox_right.size():
+            self.playlist.swap(index, target)
+            listbox_right.selection_clear(0, tk.END)
+            listbox_right.selection_set(target)
+            listbox_right.activate(target)
+            listbox_right.see(target)
+
+    def move_all_items(self, source_listbox, target_listbox):
+        """Moves all items from the source listbox to the target listbox."""
+        if source_listbox is self.listbox_left:
+            errors = []
+            self.playlist.extend(self.playlist_entries(range(len(self.catalogue)), errors))
+            self.show_parse_errors(errors)
+            self.catalogue.clear()
+            self.listbox_left.selection_clear(0, tk.END)
+        else:
+            self.return_to_catalogues(self.playlist.items)
+            self.playlist.clear()
+        self.listbox_left.refresh()
+        self.listbox_right.refresh()
+        self.scheduler.schedule(self.update_total_duration_display)
+
+    def duplicate_entry(self, event=None):
+        """Appends copies of the selected entries to the playlist."""
+        rows = self.listbox_right.curselection()
+        if not rows:
+            return
+        self.playlist.duplicate_many(rows)
+        self.listbox_right.refresh()
+        self.scheduler.schedule(self.update_total_duration_display)
+
+    def fill_to_duration(self):
+        """Appends catalogue clips that bring the playlist to a target duration."""
+        catalogue = self.catalogue
+        if not len(catalogue):
+            messagebox.showwarning("Warning", "Please load a directory with clips first.")
+            return
+        target_text = simpledialog.askstring(
+            "Fill to Duration", "Target playlist duration (hh:mm:ss:ff):", parent=self.root
+        )
+        if target_text is None:
+            return
+        tolerance_text = simpledialog.askstring(
+            "Fill to Duration", "Tolerance (hh:mm:ss:ff):", initialvalue="00:00:00:00", parent=self.root
+        )
+        if tolerance_text is None:
+            return
+        try:
+            target = parse_timecode(target_text, fps=self.playlist_view.fps)
+            tolerance = parse_timecode(tolerance_text, fps=self.playlist_view.fps)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        # Cached durations only; the selected clips must be part of the fill
+        clips = [(name, catalogue.duration(row) or 0) for row, name in enumerate(catalogue.names)]
+        must_include = [catalogue[row] for row in self.listbox_left.curselection()]
+        result = fill_duration(
+            clips, target - self.playlist.total_frames, tolerance, must_include=must_include
+        )
+        if result is None:
+            message = "No combination of the loaded clips fits that duration."
+            job = self.prefetch_jobs.get(self.channels.active.name)
+            if job is not None and not job.finished:
+                message += "\nSome durations are still being read; try again once loading is done."
+            messagebox.showwarning("Warning", message)
+            return
+
+        rows = [catalogue.row_of(name) for name in result.names]
+        errors = []
+        self.playlist.extend(self.playlist_entries(rows, errors))
+        catalogue.pop_many(rows)
+        self.listbox_left.selection_clear(0, tk.END)
+        self.listbox_left.refresh()
+        self.listbox_right.refresh()
+        self.show_parse_errors(errors)
+        self.scheduler.schedule(self.update_total_duration_display)
+
+    # --- Search and navigation ---
+    def seek_timecode(self, event=None):
+        """Selects the playlist item playing at the timecode typed in the seek entry."""
+        try:
+            frame = parse_timecode(self.seek_entry.get(), fps=self.playlist_view.fps)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        # Binary search over the playlist's start offsets
+        index = self.playlist.seek(frame)
+        if index is None:
+            end = format_duration(self.playlist.total_frames, self.options.frame_rate)
+            messagebox.showwarning("Warning", f"The playlist ends at {end}.")
+            return
+        listbox_right = self.listbox_right
+        listbox_right.selection_clear(0, tk.END)
+        listbox_right.selection_set(index)
+        listbox_right.activate(index)
+        listbox_right.see(index)
+        listbox_right.focus_set()
+
+    def on_left_listbox_keypress(self, event):
+        """Handles keyboard events for alphanumeric search in the left listbox."""
+        key = event.char.lower()
+        if key.isalnum():
+            self.typed_str.append(key)
+            self.scheduler.debounce(SEARCH_RESET_MS, self.reset_search)
+
+            # Prefix matches first, then partial matches, across every loaded channel
+            found = self.channels.find("".join(self.typed_str))
+            if found is not None:
+                channel, i = found
+                if channel is not self.channels.active:
+                    self.switch_channel(channel.name)
+                listbox_left = self.listbox_left
+                listbox_left.selection_clear(0, tk.END)
+                listbox_left.selection_set(i)
+                listbox_left.activate(i)
+                listbox_left.see(i)
+
+    def reset_search(self):
+        """Resets the alphanumeric search string."""
+        self.typed_str.clear()
+
+    # --- Duration display ---
+    def update_duration_display(self):
+        """Updates the duration display with the combined length of the left listbox selection.
+
+        Only clips already in the store or the cache are counted; the others
+        show as pending until the prefetch or the watcher has parsed them.
+        """
+        rows = self.listbox_left.curselection()
+        total, pending = self.catalogue.total(rows)
+        text = format_duration(total, self.options.frame_rate) if pending < len(rows) else ""
+        if pending:
+            text = f"{text} ({pending} pending)".lstrip()
+        self.duration_label.config(text=text)
+
+    @stats.timed()
+    def update_total_duration_display(self):
+        """Updates the total duration display from the playlist model's running total."""
+        self.total_duration_label.config(
+            text=format_duration(self.playlist.total_frames, self.options.frame_rate)
+        )
+
+    # --- Saving ---
+    def save_playlist(self, event=None):
+        """Saves a snapshot of the current playlist to a .plx file on a worker thread."""
+        if self.save_job is not None and not self.save_job.finished:
+            messagebox.showwarning("Warning", "A playlist is already being saved.")
+            return
+        if not self.directory_path or self.listbox_right.size() == 0:
+            messagebox.showwarning("Warning", "Please load a directory and add files to the playlist.")
+            return
+
+        list_title = self.list_title_entry.get()
+        four_digits = simpledialog.askstring("Input", "Enter 4 digits:", parent=self.root)
+        if not is_valid_code(four_digits):
+            messagebox.showerror("Error", "Invalid input. Please enter 4 digits.")
+            return
+
+        playlist_path = os.path.join(self.default_save_dir, playlist_filename(list_title, four_digits))
+        # Validate every clip first and only write once the report is accepted
+        self.start_save(playlist_path, strict=True)
+
+    def start_save(self, playlist_path, strict):
+        """Starts a save job; a strict one stops after validation if any clip has a problem."""
+        self.save_job = SaveJob(
+            playlist_path, self.playlist, self.directory_path, self.bxx_cache, self.metadata_reader,
+            fps=self.options.frame_rate, strict=strict,
+        ).start()
+        self.btn_save.config(state=tk.DISABLED)
+        self.save_progress.config(value=0)
+        self.save_progress.pack(pady=5)
+        self.btn_cancel_save.pack(pady=5)
+        self.root.after(SAVE_POLL_MS, self.poll_save, self.save_job)
+
+    def cancel_save(self):
+        """Cancels the running save, if any."""
+        if self.save_job is not None:
+            self.save_job.cancel()
+
+    def poll_save(self, job):
+        """Shows the progress of a save job and reports its outcome once finished."""
+        self.save_progress.config(value=job.fraction)
+        if not job.finished:
+            self.root.after(SAVE_POLL_MS, self.poll_save, job)
+            return
+
+        self.save_progress.pack_forget()
+        self.btn_cancel_save.pack_forget()
+        self.btn_save.config(state=tk.NORMAL)
+        if job.stage == "cancelled":
+            return
+        if job.error is not None:
+            messagebox.showerror("Error", f"Failed to save playlist: {job.error}")
+            return
+        report = job.report
+        if job.stage == "invalid":
+            left_out = len(report.left_out)
+            question = f"Save anyway, leaving out {left_out} unreadable clip(s)?" if left_out else "Save anyway?"
+            if messagebox.askyesno(
+                "Validation",
+                "\n".join([report.summary() + ":", ""] + report.lines(REPORT_LINES) + ["", question]),
+                icon=messagebox.WARNING,
+            ):
+                self.start_save(job.playlist_path, strict=False)
+            return
+        message = f"Playlist saved as {job.playlist_path}"
+        if report.left_out:
+            message += f"\n{len(report.left_out)} unreadable clip(s) left out."
+        messagebox.showinfo("Success", message)
+        if not self.watchers:
+            self.load_directory()  # Refresh the left listbox; watchers keep it current
+
+    # --- Settings ---
+    def save_settings(self):
+        """Saves the load/save directories and the channels to the config file."""
+        settings.save_settings(
+            self.default_load_dir,
+            self.default_save_dir,
+            self.config_file,
+            channels=[(channel.name, channel.directory_path) for channel in self.channels],
+        )
+
+    def load_settings(self):
+        """Loads the config file; a lone load directory becomes the only channel."""
+        channels = self.channels
+        self.default_load_dir, self.default_save_dir = settings.load_settings(self.config_file)
+        for name, load_dir in settings.load_channels(self.config_file):
+            channels.add(name, load_dir)
+        if not len(channels) and self.default_load_dir:
+            channels.add(channel_name(self.default_load_dir), self.default_load_dir)
+        if len(channels):
+            active = channels.channel_for(self.default_load_dir) if self.default_load_dir else None
+            channels.switch(active.name if active is not None else channels.names()[0])
+
+    def set_load_directory(self):
+        """Points the active channel (or a new one) at another load directory."""
+        load_dir = filedialog.askdirectory()
+        if not load_dir:
+            return
+        self.default_load_dir = load_dir
+        active = self.channels.active
+        name = active.name if active is not None else channel_name(load_dir)
+        self.replace_channel(name, load_dir)
+        self.save_settings()
+        self.update_channel_menu()
+        self.switch_channel(name)
+
+    def set_save_directory(self):
+        """Sets the default save directory."""
+        self.default_save_dir = filedialog.askdirectory()
+        self.save_settings()
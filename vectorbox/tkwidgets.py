@@ -0,0 +1,418 @@
+"""Tk widgets shared by the GUI front-ends.
+
+Unlike the rest of the package this module imports tkinter; it is only
+imported by the front-ends themselves.
+"""
+import math
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+from tkinter.font import nametofont
+
+from .stats import stats
+
+WHEEL_ROWS = 3  # Rows scrolled per mouse wheel notch
+
+
+class VirtualListbox(ttk.Frame):
+    """Listbox-like view that only draws the rows currently visible.
+
+    Rows come from a model providing len(), model[i] (the value returned by
+    get(i)) and model.row(i), which returns the texts for the name column
+    followed by one text per fixed-width column. Models may also provide
+    model.rows(first, stop), returning those texts for a range of rows in
+    one call, which is used for the visible window. A small pool of canvas
+    items is reused for the visible window, so scrolling, searching and
+    theming cost O(visible rows) however long the model is.
+
+    The subset of the tk.Listbox API used by the front-ends is supported
+    (size, get, curselection, selection_set/clear, activate, see, index,
+    bind, focus_set), and <<ListboxSelect>> is generated when the user
+    changes the selection. Call refresh() after changing the model.
+
+    With selectmode="extended", Control-click toggles rows, Shift-click and
+    Shift-Up/Down extend the selection from the anchor, and Control-a
+    selects everything, as in a Tk listbox.
+    """
+
+    def __init__(self, master, model, column_samples=("00:00:00:00", "1080i50"),
+                 font=None, width=30, height=30, bg="white", fg="black",
+                 select_bg="#c3c3c3", select_fg="black", selectmode=tk.SINGLE,
+                 **canvas_options):
+        super().__init__(master)
+        self.model = model
+        self.selectmode = selectmode
+        self.font = font or nametofont("TkDefaultFont")
+        self._pad = 4
+        self._row_height = self.font.metrics("linespace") + 2
+        self._column_widths = [
+            self.font.measure(sample) + 2 * self._pad for sample in column_samples
+        ]
+        self._colors = {"bg": bg, "fg": fg, "select_bg": select_bg, "select_fg": select_fg}
+
+        self._top = 0  # Model row shown in the first slot
+        self._slots = []  # Canvas item ids per visible row: row bg, name, column bg, columns...
+        self._visible = 1  # Fully visible rows
+        self._selection = set()
+        self._active = 0
+        self._anchor = 0
+
+        self.canvas = tk.Canvas(
+            self,
+            width=self.font.measure("0") * width + sum(self._column_widths),
+            height=self._row_height * height,
+            bg=bg,
+            borderwidth=0,
+            takefocus=1,
+            **canvas_options,
+        )
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Control-Button-1>", self._on_control_click)
+        self.canvas.bind("<Shift-Button-1>", self._on_shift_click)
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda event: self._scroll_rows(-WHEEL_ROWS))
+        self.canvas.bind("<Button-5>", lambda event: self._scroll_rows(WHEEL_ROWS))
+        self.canvas.bind("<Up>", lambda event: self._move_active(-1))
+        self.canvas.bind("<Down>", lambda event: self._move_active(1))
+        self.canvas.bind("<Prior>", lambda event: self._move_active(-self._visible))
+        self.canvas.bind("<Next>", lambda event: self._move_active(self._visible))
+        self.canvas.bind("<Home>", lambda event: self._move_active(-len(self.model)))
+        self.canvas.bind("<End>", lambda event: self._move_active(len(self.model)))
+        self.canvas.bind("<Shift-Up>", lambda event: self._extend_active(-1))
+        self.canvas.bind("<Shift-Down>", lambda event: self._extend_active(1))
+        self.canvas.bind("<Control-a>", lambda event: self._select_all())
+
+    # --- Listbox API ---
+    def size(self):
+        return len(self.model)
+
+    def get(self, index):
+        return self.model[self.index(index)]
+
+    def index(self, index):
+        """Resolves an int, numeric string, "end", "active" or "anchor" to a row."""
+        if isinstance(index, int):
+            return index
+        if index == tk.END:
+            return len(self.model) - 1
+        if index == tk.ACTIVE:
+            return self._active
+        if index == tk.ANCHOR:
+            return self._anchor
+        try:
+            return int(index)
+        except (TypeError, ValueError):
+            raise tk.TclError(f'bad listbox index "{index}"') from None
+
+    def curselection(self):
+        return tuple(sorted(self._selection))
+
+    def selection_includes(self, index):
+        return self.index(index) in self._selection
+
+    def selection_set(self, first, last=None):
+        first = self.index(first)
+        last = first if last is None else self.index(last)
+        size = len(self.model)
+        self._selection.update(i for i in range(first, last + 1) if 0 <= i < size)
+        self._anchor = first
+        self._render()
+
+    def selection_clear(self, first, last=None):
+        first = self.index(first)
+        last = first if last is None else self.index(last)
+        if last - first + 1 >= len(self._selection):
+            self._selection = {i for i in self._selection if not first <= i <= last}
+        else:
+            self._selection.difference_update(range(first, last + 1))
+        self._render()
+
+    def activate(self, index):
+        self._active = max(0, min(self.index(index), len(self.model) - 1))
+
+    def see(self, index):
+        index = self.index(index)
+        if index < self._top:
+            self._top = index
+        elif index >= self._top + self._visible:
+            self._top = index - self._visible + 1
+        self._render()
+
+    def focus_set(self):
+        self.canvas.focus_set()
+
+    def bind(self, sequence=None, func=None, add=None):
+        return self.canvas.bind(sequence, func, add)
+
+    # --- Model and theme updates ---
+    def refresh(self):
+        """Redraws the visible rows after the model changed, dropping selection past its end."""
+        size = len(self.model)
+        if any(i >= size for i in self._selection):
+            self._selection = {i for i in self._selection if i < size}
+        self._active = max(0, min(self._active, size - 1))
+        self._render()
+
+    def set_colors(self, bg=None, fg=None, select_bg=None, select_fg=None):
+        """Changes the row colors; only the visible rows are restyled."""
+        for key, value in (("bg", bg), ("fg", fg), ("select_bg", select_bg), ("select_fg", select_fg)):
+            if value is not None:
+                self._colors[key] = value
+        self.canvas.configure(bg=self._colors["bg"])
+        self._render()
+
+    # --- Scrolling ---
+    def yview(self, *args):
+        """Scrollbar protocol: ("moveto", fraction) or ("scroll", number, "units"|"pages")."""
+        if not args:
+            size = max(len(self.model), 1)
+            return self._top / size, min((self._top + self._visible) / size, 1.0)
+        if args[0] == tk.MOVETO:
+            self._top = int(float(args[1]) * len(self.model))
+        elif args[0] == tk.SCROLL:
+            step = int(args[1]) * (self._visible if args[2] == tk.PAGES else 1)
+            self._top += step
+        self._render()
+
+    def _scroll_rows(self, rows):
+        self._top += rows
+        self._render()
+
+    def _on_wheel(self, event):
+        self._scroll_rows(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+
+    # --- User selection ---
+    def _select_row(self, row):
+        self._selection = {row}
+        self._active = self._anchor = row
+        self.see(row)
+        self._selection_changed()
+
+    @stats.timed("VirtualListbox.select")
+    def _selection_changed(self):
+        """Runs the <<ListboxSelect>> bindings, which Tk calls before event_generate() returns."""
+        self.canvas.event_generate("<<ListboxSelect>>")
+
+    def _row_at(self, event):
+        self.canvas.focus_set()
+        row = self._top + int(event.y // self._row_height)
+        return row if 0 <= row < len(self.model) else None
+
+    def _on_click(self, event):
+        row = self._row_at(event)
+        if row is not None:
+            self._select_row(row)
+
+    def _on_control_click(self, event):
+        row = self._row_at(event)
+        if row is None:
+            return
+        if self.selectmode != tk.EXTENDED:
+            self._select_row(row)
+            return
+        self._selection ^= {row}
+        self._active = self._anchor = row
+        self._render()
+        self._selection_changed()
+
+    def _on_shift_click(self, event):
+        row = self._row_at(event)
+        if row is not None:
+            self._select_range(row)
+
+    def _select_range(self, row):
+        """Selects anchor..row (extended mode), keeping the anchor."""
+        if self.selectmode != tk.EXTENDED:
+            self._select_row(row)
+            return
+        first, last = sorted((self._anchor, row))
+        self._selection = set(range(first, last + 1))
+        self._active = row
+        self.see(row)
+        self._selection_changed()
+
+    def _extend_active(self, delta):
+        size = len(self.model)
+        if size:
+            self._select_range(max(0, min(self._active + delta, size - 1)))
+        return "break"
+
+    def _select_all(self):
+        if self.selectmode == tk.EXTENDED and len(self.model):
+            self._selection = set(range(len(self.model)))
+            self._render()
+            self._selection_changed()
+        return "break"
+
+    def _move_active(self, delta):
+        size = len(self.model)
+        if size:
+            self._select_row(max(0, min(self._active + delta, size - 1)))
+        return "break"
+
+    # --- Drawing ---
+    def _on_configure(self, event):
+        canvas = self.canvas
+        row_height = self._row_height
+        self._visible = max(1, event.height // row_height)
+        slot_count = math.ceil(event.height / row_height)
+        while len(self._slots) < slot_count:
+            self._slots.append(
+                [canvas.create_rectangle(0, 0, 0, 0, width=0),
+                 canvas.create_text(0, 0, anchor="w", font=self.font),
+                 canvas.create_rectangle(0, 0, 0, 0, width=0)]
+                + [canvas.create_text(0, 0, anchor="w", font=self.font)
+                   for _ in self._column_widths]
+            )
+        while len(self._slots) > slot_count:
+            canvas.delete(*self._slots.pop())
+
+        columns_x = event.width - sum(self._column_widths)
+        for k, (row_bg, name, column_bg, *columns) in enumerate(self._slots):
+            y = k * row_height
+            canvas.coords(row_bg, 0, y, event.width, y + row_height)
+            canvas.coords(name, self._pad, y + row_height / 2)
+            canvas.coords(column_bg, columns_x, y, event.width, y + row_height)
+            x = columns_x
+            for column, column_width in zip(columns, self._column_widths):
+                canvas.coords(column, x + self._pad, y + row_height / 2)
+                x += column_width
+        self._render()
+
+    @stats.timed("VirtualListbox._render")
+    def _render(self):
+        size = len(self.model)
+        self._top = max(0, min(self._top, size - self._visible))
+        colors = self._colors
+        itemconfigure = self.canvas.itemconfigure
+        rows = getattr(self.model, "rows", None)
+        window = rows(self._top, min(self._top + len(self._slots), size)) if rows is not None else None
+        for k, slot in enumerate(self._slots):
+            row = self._top + k
+            if row >= size:
+                for item in slot:
+                    itemconfigure(item, state="hidden")
+                continue
+            selected = row in self._selection
+            fill = colors["select_bg"] if selected else colors["bg"]
+            text_color = colors["select_fg"] if selected else colors["fg"]
+            row_bg, name, column_bg, *columns = slot
+            texts = window[k] if window is not None else self.model.row(row)
+            itemconfigure(row_bg, fill=fill, state="normal")
+            itemconfigure(column_bg, fill=fill, state="normal")
+            itemconfigure(name, text=texts[0], fill=text_color, state="normal")
+            for column, text in zip(columns, texts[1:]):
+                itemconfigure(column, text=text, fill=text_color, state="normal")
+        if size:
+            self.scrollbar.set(self._top / size, min((self._top + self._visible) / size, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+class RefreshScheduler:
+    """Coalesces UI refresh work on the Tk event loop.
+
+    schedule(callback, *args) queues a call for the next flush, which runs
+    at most once per frame; asking again for the same call before then is
+    free. debounce(delay_ms, callback) runs callback once the requests have
+    stopped for delay_ms, e.g. to reset type-ahead. Everything runs on the
+    Tk thread, so callbacks may touch widgets and shared state freely.
+    """
+
+    def __init__(self, widget, frame_ms=16):
+        self.widget = widget
+        self.frame_ms = frame_ms
+        self._pending = {}  # (callback, args) -> None, in request order
+        self._flush_id = None
+        self._debounced = {}  # callback -> after id
+
+    def schedule(self, callback, *args):
+        """Queues callback(*args) for the next flush, unless it is already queued."""
+        self._pending[(callback, args)] = None
+        if self._flush_id is None:
+            self._flush_id = self.widget.after(self.frame_ms, self._flush)
+
+    def debounce(self, delay_ms, callback):
+        """Runs callback delay_ms after the last debounce() call for it."""
+        after_id = self._debounced.pop(callback, None)
+        if after_id is not None:
+            self.widget.after_cancel(after_id)
+        self._debounced[callback] = self.widget.after(delay_ms, self._fire, callback)
+
+    def flush(self):
+        """Runs the queued calls now."""
+        if self._flush_id is not None:
+            self.widget.after_cancel(self._flush_id)
+        self._flush()
+
+    def _fire(self, callback):
+        del self._debounced[callback]
+        callback()
+
+    def _flush(self):
+        self._flush_id = None
+        pending, self._pending = self._pending, {}
+        for callback, args in pending:
+            callback(*args)
+
+
+class StatsWindow(tk.Toplevel):
+    """Window showing the figures of a vectorbox.stats.Stats, refreshed every second.
+
+    Timing can be switched on and off, reset, and saved as JSON from here.
+    """
+
+    REFRESH_MS = 1000
+
+    def __init__(self, master, stats, title="Statistics"):
+        super().__init__(master)
+        self.title(title)
+        self.stats = stats
+        self.enabled_var = tk.BooleanVar(value=stats.enabled)
+
+        controls = ttk.Frame(self)
+        controls.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
+        ttk.Checkbutton(
+            controls, text="Record timings", variable=self.enabled_var, command=self._toggle
+        ).pack(side=tk.LEFT)
+        ttk.Button(controls, text="Reset", command=self._reset).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls, text="Save JSON...", command=self._save).pack(side=tk.LEFT)
+
+        self.text = tk.Text(self, width=72, height=20, font="TkFixedFont", wrap=tk.NONE)
+        self.text.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._refresh()
+
+    def _toggle(self):
+        self.stats.enable(self.enabled_var.get())
+        self._show()
+
+    def _reset(self):
+        self.stats.reset()
+        self._show()
+
+    def _save(self):
+        path = filedialog.asksaveasfilename(
+            parent=self, defaultextension=".json", filetypes=[("JSON", "*.json")]
+        )
+        if not path:
+            return
+        try:
+            self.stats.dump(path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save statistics: {e}", parent=self)
+
+    def _show(self):
+        self.text.configure(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", self.stats.format())
+        self.text.configure(state=tk.DISABLED)
+
+    def _refresh(self):
+        if not self.winfo_exists():
+            return
+        self._show()
+        self.after(self.REFRESH_MS, self._refresh)
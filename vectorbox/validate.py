@@ -0,0 +1,164 @@
+"""Checking a playlist's clips before it is written.
+
+validate_playlist() reads every entry's .bxx file through a MetadataReader,
+so distinct files are checked concurrently and each is parsed at most once,
+and collects everything wrong into one ValidationReport instead of stopping
+or prompting at the first broken clip.
+"""
+from collections import Counter, namedtuple
+
+from .reader import MetadataReader
+
+# Problem kinds, in the order a report lists them
+MISSING = "missing"
+UNREADABLE = "unreadable"
+PARSE_ERROR = "parse error"
+ZERO_DURATION = "zero duration"
+STANDARD_MISMATCH = "mismatched VideoStandard"
+STANDARD_TIE = "undecided VideoStandard"
+PROBLEM_KINDS = (MISSING, UNREADABLE, PARSE_ERROR, ZERO_DURATION, STANDARD_MISMATCH, STANDARD_TIE)
+# Kinds whose entries have no info and are left out of the written file
+BLOCKING_KINDS = (MISSING, UNREADABLE, PARSE_ERROR)
+
+Problem = namedtuple("Problem", "index file_name kind detail")
+
+
+class ValidationReport:
+    """The outcome of validate_playlist().
+
+    infos maps each distinct path to its parsed info (None when it could
+    not be read), problems lists a Problem per offending playlist entry in
+    playlist order, and standard is the VideoStandard the entries were
+    checked against (None when no entry declares one, or when tied lists
+    the standards that most entries use in equal numbers).
+    """
+
+    def __init__(self, infos, problems, standard, entries, tied=()):
+        self.infos = infos
+        self.problems = problems
+        self.standard = standard
+        self.entries = entries
+        self.tied = tied
+
+    def __len__(self):
+        return len(self.problems)
+
+    def __iter__(self):
+        return iter(self.problems)
+
+    @property
+    def ok(self):
+        return not self.problems
+
+    @property
+    def left_out(self):
+        """The problems whose entries will be missing from the written playlist."""
+        return [problem for problem in self.problems if problem.kind in BLOCKING_KINDS]
+
+    def counts(self):
+        """Returns {kind: number of entries}, for the kinds that occurred, in PROBLEM_KINDS order."""
+        counts = Counter(problem.kind for problem in self.problems)
+        return {kind: counts[kind] for kind in PROBLEM_KINDS if counts[kind]}
+
+    def summary(self):
+        """Returns a one-line description such as "3 problems in 120 entries: 2 missing, 1 parse error"."""
+        if self.ok:
+            return f"No problems in {self.entries} entries"
+        kinds = ", ".join(f"{count} {kind}" for kind, count in self.counts().items())
+        noun = "problem" if len(self.problems) == 1 else "problems"
+        return f"{len(self.problems)} {noun} in {self.entries} entries: {kinds}"
+
+    def lines(self, limit=None):
+        """Returns one "#position file: kind (detail)" line per problem, at most limit of them."""
+        lines = []
+        for problem in self.problems[:limit]:
+            line = f"#{problem.index + 1} {problem.file_name}: {problem.kind}"
+            if problem.detail:
+                line += f" ({problem.detail})"
+            lines.append(line)
+        if limit is not None and len(self.problems) > limit:
+            lines.append(f"... and {len(self.problems) - limit} more")
+        return lines
+
+    def lookup(self, path):
+        """Returns the info read for path, for Playlist.refresh()."""
+        return self.infos.get(path)
+
+
+def _classify(error):
+    if isinstance(error, FileNotFoundError):
+        return MISSING, None
+    if isinstance(error, OSError):
+        return UNREADABLE, error.strerror or str(error)
+    return PARSE_ERROR, str(error)
+
+
+def _standards(info):
+    return [standard for standard in info["video_standards"] if standard]
+
+
+def validate_playlist(playlist, directory_path, reader=None, expected_standard=None,
+                      cancel_event=None, progress=None):
+    """Reads and checks every entry of a Playlist and returns a ValidationReport.
+
+    Each distinct file is read once, concurrently, through reader (a
+    MetadataReader, by default one without a cache). An entry is reported
+    when its file is missing, unreadable or cannot be parsed, when its
+    duration is zero, or when one of its VideoStandards differs from
+    expected_standard -- by default the standard most entries use. When
+    two or more standards are used by equally many entries, none of them
+    is picked: every entry declaring a standard is reported as undecided.
+    progress(done, total) is called as reads complete, counting entries.
+    Returns None if cancel_event was set before every file was read.
+    """
+    reader = reader if reader is not None else MetadataReader()
+    paths = [item.path(directory_path) for item in playlist]
+    uses = Counter(paths)
+    infos, errors = {}, {}
+    done = 0
+    for path, info, error in reader.read_many(uses, cancel_event):
+        infos[path] = info
+        if error is not None:
+            errors[path] = error
+        done += uses[path]
+        if progress is not None:
+            progress(done, len(paths))
+    if cancel_event is not None and cancel_event.is_set():
+        return None
+
+    standard = expected_standard
+    tied = ()
+    if standard is None:
+        votes = Counter(
+            standard
+            for path in paths if infos[path] is not None
+            for standard in dict.fromkeys(_standards(infos[path]))
+        )
+        if votes:
+            ranked = votes.most_common()
+            tied = tuple(found for found, count in ranked if count == ranked[0][1])
+            if len(tied) == 1:
+                standard, tied = tied[0], ()
+
+    problems = []
+    for index, (item, path) in enumerate(zip(playlist, paths)):
+        info = infos[path]
+        if info is None:
+            kind, detail = _classify(errors[path])
+            problems.append(Problem(index, item.file_name, kind, detail))
+            continue
+        if info["duration"] <= 0:
+            problems.append(Problem(index, item.file_name, ZERO_DURATION, None))
+        found = list(dict.fromkeys(_standards(info)))
+        others = [other for other in found if other != standard]
+        if standard is not None and others:
+            problems.append(Problem(
+                index, item.file_name, STANDARD_MISMATCH, f"{', '.join(others)}, expected {standard}"
+            ))
+        elif tied and found:
+            problems.append(Problem(
+                index, item.file_name, STANDARD_TIE,
+                f"{', '.join(found)}; {' and '.join(tied)} are used equally often",
+            ))
+    return ValidationReport(infos, problems, standard, len(paths), tied)
+
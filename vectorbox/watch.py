@@ -0,0 +1,253 @@
+"""Watching a load directory for .bxx files being added, changed or removed."""
+import ctypes
+import ctypes.util
+import os
+import queue
+import re
+import select
+import struct
+import sys
+import threading
+
+from .bxx import parse_bxx_file
+from .index import scan_directory
+
+DEFAULT_INTERVAL = 2.0  # Seconds between scans when polling
+WAKE_INTERVAL = 0.5  # Seconds the inotify loop waits before checking for stop()
+MOUNTS_FILE = "/proc/mounts"
+
+# File system types whose changes made on other hosts inotify never reports
+NETWORK_FS_TYPES = frozenset({
+    "9p", "afs", "ceph", "cifs", "fuse.gvfsd-fuse", "fuse.sshfs", "glusterfs", "ncpfs",
+    "nfs", "nfs4", "smb3", "smbfs",
+})
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _load_inotify():
+    """Returns libc with the inotify functions set up, or None where unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_init1.restype = ctypes.c_int
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_add_watch.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _unescape_mount_field(field):
+    """Decodes the octal escapes (e.g. \\040 for a space) of a /proc/mounts field."""
+    return re.sub(r"\\([0-7]{3})", lambda match: chr(int(match.group(1), 8)), field)
+
+
+def filesystem_type(path, mounts_file=MOUNTS_FILE):
+    """Returns the type of the file system path is on, e.g. "ext4" or "cifs"; None where unknown.
+
+    Looks up the longest mount point containing path in mounts_file.
+    """
+    path = os.path.realpath(path)
+    found, found_type = "", None
+    try:
+        with open(mounts_file, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = _unescape_mount_field(fields[1])
+                inside = path == mount_point or path.startswith(mount_point.rstrip("/") + "/")
+                if inside and len(mount_point) >= len(found):
+                    found, found_type = mount_point, fields[2]
+    except OSError:
+        return None
+    return found_type
+
+
+def is_network_path(path, mounts_file=MOUNTS_FILE):
+    """Returns True if path is on an NFS, SMB or other network file system."""
+    return filesystem_type(path, mounts_file) in NETWORK_FS_TYPES
+
+
+class DirectoryWatcher:
+    """Reports .bxx files created, modified or deleted in a directory.
+
+    Uses inotify on Linux and otherwise compares os.scandir snapshots every
+    interval seconds. inotify only sees changes made through the local
+    kernel, so by default (use_inotify=None) directories on network file
+    systems (see is_network_path) are polled instead; pass True or False to
+    choose explicitly.
+
+    Created and modified files are parsed into the cache on the watcher
+    thread before they are reported. Callers poll() from the GUI thread for
+    (kind, file name, (size, mtime_ns), info) changes, where kind is
+    "created", "modified" or "deleted"; signature and info are None for
+    deletions, and info is None for files that failed to parse.
+
+    known maps the file names the caller already has to their signatures,
+    so only changes relative to that listing are reported.
+    """
+
+    def __init__(self, directory_path, cache, known=None, parse=parse_bxx_file,
+                 interval=DEFAULT_INTERVAL, use_inotify=None):
+        self.directory_path = directory_path
+        self.cache = cache
+        self.parse = parse
+        self.interval = interval
+        self.use_inotify = use_inotify
+        self.backend = None  # "inotify" or "poll" once started
+        self._known = dict(known) if known is not None else None
+        self._changes = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Starts watching in a daemon thread and returns self."""
+        self._thread = threading.Thread(target=self._run, name="bxx-watch", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops watching; returns without waiting for the thread."""
+        self._stop.set()
+
+    @property
+    def stopped(self):
+        return self._stop.is_set()
+
+    def wait(self, timeout=None):
+        """Blocks until the watcher thread exits."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def poll(self):
+        """Returns the changes seen since the last call."""
+        changes = []
+        while True:
+            try:
+                changes.append(self._changes.get_nowait())
+            except queue.Empty:
+                return changes
+
+    # --- Change detection ---
+    def _report(self, name, signature):
+        """Reports name as created / modified (signature) or deleted (None) if it differs from what is known."""
+        path = os.path.join(self.directory_path, name)
+        previous = self._known.get(name)
+        if signature is None:
+            if name in self._known:
+                del self._known[name]
+                self.cache.invalidate(path)
+                self._changes.put(("deleted", name, None, None))
+            return
+        if previous == signature:
+            return
+        self._known[name] = signature
+        try:
+            info = self.cache.get(path, self.parse)
+            entry = self.cache.entry(path)
+            if entry is not None:
+                signature = entry[0]
+        except Exception:
+            info = None
+        self._changes.put(("created" if previous is None else "modified", name, signature, info))
+
+    def _rescan(self):
+        """Diffs a fresh directory listing against what is known."""
+        try:
+            current = scan_directory(self.directory_path)
+        except OSError:
+            current = {}
+        for name in [name for name in self._known if name not in current]:
+            self._report(name, None)
+        for name, signature in current.items():
+            self._report(name, signature)
+
+    def _stat(self, name):
+        try:
+            st = os.stat(os.path.join(self.directory_path, name))
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    # --- Backends ---
+    def _run(self):
+        if self._known is None:
+            try:
+                self._known = scan_directory(self.directory_path)
+            except OSError:
+                self._known = {}
+        use_inotify = self.use_inotify
+        if use_inotify is None:
+            use_inotify = not is_network_path(self.directory_path)
+        libc = _load_inotify() if use_inotify else None
+        if libc is None or not self._run_inotify(libc):
+            self._run_polling()
+
+    def _run_polling(self):
+        self.backend = "poll"
+        self._rescan()
+        while not self._stop.wait(self.interval):
+            self._rescan()
+
+    def _run_inotify(self, libc):
+        """Watches with inotify until stopped; returns False if inotify could not be set up."""
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return False
+        try:
+            if libc.inotify_add_watch(fd, os.fsencode(self.directory_path), _WATCH_MASK) < 0:
+                return False
+            self.backend = "inotify"
+            self._rescan()  # Catch up with changes made before the watch was in place
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd], [], [], WAKE_INTERVAL)
+                if not ready:
+                    continue
+                try:
+                    data = os.read(fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                if not self._handle_events(data):
+                    break
+        finally:
+            os.close(fd)
+        return True
+
+    def _handle_events(self, data):
+        """Applies a buffer of inotify events; returns False once the directory itself is gone."""
+        offset = 0
+        while offset < len(data):
+            _wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                self._rescan()
+            elif mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                for known_name in list(self._known):
+                    self._report(known_name, None)
+                return False
+            elif name.lower().endswith(".bxx"):
+                if mask & (IN_DELETE | IN_MOVED_FROM):
+                    self._report(name, None)
+                else:
+                    self._report(name, self._stat(name))
+        return True
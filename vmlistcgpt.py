@@ -3,42 +3,33 @@
 import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
-import xml.etree.ElementTree as ET
-from xml.dom.minidom import parseString
 from tkinter.font import Font
 import datetime
-import threading
+from vectorbox import (
+    BxxInfoCache,
+    Playlist,
+    format_duration,
+    is_valid_code,
+    parse_bxx_file,
+    playlist_filename,
+    settings,
+    write_playlist,
+)
+from vectorbox.tkwidgets import RefreshScheduler
 
 # Global Variables
 directory_path = ""
 default_load_dir = ""
 default_save_dir = ""
 typed_str = []
-search_timer = None
+bxx_cache = BxxInfoCache("bxx_cache.json")
+playlist = Playlist()
 
 # --- Helper Functions ---
-def format_duration(duration_frames, fps=25):
-    """Convert frame duration to hh:mm:ss:ff format."""
-    total_seconds = duration_frames // fps
-    frames = duration_frames % fps
-    hours, remainder = divmod(total_seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}"
-
 def extract_bxx_info(bxx_file_path):
     """Extract video stream duration from a .bxx file."""
     try:
-        with open(bxx_file_path, "r", encoding="utf-8") as file:
-            bxx_content = file.read()
-        tree = ET.ElementTree(ET.fromstring(bxx_content))
-        root = tree.getroot()
-
-        max_duration = max(
-            int(stream.findtext("VideoStreamElement/FileTrimOut", 0)) -
-            int(stream.findtext("VideoStreamElement/FileTrimIn", 0))
-            for stream in root.findall("VideoStream")
-        )
-        return {"duration": max_duration}
+        return bxx_cache.get(bxx_file_path, parse_bxx_file)
     except Exception as e:
         messagebox.showerror("Error", f"Failed to parse {bxx_file_path}: {e}")
         return None
@@ -70,28 +61,16 @@ def save_playlist():
 
     list_title = list_title_entry.get()
     four_digits = simpledialog.askstring("Input", "Enter 4 digits:")
-    if not (four_digits and len(four_digits) == 4 and four_digits.isdigit()):
+    if not is_valid_code(four_digits):
         messagebox.showerror("Error", "Invalid input. Enter 4 digits.")
         return
 
-    filename = f"{list_title}_{four_digits}.plx"
-    playlist_path = os.path.join(default_save_dir, filename)
-
-    playlist = ET.Element("PlayList")
-    meta_info = {
-        "DayModified": "2460640",
-        "ListDuration": format_duration(
-            sum(extract_bxx_info(os.path.join(directory_path, listbox_right.get(i)))["duration"] for i in range(listbox_right.size()) if extract_bxx_info),
-            fps=25
-        ),
-        "ApplicationName": "V-BOX MCR",
-    }
-    for tag, text in meta_info.items():
-        ET.SubElement(playlist, tag).text = text
+    playlist_path = os.path.join(default_save_dir, playlist_filename(list_title, four_digits))
+    playlist.refresh(lambda file_name: extract_bxx_info(os.path.join(directory_path, file_name)))
+    update_total_duration_display()
 
     try:
-        with open(playlist_path, "w", encoding="utf-8") as f:
-            f.write(parseString(ET.tostring(playlist)).toprettyxml())
+        write_playlist(playlist_path, playlist, directory_path)
         messagebox.showinfo("Success", f"Playlist saved: {playlist_path}")
     except Exception as e:
         messagebox.showerror("Error", f"Failed to save playlist: {e}")
@@ -117,26 +96,14 @@ def set_save_directory():
 def save_settings():
     """Save default directories to a configuration file."""
     try:
-        with open("config.txt", "w") as f:
-            f.write(f"load_dir:{default_load_dir}\n")
-            f.write(f"save_dir:{default_save_dir}\n")
+        settings.save_settings(default_load_dir, default_save_dir)
     except Exception as e:
         messagebox.showerror("Error", f"Failed to save settings: {e}")
 
 def load_settings():
     """Load default directories from a configuration file."""
     global default_load_dir, default_save_dir
-    try:
-        with open("config.txt", "r") as f:
-            for line in f:
-                key, value = line.strip().split(":", 1)
-                if key == "load_dir":
-                    default_load_dir = value
-                elif key == "save_dir":
-                    default_save_dir = value
-    except FileNotFoundError:
-        default_load_dir = ""
-        default_save_dir = ""
+    default_load_dir, default_save_dir = settings.load_settings()
 
 
 # --- Event Handlers ---
@@ -145,6 +112,7 @@ def add_file():
     try:
         selected = listbox_left.curselection()[0]
         file = listbox_left.get(selected)
+        playlist.append(file, extract_bxx_info(os.path.join(directory_path, file)))
         listbox_right.insert(tk.END, file)
         listbox_left.delete(selected)
         update_total_duration_display()
@@ -156,6 +124,7 @@ def remove_file():
     try:
         selected = listbox_right.curselection()[0]
         file = listbox_right.get(selected)
+        playlist.pop(selected)
         listbox_left.insert(tk.END, file)
         listbox_right.delete(selected)
         update_total_duration_display()
@@ -164,13 +133,9 @@ def remove_file():
 
 def on_keypress(event):
     """Handle alphanumeric search in left listbox."""
-    global search_timer
     typed_str.append(event.char.lower())
     search_str = "".join(typed_str)
-    if search_timer:
-        search_timer.cancel()
-    search_timer = threading.Timer(1.0, typed_str.clear)
-    search_timer.start()
+    scheduler.debounce(1000, typed_str.clear)
     for i in range(listbox_left.size()):
         if listbox_left.get(i).lower().startswith(search_str):
             listbox_left.selection_clear(0, tk.END)
@@ -181,14 +146,11 @@ def on_keypress(event):
 
 def update_total_duration_display():
     """Update total duration label for the right listbox."""
-    total_frames = sum(
-        extract_bxx_info(os.path.join(directory_path, listbox_right.get(i)))["duration"]
-        for i in range(listbox_right.size()) if extract_bxx_info
-    )
-    total_duration_label.config(text=format_duration(total_frames, fps=25))
+    total_duration_label.config(text=format_duration(playlist.total_frames))
 
 # --- GUI Setup ---
 root = tk.Tk()
+scheduler = RefreshScheduler(root)
 root.title("BXX Playlist Creator")
 root.geometry("800x600")
 
@@ -219,7 +181,9 @@ menubar.add_cascade(label="File", menu=filemenu)
 root.config(menu=menubar)
 
 load_settings()
+bxx_cache.load()
 if default_load_dir:
     load_directory()
 
 root.mainloop()
+bxx_cache.save()